@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/3.2/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -43,6 +44,7 @@ ALLOWED_HOSTS: list[str] = []
 PROJECT_APPS = [
     "cobra.user.apps.UserConfig",
     "cobra.project.apps.ProjectConfig",
+    "cobra.outbox.apps.OutboxConfig",
 ]
 
 INSTALLED_APPS = [
@@ -95,6 +97,10 @@ TEMPLATES = [
 ]
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# The batched deliveries send the queued emails over a single backend connection
+# once this many emails are queued, or this many seconds after the first one.
+EMAIL_BATCH_SIZE: int = 100
+EMAIL_BATCH_MAX_DELAY: float = 5.0
 
 WSGI_APPLICATION = "cobra.cobra.wsgi.application"
 
@@ -108,6 +114,19 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "project_access": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "project-access",
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -148,6 +167,17 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_ENABLE_UTC = True
 CELERY_TIMEZONE = "UTC"
 
+# Outbox
+# The relay moves this many messages from the outbox to the broker at once,
+# and waits this many seconds between the batches once the outbox is drained.
+OUTBOX_RELAY_BATCH_SIZE: int = 100
+OUTBOX_RELAY_INTERVAL: float = 1.0
+# The failed messages are retried with an exponential backoff,
+# until they are given up on as dead after this many attempts.
+OUTBOX_RETRY_DELAY: timedelta = timedelta(seconds=10)
+OUTBOX_MAX_RETRY_DELAY: timedelta = timedelta(hours=1)
+OUTBOX_MAX_ATTEMPTS: int = 20
+
 # Django Rest Framework
 # https://www.django-rest-framework.org/
 
@@ -156,6 +186,8 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
+    "DEFAULT_PAGINATION_CLASS": "cobra.utils.pagination.ModifiedCursorPagination",
+    "PAGE_SIZE": 50,
 }
 
 # JWT
@@ -186,6 +218,54 @@ DJOSER = {
 PROJECT_INVITATION_URL: str = BASE_FRONTEND_URL + "/invitation/{id}/"
 PROJECT_INVITATION_LIFETIME: timedelta = timedelta(days=1)
 
+# The maximal number of issues created or updated with a single bulk request
+PROJECT_ISSUES_BULK_MAX_ITEMS: int = 500
+
+# The maximal number of users invited with a single bulk request
+PROJECT_INVITATIONS_BULK_MAX_ITEMS: int = 500
+
+# The number of rows fetched at once by the project exports
+PROJECT_EXPORT_CHUNK_SIZE: int = 2000
+
+# The text search configuration of the full-text search (Postgres only),
+# the search indexes are migrated with it, so a change needs a new migration.
+PROJECT_SEARCH_CONFIG: str = "english"
+# The default and the maximal number of the search results
+PROJECT_SEARCH_DEFAULT_RESULTS: int = 20
+PROJECT_SEARCH_MAX_RESULTS: int = 100
+
+# The maximal depth of the issue trees, which also guards against the parent cycles
+PROJECT_ISSUE_TREE_MAX_DEPTH: int = 32
+
+# The default and the maximal number of days of the daily logged time reports
+PROJECT_DAILY_TIME_DEFAULT_DAYS: int = 30
+PROJECT_DAILY_TIME_MAX_DAYS: int = 366
+
+# The lifetime of the deletion tombstones, i.e. how far back the delta sync goes
+PROJECT_TOMBSTONE_LIFETIME: timedelta = timedelta(days=30)
+# The delta sync sends at most this many changes of each kind at once, and the next
+# sync starts this long before the request, so that the rows saved before it,
+# but committed later, are sent again rather than missed.
+PROJECT_CHANGES_LIMIT: int = 500
+PROJECT_CHANGES_OVERLAP: timedelta = timedelta(minutes=1)
+
+# Project access cache
+PROJECT_ACCESS_CACHE_ALIAS: str = "project_access"
+PROJECT_ACCESS_CACHE_TIMEOUT: int = 60 * 5
+# Above this number of visible projects the visibility filters switch
+# from an inline list of primary keys to correlated EXISTS subqueries.
+PROJECT_ACCESS_MAX_INLINE_PKS: int = 500
+
+# The endpoint latency budgets are only asserted in the tests on demand,
+# the wall-clock timings are not reliable on the shared CI runners.
+ENDPOINT_BUDGET_CHECK_LATENCY: bool = (
+    os.environ.get("ENDPOINT_BUDGET_CHECK_LATENCY", "0") == "1"
+)
+# The multiplier of the endpoint latency budgets asserted in the tests
+ENDPOINT_BUDGET_LATENCY_SCALE: float = float(
+    os.environ.get("ENDPOINT_BUDGET_LATENCY_SCALE", 1)
+)
+
 # django-cors-headers
 # https://github.com/adamchainz/django-cors-headers
 CORS_ALLOWED_ORIGINS = [
@@ -0,0 +1,13 @@
+from django.contrib import admin
+
+from cobra.outbox.models import OutboxMessage
+
+
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("task", "created", "available", "attempts", "dead")
+    list_filter = ("task", "dead")
+    ordering = ("available", "id")
+    readonly_fields = ("task", "kwargs", "created", "attempts", "last_error")
+
+
+admin.site.register(OutboxMessage, OutboxMessageAdmin)
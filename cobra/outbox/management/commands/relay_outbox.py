@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from cobra.outbox.relay import relay_outbox_messages
+
+
+class Command(BaseCommand):
+    help = "Relay the outbox messages to the broker, until it is interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.OUTBOX_RELAY_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--interval", type=float, default=settings.OUTBOX_RELAY_INTERVAL
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Relay a single batch and exit."
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            result = relay_outbox_messages(options["batch_size"])
+            if result.sent or result.failed or result.dead:
+                self.stdout.write(
+                    f"{result.sent} messages have been relayed, {result.failed} failed, "
+                    f"{result.dead} dead."
+                )
+            if options["once"]:
+                return
+            # A full batch means that more messages may be waiting already.
+            if result.sent + result.failed + result.dead < options["batch_size"]:
+                time.sleep(options["interval"])
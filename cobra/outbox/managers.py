@@ -0,0 +1,16 @@
+from typing import Any, TypeVar
+
+from celery import Task
+from django.db import models
+
+ModelType = TypeVar("ModelType", bound=models.Model)
+
+
+class OutboxMessageManager(models.Manager[ModelType]):
+    def enqueue(self, task: Task, kwargs: dict[str, Any]) -> ModelType:
+        """
+        Write the task call to the outbox instead of sending it to the broker.
+        It is part of the surrounding transaction, so the task is only ever
+        relayed once the rows it refers to have been committed.
+        """
+        return self.create(task=task.name, kwargs=kwargs)
@@ -0,0 +1,30 @@
+# Generated by Django 4.0 on 2026-10-17 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("outbox", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="outboxmessage",
+            name="outbox_available_idx",
+        ),
+        migrations.AddField(
+            model_name="outboxmessage",
+            name="dead",
+            field=models.BooleanField(default=False, verbose_name="dead"),
+        ),
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                condition=models.Q(("dead", False)),
+                fields=["available", "id"],
+                name="outbox_available_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from cobra.outbox.managers import OutboxMessageManager
+
+
+class OutboxMessage(models.Model):
+    task = models.CharField(_("task"), max_length=255)
+    kwargs = models.JSONField(_("kwargs"), default=dict, encoder=DjangoJSONEncoder)
+    created = models.DateTimeField(_("created"), default=timezone.now)
+    available = models.DateTimeField(_("available"), default=timezone.now)
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    last_error = models.TextField(_("last error"), blank=True)
+    # The messages which cannot be relayed are kept for inspection.
+    dead = models.BooleanField(_("dead"), default=False)
+
+    objects = OutboxMessageManager()
+
+    class Meta:
+        indexes = [
+            # The relay picks the live messages which are due, oldest first.
+            models.Index(
+                fields=["available", "id"],
+                name="outbox_available_idx",
+                condition=models.Q(dead=False),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task}({self.kwargs})"
@@ -0,0 +1,72 @@
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from celery import current_app
+from celery.exceptions import NotRegistered
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from cobra.outbox.models import OutboxMessage
+
+logger = logging.getLogger("celery")
+
+
+@dataclass(frozen=True)
+class RelayResult:
+    sent: int = 0
+    failed: int = 0
+    dead: int = 0
+
+
+def get_retry_delay(attempts: int) -> timedelta:
+    # The exponent is capped, so that the delay cannot overflow before the cap.
+    delay: timedelta = min(
+        settings.OUTBOX_RETRY_DELAY * 2 ** min(attempts - 1, 20),
+        settings.OUTBOX_MAX_RETRY_DELAY,
+    )
+    return delay
+
+
+def relay_outbox_messages(batch_size: int) -> RelayResult:
+    """
+    Send a batch of the due outbox messages to the broker and delete them.
+    The rows are locked, so that the concurrent relays skip them, and the
+    messages failing to be sent are retried later with an exponential backoff.
+    The messages of unknown tasks, or failing too many times, are marked dead
+    and no longer relayed. A relay crashing before the commit sends the messages
+    again, so the tasks are delivered at least once.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        messages = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(dead=False, available__lte=now)
+            .order_by("available", "id")[:batch_size]
+        )
+        sent_pks = []
+        failed = []
+        for message in messages:
+            try:
+                current_app.tasks[message.task].apply_async(
+                    kwargs=message.kwargs, task_id=f"outbox-{message.pk}"
+                )
+            except Exception as error:
+                logger.exception("Failed to relay the outbox message %s", message.pk)
+                message.attempts += 1
+                message.last_error = repr(error)
+                message.dead = (
+                    isinstance(error, NotRegistered)
+                    or message.attempts >= settings.OUTBOX_MAX_ATTEMPTS
+                )
+                message.available = now + get_retry_delay(message.attempts)
+                failed.append(message)
+            else:
+                sent_pks.append(message.pk)
+        OutboxMessage.objects.filter(pk__in=sent_pks).delete()
+        OutboxMessage.objects.bulk_update(
+            failed, ["attempts", "last_error", "available", "dead"]
+        )
+    dead = sum(message.dead for message in failed)
+    return RelayResult(sent=len(sent_pks), failed=len(failed) - dead, dead=dead)
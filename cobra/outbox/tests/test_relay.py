@@ -0,0 +1,99 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.utils import timezone
+from freezegun import freeze_time
+
+from cobra.outbox.models import OutboxMessage
+from cobra.outbox.relay import RelayResult, get_retry_delay, relay_outbox_messages
+from cobra.user.factories import UserFactory
+from cobra.user.tasks import send_activation_email
+
+
+@mock.patch("cobra.user.tasks.send_activation_email.apply_async")
+class OutboxRelayTest(TestCase):
+    def setUp(self):
+        self.users = UserFactory.create_batch(3)
+        for user in self.users:
+            OutboxMessage.objects.enqueue(send_activation_email, {"user_pk": user.pk})
+
+    def test_messages_are_relayed_in_batches(self, mock_apply_async):
+        messages = list(OutboxMessage.objects.order_by("id"))
+        result = relay_outbox_messages(batch_size=2)
+        self.assertEqual((result.sent, result.failed), (2, 0))
+        self.assertEqual(
+            mock_apply_async.call_args_list,
+            [
+                mock.call(kwargs={"user_pk": user.pk}, task_id=f"outbox-{message.pk}")
+                for user, message in zip(self.users[:2], messages)
+            ],
+        )
+        self.assertEqual(list(OutboxMessage.objects.all()), messages[2:])
+
+    def test_failed_messages_are_retried_later(self, mock_apply_async):
+        mock_apply_async.side_effect = [
+            ConnectionError("broker down"),
+            None,
+            None,
+            None,
+        ]
+        with freeze_time() as frozen_time:
+            result = relay_outbox_messages(batch_size=10)
+            self.assertEqual((result.sent, result.failed), (2, 1))
+            message = OutboxMessage.objects.get()
+            self.assertEqual(message.attempts, 1)
+            self.assertIn("broker down", message.last_error)
+            self.assertEqual(
+                message.available, timezone.now() + settings.OUTBOX_RETRY_DELAY
+            )
+            self.assertEqual(relay_outbox_messages(batch_size=10).sent, 0)
+
+            frozen_time.tick(settings.OUTBOX_RETRY_DELAY + timedelta(seconds=1))
+            self.assertEqual(relay_outbox_messages(batch_size=10).sent, 1)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_retry_delay_is_capped(self, mock_apply_async):
+        self.assertEqual(get_retry_delay(1), settings.OUTBOX_RETRY_DELAY)
+        self.assertEqual(get_retry_delay(10_000), settings.OUTBOX_MAX_RETRY_DELAY)
+
+    def test_messages_failing_too_many_times_are_dead(self, mock_apply_async):
+        mock_apply_async.side_effect = ConnectionError("broker down")
+        OutboxMessage.objects.update(attempts=settings.OUTBOX_MAX_ATTEMPTS - 1)
+        result = relay_outbox_messages(batch_size=10)
+        self.assertEqual((result.sent, result.failed, result.dead), (0, 0, 3))
+        self.assertEqual(OutboxMessage.objects.filter(dead=True).count(), 3)
+
+        with freeze_time(timezone.now() + settings.OUTBOX_MAX_RETRY_DELAY * 2):
+            self.assertEqual(relay_outbox_messages(batch_size=10), RelayResult())
+        self.assertEqual(mock_apply_async.call_count, 3)
+
+    def test_messages_of_unknown_tasks_are_dead(self, mock_apply_async):
+        OutboxMessage.objects.filter(pk=OutboxMessage.objects.earliest("id").pk).update(
+            task="cobra.unknown_task"
+        )
+        result = relay_outbox_messages(batch_size=10)
+        self.assertEqual((result.sent, result.failed, result.dead), (2, 0, 1))
+        message = OutboxMessage.objects.get()
+        self.assertTrue(message.dead)
+        self.assertIn("cobra.unknown_task", message.last_error)
+
+    def test_messages_of_rolled_back_transactions_are_discarded(self, mock_apply_async):
+        OutboxMessage.objects.all().delete()
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            OutboxMessage.objects.enqueue(
+                send_activation_email, {"user_pk": self.users[0].pk}
+            )
+            raise RuntimeError
+        self.assertEqual(relay_outbox_messages(batch_size=10).sent, 0)
+        mock_apply_async.assert_not_called()
+
+    def test_relay_outbox_command(self, mock_apply_async):
+        out = StringIO()
+        call_command("relay_outbox", "--once", stdout=out)
+        self.assertEqual(mock_apply_async.call_count, 3)
+        self.assertIn("3 messages have been relayed, 0 failed, 0 dead.", out.getvalue())
@@ -30,7 +30,28 @@ from cobra.project.models import (
     Task,
     UserStory,
 )
+from cobra.project.utils.counters import rebuild_issue_counters
 from cobra.project.utils.models import BUG, TASK, TASK_TYPES, USER_STORY
+from cobra.project.utils.search import (
+    SEARCH_TARGETS,
+    search_queryset,
+    supports_full_text_search,
+)
+
+
+class FullTextSearchAdminMixin:
+    """
+    Search the text fields of the search target with the full-text index
+    on Postgres. The other databases use the `search_fields`.
+    """
+
+    search_target: str
+
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and supports_full_text_search(queryset.db):
+            target = SEARCH_TARGETS[self.search_target]
+            return search_queryset(queryset, target, search_term), False
+        return super().get_search_results(request, queryset, search_term)
 
 
 class CustomUserListFilter(admin.SimpleListFilter):
@@ -88,7 +109,7 @@ class ProjectMembershipAdmin(admin.ModelAdmin):
     add_form = ProjectMembershipAdminForm
     list_display = ("id", "user_full_name", "project", "role")
     list_filter = ("project", "role", "modified", "created", CustomUserListFilter)
-    search_fields = ("project", "user")
+    search_fields = ("project__title", "user__username")
     raw_id_fields = ("project", "user")
     date_hierarchy = "created"
     ordering = ("-modified", "created")
@@ -113,8 +134,9 @@ class ProjectMembershipAdmin(admin.ModelAdmin):
         return obj.user.get_full_name()
 
 
-class EpicAdmin(admin.ModelAdmin):
+class EpicAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     form = EpicAdminForm
+    search_target = "epic"
     list_display = (
         "id",
         "title",
@@ -122,7 +144,7 @@ class EpicAdmin(admin.ModelAdmin):
         "project",
     )
     list_filter = ("modified", "created", CustomUserListFilter, ProjectListFilter)
-    search_fields = ("project", "creator", "title", "description")
+    search_fields = ("title", "description", "project__title", "creator__username")
     raw_id_fields = ("project", "creator")
     date_hierarchy = "created"
     ordering = ("-modified", "created")
@@ -155,8 +177,9 @@ class AssigneeListFilter(CustomUserListFilter):
     parameter_name = "assignee"
 
 
-class IssueAdmin(admin.ModelAdmin):
+class IssueAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
     form: Type[forms.ModelForm] = IssueAdminForm
+    search_target = "issue"
     list_display = (
         "id",
         "title",
@@ -171,7 +194,13 @@ class IssueAdmin(admin.ModelAdmin):
         AssigneeListFilter,
         ProjectListFilter,
     )
-    search_fields = ("title", "creator", "assignee", "project")
+    search_fields = (
+        "title",
+        "description",
+        "project__title",
+        "creator__username",
+        "assignee__username",
+    )
     date_hierarchy = "created"
     ordering = ("-modified", "created")
     readonly_fields = ("created", "modified")
@@ -273,7 +302,7 @@ class ProjectAdmin(admin.ModelAdmin):
     add_form = ProjectAdminForm
     list_display = ("id", "title", "slug", "creator_full_name")
     list_filter = ("title", "created", "modified", CreatorListFilter)
-    search_fields = ("title", "creator")
+    search_fields = ("title", "creator__username")
     prepopulated_fields = {"slug": ("title",)}
     raw_id_fields = ("creator",)
     date_hierarchy = "created"
@@ -296,11 +325,27 @@ class ProjectAdmin(admin.ModelAdmin):
     )
 
     inlines = (ProjectMembershipInline,)
+    actions = ["rebuild_issue_counters"]
 
     @admin.display(description=_("Creator"), ordering="creator")
     def creator_full_name(self, obj):
         return obj.creator.get_full_name()
 
+    @admin.action(description=_("Rebuild the issue counters of the selected projects"))
+    def rebuild_issue_counters(self, request: HttpRequest, queryset: QuerySet):
+        project_pks = list(queryset.values_list("pk", flat=True))
+        rebuild_issue_counters(project_pks=project_pks)
+        self.message_user(
+            request,
+            ngettext(
+                "The issue counters of %d project have been rebuilt.",
+                "The issue counters of %d projects have been rebuilt.",
+                len(project_pks),
+            )
+            % len(project_pks),
+            messages.SUCCESS,
+        )
+
 
 class ProjectInvitationAdmin(admin.ModelAdmin):
     form = ProjectInvitationAdminForm
@@ -312,7 +357,7 @@ class ProjectInvitationAdmin(admin.ModelAdmin):
         "is_active",
     )
     list_filter = ("status", "created", "modified", CustomUserListFilter, "project")
-    search_fields = ("user", "project")
+    search_fields = ("user__username", "project__title")
     raw_id_fields = ("user", "project")
     date_hierarchy = "created"
     ordering = ("-modified", "created")
@@ -370,7 +415,7 @@ class LoggedTimeAdmin(admin.ModelAdmin):
         "time",
     )
     list_filter = ("created", "modified", CustomUserListFilter, "issue")
-    search_fields = ("user", "issue")
+    search_fields = ("user__username", "issue__title")
     raw_id_fields = ("user", "issue")
     date_hierarchy = "created"
     ordering = ("-modified", "created")
@@ -396,14 +441,15 @@ class LoggedTimeAdmin(admin.ModelAdmin):
         return obj.user.get_full_name()
 
 
-class TaskCommentAdmin(admin.ModelAdmin):
+class TaskCommentAdmin(FullTextSearchAdminMixin, admin.ModelAdmin):
+    search_target = "comment"
     list_display = (
         "id",
         "user_full_name",
         "issue",
     )
     list_filter = ("created", "modified", CustomUserListFilter, "issue")
-    search_fields = ("user", "issue", "content")
+    search_fields = ("content", "user__username", "issue__title")
     raw_id_fields = ("user", "issue")
     date_hierarchy = "created"
     ordering = ("-modified", "created")
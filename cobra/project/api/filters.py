@@ -9,6 +9,8 @@ from cobra.project.models import (
     ProjectInvitation,
     ProjectMembership,
 )
+from cobra.project.utils.access import get_project_access_index
+from cobra.project.utils.search import SEARCH_TARGETS, search_queryset
 
 
 class IsProjectMemberOrCreatorFilterBackend(filters.BaseFilterBackend):
@@ -17,16 +19,13 @@ class IsProjectMemberOrCreatorFilterBackend(filters.BaseFilterBackend):
     """
 
     def filter_queryset(self, request, queryset, view):
-        queryset: QuerySet[Project] = queryset.prefetch_related(
-            "members"
-        ).select_related("creator")
+        queryset: QuerySet[Project] = queryset.select_related("creator")
         user = request.user
         if not user.is_staff and user.is_authenticated:
-            user_pk = user.pk
             queryset = queryset.filter(
-                Q(creator__pk=user_pk) | Q(members__pk__in=[user_pk])
+                get_project_access_index(request).get_visibility_filter("pk")
             )
-        return queryset.distinct()
+        return queryset
 
 
 class IsInviterOrInvitedUserFilterBackend(filters.BaseFilterBackend):
@@ -41,7 +40,7 @@ class IsInviterOrInvitedUserFilterBackend(filters.BaseFilterBackend):
         user = request.user
         if not user.is_staff and user.is_authenticated:
             queryset = queryset.filter(Q(user__pk=user.pk) | Q(inviter__pk=user.pk))
-        return queryset.distinct()
+        return queryset
 
 
 class HasAssociatedProjectMembershipFilterBackend(filters.BaseFilterBackend):
@@ -55,11 +54,10 @@ class HasAssociatedProjectMembershipFilterBackend(filters.BaseFilterBackend):
         )
         user = request.user
         if not user.is_staff and user.is_authenticated:
-            user_projects = ProjectMembership.objects.filter(
-                user__pk=user.pk
-            ).values_list("project", flat=True)
-            return queryset.filter(project__pk__in=user_projects)
-        return queryset.distinct()
+            return queryset.filter(
+                project__pk__in=get_project_access_index(request).member_project_pks
+            )
+        return queryset
 
 
 class IsIssueProjectMemberOrCreatorFilterBackend(filters.BaseFilterBackend):
@@ -73,11 +71,10 @@ class IsIssueProjectMemberOrCreatorFilterBackend(filters.BaseFilterBackend):
         )
         user = request.user
         if not user.is_staff and user.is_authenticated:
-            user_projects = Project.objects.filter(
-                Q(members__pk__in=[user.pk]) | Q(creator__pk=user.pk)
+            queryset = queryset.filter(
+                get_project_access_index(request).get_visibility_filter("project_id")
             )
-            queryset = queryset.filter(project__pk__in=user_projects)
-        return queryset.distinct()
+        return queryset
 
 
 class IsEpicProjectMemberOrCreatorFilterBackend(filters.BaseFilterBackend):
@@ -89,20 +86,50 @@ class IsEpicProjectMemberOrCreatorFilterBackend(filters.BaseFilterBackend):
         queryset: QuerySet[Epic] = queryset.select_related("project", "creator")
         user = request.user
         if not user.is_staff and user.is_authenticated:
-            user_projects = Project.objects.filter(
-                Q(members__pk__in=[user.pk]) | Q(creator__pk=user.pk)
+            queryset = queryset.filter(
+                get_project_access_index(request).get_visibility_filter("project_id")
             )
-            queryset = queryset.filter(project__pk__in=user_projects)
-        return queryset.distinct()
+        return queryset
+
+
+class IndexedOrderingFilter(filters.OrderingFilter):
+    """
+    Ordering restricted to the indexed `ordering_fields` of the view. The id is
+    appended in the direction of the first field, so that the ties are broken
+    the same way as in the (modified, id) indexes and the cursor pages stay stable.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view))
+        if ordering and not {"id", "-id"} & set(ordering):
+            ordering.append("-id" if ordering[0].startswith("-") else "id")
+        return ordering
 
 
 class IssueFilter(django_filters.rest_framework.FilterSet):
+    q = django_filters.CharFilter(method="filter_search", label="Search")
+    modified = django_filters.IsoDateTimeFromToRangeFilter()
+
     class Meta:
         model = Issue
-        fields = ("type", "project", "epic")
+        fields = (
+            "type",
+            "status",
+            "project",
+            "epic",
+            "assignee",
+            "creator",
+            "parent",
+            "modified",
+        )
+
+    def filter_search(self, queryset: QuerySet[Issue], name: str, value: str):
+        return search_queryset(queryset, SEARCH_TARGETS["issue"], value)
 
 
 class EpicFilter(django_filters.rest_framework.FilterSet):
+    modified = django_filters.IsoDateTimeFromToRangeFilter()
+
     class Meta:
         model = Epic
-        fields = ("project",)
+        fields = ("project", "creator", "modified")
@@ -1,3 +1,5 @@
+from typing import Any, Sequence
+
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.permissions import SAFE_METHODS, IsAdminUser, IsAuthenticated
@@ -11,7 +13,7 @@ from cobra.project.models import (
     ProjectInvitation,
     ProjectMembership,
 )
-from cobra.project.utils.models import MAINTAINER
+from cobra.project.utils.access import get_project_access_index
 
 
 class CustomIsAdminUser(IsAdminUser):
@@ -26,8 +28,33 @@ class CustomIsAdminUser(IsAdminUser):
 
         return self.has_permission(request, view)
 
+    def has_object_permissions_bulk(
+        self, request: Request, view: APIView, objs: Sequence[Any]
+    ) -> list[bool]:
+        return [self.has_permission(request, view)] * len(objs)
+
+
+class ProjectAccessPermission(IsAuthenticated):
+    """
+    The base of the permissions answered from the request's project access index.
+    """
+
+    def has_object_permissions_bulk(
+        self, request: Request, view: APIView, objs: Sequence[Any]
+    ) -> list[bool]:
+        """
+        Evaluate the object permission for every object of a page. All the objects
+        are checked against the same access index, so the page costs at most one query.
+
+        :param request: Request
+        :param view: APIView
+        :param objs: Sequence[Any]
+        :return: list[bool]
+        """
+        return [self.has_object_permission(request, view, obj) for obj in objs]
+
 
-class IsProjectCreator(IsAuthenticated):
+class IsProjectCreator(ProjectAccessPermission):
     message = _(
         "Access to the information of the project is granted only to the creators."
     )
@@ -44,10 +71,10 @@ class IsProjectCreator(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return obj.creator == request.user
+        return bool(obj.creator_id == request.user.pk)
 
 
-class IsProjectMembershipProjectCreator(IsAuthenticated):
+class IsProjectMembershipProjectCreator(ProjectAccessPermission):
     message = _(
         "Access to the information of the project memberships is granted only to the creators."
     )
@@ -64,10 +91,10 @@ class IsProjectMembershipProjectCreator(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return obj.project.creator == request.user
+        return bool(get_project_access_index(request).is_creator(obj.project_id))
 
 
-class IsEpicProjectCreator(IsAuthenticated):
+class IsEpicProjectCreator(ProjectAccessPermission):
     message = _(
         "Access to the information of the epic  is granted only to the creators of the project epic belongs to."
     )
@@ -82,10 +109,10 @@ class IsEpicProjectCreator(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return bool(obj.project.creator == request.user)
+        return bool(get_project_access_index(request).is_creator(obj.project_id))
 
 
-class IsIssueProjectCreator(IsAuthenticated):
+class IsIssueProjectCreator(ProjectAccessPermission):
     message = _(
         "Access to the information of the issue  is granted only to the creators of the project issue belongs to."
     )
@@ -102,10 +129,10 @@ class IsIssueProjectCreator(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return bool(obj.project.creator == request.user)
+        return bool(get_project_access_index(request).is_creator(obj.project_id))
 
 
-class IsProjectMember(IsAuthenticated):
+class IsProjectMember(ProjectAccessPermission):
     message = _(
         "Access to the information of the project is granted only to the members."
     )
@@ -122,10 +149,10 @@ class IsProjectMember(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return obj.members.all().filter(pk=request.user.pk).exists()
+        return bool(get_project_access_index(request).is_member(obj.pk))
 
 
-class IsEpicProjectMember(IsAuthenticated):
+class IsEpicProjectMember(ProjectAccessPermission):
     message = _(
         "Access to the information of the epic is granted only to the epic's project members."
     )
@@ -140,10 +167,10 @@ class IsEpicProjectMember(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return bool(obj.project.members.all().filter(pk=request.user.pk).exists())
+        return bool(get_project_access_index(request).is_member(obj.project_id))
 
 
-class IsIssueProjectMember(IsAuthenticated):
+class IsIssueProjectMember(ProjectAccessPermission):
     message = _(
         "Access to the information of the issue is granted only to the issue's project members."
     )
@@ -160,7 +187,7 @@ class IsIssueProjectMember(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return bool(obj.project.members.all().filter(pk=request.user.pk).exists())
+        return bool(get_project_access_index(request).is_member(obj.project_id))
 
 
 class IsProjectMemberAndReadOnly(IsProjectMember):
@@ -186,7 +213,7 @@ class IsProjectMemberAndReadOnly(IsProjectMember):
         )
 
 
-class IsProjectMaintainer(IsAuthenticated):
+class IsProjectMaintainer(ProjectAccessPermission):
     message = _(
         "Access to the information of the project is granted only to the maintainers."
     )
@@ -203,12 +230,10 @@ class IsProjectMaintainer(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return ProjectMembership.objects.filter(
-            user__pk=request.user.pk, project__pk=obj.pk, role=MAINTAINER
-        ).exists()
+        return bool(get_project_access_index(request).is_maintainer(obj.pk))
 
 
-class IsProjectMembershipUserMaintainer(IsAuthenticated):
+class IsProjectMembershipUserMaintainer(ProjectAccessPermission):
     message = _(
         "Access to the information of the project memberships is granted only to the project maintainers."
     )
@@ -225,12 +250,10 @@ class IsProjectMembershipUserMaintainer(IsAuthenticated):
         :param obj: Project
         :return: bool
         """
-        return ProjectMembership.objects.filter(
-            user__pk=request.user.pk, project__pk=obj.project.pk, role=MAINTAINER
-        ).exists()
+        return bool(get_project_access_index(request).is_maintainer(obj.project_id))
 
 
-class IsInvitedUser(IsAuthenticated):
+class IsInvitedUser(ProjectAccessPermission):
     message = _(
         "Access to the information of the invitation is granted only to the invited user."
     )
@@ -0,0 +1,132 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from typing import Any, Sequence
+
+from django.conf import settings
+from django.db.models import Model
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from cobra.project.api.serializers.comment import IssueCommentSerializer
+from cobra.project.api.serializers.epic import EpicSerializer
+from cobra.project.api.serializers.issue import IssueSerializer
+from cobra.project.api.serializers.logged_time import LoggedTimeSerializer
+from cobra.project.api.serializers.membership import ProjectMembershipSerializer
+from cobra.project.models import DeletionTombstone
+from cobra.project.utils.changes import CHANGE_SETS
+from cobra.utils.serializers import CustomValidationErrorsMixin
+
+
+class ProjectChangesCursorField(serializers.Field):
+    """
+    The opaque cursor continuing a delta sync, which carries its time range
+    and the positions of the change sets sent so far.
+    """
+
+    default_error_messages = {"invalid": _("Invalid cursor.")}
+
+    def to_internal_value(self, data: Any) -> dict[str, Any]:
+        try:
+            cursor = json.loads(urlsafe_b64decode(str(data).encode()))
+            since = parse_datetime(cursor["since"])
+            until = parse_datetime(cursor["until"])
+            positions = {
+                name: (parse_datetime(changed), pk)
+                for name, (changed, pk) in cursor["positions"].items()
+            }
+        except (BinasciiError, ValueError, TypeError, KeyError, AttributeError):
+            self.fail("invalid")
+        names = {change_set.name for change_set in CHANGE_SETS}
+        if (
+            since is None
+            or until is None
+            or not set(positions) <= names
+            or any(changed is None for changed, _ in positions.values())
+        ):
+            self.fail("invalid")
+        return {"since": since, "until": until, "positions": positions}
+
+    def to_representation(self, value: dict[str, Any]) -> str:
+        # The timestamps keep their microseconds, unlike with the DjangoJSONEncoder.
+        cursor = {
+            "since": value["since"].isoformat(),
+            "until": value["until"].isoformat(),
+            "positions": {
+                name: [changed.isoformat(), pk]
+                for name, (changed, pk) in value["positions"].items()
+            },
+        }
+        return urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
+
+class ProjectChangesParamsSerializer(
+    serializers.Serializer, CustomValidationErrorsMixin
+):
+    """
+    A delta sync starts with `since`, and continues with the `next` cursor
+    of the previous response until it is complete.
+    """
+
+    default_error_messages = {
+        "since_is_too_old": _(
+            "The changes are only kept for {days} days, fetch the project again."
+        ),
+        "since_is_required": _("Either since or cursor is required."),
+    }
+
+    since = serializers.DateTimeField(required=False)
+    cursor = ProjectChangesCursorField(required=False)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if "cursor" in attrs:
+            cursor: dict[str, Any] = attrs["cursor"]
+            return cursor
+        if "since" not in attrs:
+            self.fail_with_default_error("since_is_required")
+        lifetime = settings.PROJECT_TOMBSTONE_LIFETIME
+        if attrs["since"] < timezone.now() - lifetime:
+            raise serializers.ValidationError(
+                {
+                    "since_is_too_old": self.default_error_messages[
+                        "since_is_too_old"
+                    ].format(days=lifetime.days)
+                }
+            )
+        return attrs
+
+
+class DeletionTombstoneSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="object_id", read_only=True)
+
+    class Meta:
+        model = DeletionTombstone
+        fields = ["kind", "id", "deleted"]
+        read_only_fields = fields
+
+
+class ProjectChangesSerializer(serializers.BaseSerializer):
+    """
+    Represent the changes of a project by their kind. The clients apply
+    the `deleted` tombstones first, an issue moved away and back again
+    has both a tombstone and a newer modification.
+    """
+
+    serializer_classes: dict[str, type[serializers.BaseSerializer]] = {
+        "issues": IssueSerializer,
+        "epics": EpicSerializer,
+        "comments": IssueCommentSerializer,
+        "logged_time": LoggedTimeSerializer,
+        "memberships": ProjectMembershipSerializer,
+        "deleted": DeletionTombstoneSerializer,
+    }
+
+    def to_representation(self, changes: dict[str, Sequence[Model]]) -> dict[str, Any]:
+        return {
+            name: self.serializer_classes[name](
+                objects, many=True, context=self.context
+            ).data
+            for name, objects in changes.items()
+        }
@@ -12,6 +12,7 @@ from cobra.project.models import Epic, Project
 from cobra.project.utils.serializers import (
     COMMON_PROJECT_FIELDS,
     COMMON_USER_FIELDS,
+    IssueCountsField,
     ProjectSerializersMixin,
 )
 from cobra.user.models import CustomUser
@@ -53,6 +54,7 @@ class EpicSerializer(
         expandable_fields = {
             "creator": (CustomUserSerializer, {"fields": COMMON_USER_FIELDS}),
             "project": (ProjectSerializer, {"fields": COMMON_PROJECT_FIELDS}),
+            "issue_counts": IssueCountsField,
         }
 
     def run_validation(self, data: dict[str, Any]):
@@ -1,5 +1,7 @@
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
+from django.conf import settings
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from rest_flex_fields import FlexFieldsModelSerializer
 from rest_framework import serializers
@@ -93,3 +95,91 @@ class ProjectInvitationSerializer(
 
     def get_is_active(self, obj: ProjectInvitation):
         return not obj.is_expired
+
+
+class ProjectInvitationBulkSerializer(serializers.Serializer, ProjectSerializersMixin):
+    """
+    Invites many users to the context project at once. The users are resolved by
+    their emails with a single query, and the emails of the inactive or unknown
+    users, the members and the users already invited by the inviter are skipped
+    instead of failing the whole request. The inviter is checked by the permissions.
+    """
+
+    default_error_messages = {
+        "too_many_emails": _("Ensure this field has no more than {max_items} items."),
+    }
+
+    emails = serializers.ListField(child=serializers.EmailField(), allow_empty=False)
+
+    def validate_emails(self, emails: list[str]) -> list[str]:
+        max_items: int = settings.PROJECT_INVITATIONS_BULK_MAX_ITEMS
+        if len(emails) > max_items:
+            raise serializers.ValidationError(
+                self.error_messages["too_many_emails"].format(max_items=max_items)
+            )
+        return list(dict.fromkeys(emails))
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        project = cast(Project, self.context_project)
+        inviter = cast(CustomUser, self.context_user)
+        users: dict[str, CustomUser] = {
+            user.email: cast(CustomUser, user)
+            for user in CustomUser.objects.filter(
+                email__in=data["emails"], is_active=True
+            )
+            if user.has_usable_password()
+        }
+        user_pks = [user.pk for user in users.values()]
+        member_pks = set(
+            ProjectMembership.objects.filter(
+                project__pk=project.pk, user__pk__in=user_pks
+            ).values_list("user_id", flat=True)
+        )
+        invited_pks = set(
+            ProjectInvitation.objects.filter(
+                project__pk=project.pk,
+                inviter__pk=inviter.pk,
+                user__pk__in=user_pks,
+                status=PENDING,
+            ).values_list("user_id", flat=True)
+        )
+        invited: list[CustomUser] = []
+        skipped: list[dict[str, str]] = []
+        for email in data["emails"]:
+            user = users.get(email)
+            if user is None:
+                skipped.append({"email": email, "code": "user_does_not_exist"})
+            elif user.pk in member_pks:
+                skipped.append({"email": email, "code": "user_is_already_a_member"})
+            elif user.pk in invited_pks:
+                skipped.append(
+                    {"email": email, "code": "pending_invitation_already_exists"}
+                )
+            else:
+                invited.append(user)
+        return {
+            "project": project,
+            "inviter": inviter,
+            "users": invited,
+            "skipped": skipped,
+        }
+
+    def create(self, validated_data: dict[str, Any]) -> dict[str, Any]:
+        with transaction.atomic():
+            invitations = ProjectInvitation.objects.bulk_create(
+                ProjectInvitation(
+                    project=validated_data["project"],
+                    inviter=validated_data["inviter"],
+                    user=user,
+                )
+                for user in validated_data["users"]
+            )
+        return {"invited": invitations, "skipped": validated_data["skipped"]}
+
+    def to_representation(self, instance: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "invited": ProjectInvitationSerializer(
+                instance["invited"], many=True, context=self.context
+            ).data,
+            "skipped": instance["skipped"],
+        }
@@ -1,25 +1,33 @@
-from typing import Optional
+from typing import Any, Iterable, Optional, cast
 
-from django.db.models import Q
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_flex_fields import FlexFieldsModelSerializer
 from rest_framework import serializers
 
+from cobra.project.api.filters import IssueFilter
 from cobra.project.api.serializers.epic import EpicSerializer
 from cobra.project.api.serializers.project import (
     ProjectSerializer,
     ReadOnlyCreatedModifiedMeta,
 )
 from cobra.project.models import Bug, Epic, Issue, Project, Task, UserStory
-from cobra.project.utils.models import BUG, TASK
+from cobra.project.utils.counters import IssueCounterDeltas
+from cobra.project.utils.models import BUG, TASK, TASK_STATUSES
+from cobra.project.utils.rollups import move_issues_time
 from cobra.project.utils.serializers import (
     COMMON_PROJECT_FIELDS,
     COMMON_USER_FIELDS,
+    IssueRelations,
     ProjectSerializersMixin,
+    load_issue_relations,
 )
 from cobra.user.models import CustomUser
 from cobra.user.utils.serializers import CustomUserSerializer
-from cobra.utils.serializers import CustomValidationErrorsMixin
+from cobra.utils.serializers import CustomValidationErrorsMixin, RelatedIdField
 
 
 class IssueSerializer(
@@ -40,51 +48,24 @@ class IssueSerializer(
         ),
     }
 
+    related_fields: dict[str, type[models.Model]] = {
+        "project": Project,
+        "creator": CustomUser,
+        "assignee": CustomUser,
+        "epic": Epic,
+        "parent": Issue,
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        project_queryset = Project.objects.all()
-        if project_pk := getattr(self.context_project, "pk", None):
-            project_queryset = project_queryset.filter(pk=project_pk)
-        self.project_pk = project_pk
-
-        self.fields["project"] = serializers.PrimaryKeyRelatedField(
-            queryset=project_queryset
-        )
-
-        creator_queryset = CustomUser.objects.filter(is_active=True)
-        if creator_pk := getattr(self.context_user, "pk", None):
-            creator_queryset = creator_queryset.filter(pk=creator_pk)
-        self.creator_pk = creator_pk
-
-        self.fields["creator"] = serializers.PrimaryKeyRelatedField(
-            queryset=creator_queryset
-        )
-
-        assignee_queryset = CustomUser.objects.filter(is_active=True)
-        if creator_pk and project_pk:
-            assignee_queryset = assignee_queryset.filter(
-                Q(pk=creator_pk) | Q(project__pk__in=[project_pk])
-            ).distinct()
-
-        self.fields["assignee"] = serializers.PrimaryKeyRelatedField(
-            queryset=assignee_queryset, required=False
-        )
-
-        parent_queryset = Issue.objects.all()
-        if project_pk:
-            parent_queryset = parent_queryset.filter(project__pk=project_pk)
-
-        self.fields["parent"] = serializers.PrimaryKeyRelatedField(
-            queryset=parent_queryset, required=False
-        )
-
-        epic_queryset = Epic.objects.all()
-        if project_pk:
-            epic_queryset = epic_queryset.filter(project__pk=project_pk)
-
-        self.fields["epic"] = serializers.PrimaryKeyRelatedField(
-            queryset=epic_queryset, required=False
-        )
+        self.project_pk = getattr(self.context_project, "pk", None)
+        self.creator_pk = getattr(self.context_user, "pk", None)
+        for name, model in self.related_fields.items():
+            self.fields[name] = RelatedIdField(
+                model,
+                source=f"{name}_id",
+                required=name in ("project", "creator"),
+            )
 
     class Meta(ReadOnlyCreatedModifiedMeta):
         model = Issue
@@ -102,29 +83,91 @@ class IssueSerializer(
             data.setdefault("creator", self.creator_pk)
             data.setdefault("project", self.project_pk)
         validated_data = super().run_validation(data)
-        creator: Optional[CustomUser] = validated_data.get("creator")
-        project: Optional[Project] = validated_data.get("project")
-        assignee: Optional[CustomUser] = validated_data.get("assignee")
-        epic: Optional[Epic] = validated_data.get("epic")
-        parent: Optional[Issue] = validated_data.get("parent")
+        self.validate_relations(validated_data)
+        return validated_data
+
+    def validate_relations(self, validated_data: dict[str, Any]) -> None:
+        """
+        Check the related objects with a single batched lookup. The relations
+        missing in the (partial) input are taken from the updated instance.
+        The lookup is skipped when the relations are preloaded
+        in the `issue_relations` context.
+        """
+        changed = {
+            name for name in self.related_fields if f"{name}_id" in validated_data
+        }
+        if not changed:
+            return
+        pks: dict[str, Any] = {
+            name: validated_data.get(
+                f"{name}_id", getattr(self.instance, f"{name}_id", None)
+            )
+            for name in self.related_fields
+        }
+        relations: Optional[IssueRelations] = self.context.get("issue_relations")
+        if relations is None:
+            relations = load_issue_relations(
+                project_pk=pks["project"],
+                user_pks={pks["creator"], pks["assignee"]},
+                epic_pks={pks["epic"]},
+                parent_pks={pks["parent"]},
+            )
+        assignable = relations.members | {self.creator_pk}
+        exists = {
+            "project": pks["project"] in relations.projects
+            and self.project_pk in (None, pks["project"]),
+            "creator": pks["creator"] in relations.users
+            and self.creator_pk in (None, pks["creator"]),
+            "assignee": pks["assignee"] in relations.users
+            and (
+                not (self.creator_pk and self.project_pk)
+                or pks["assignee"] in assignable
+            ),
+            "epic": pks["epic"] in relations.epics
+            and self.project_pk in (None, relations.epics[pks["epic"]]),
+            "parent": pks["parent"] in relations.issues
+            and self.project_pk in (None, relations.issues[pks["parent"]]),
+        }
+        errors = {
+            name: [
+                cast(RelatedIdField, self.fields[name]).get_does_not_exist_error(
+                    pks[name]
+                )
+            ]
+            for name in self.related_fields
+            if name in changed and pks[name] is not None and not exists[name]
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        project_pk = pks["project"]
+        if project_pk is None:
+            return
         if (
-            project
-            and creator
-            and creator not in project.members.all()
-            and creator != project.creator
+            changed & {"project", "creator"}
+            and pks["creator"]
+            and pks["creator"] not in relations.members
+            and pks["creator"] != relations.projects[project_pk]
         ):
             self.fail_with_default_error("creator_is_not_a_member_or_project_creator")
         if (
-            project
-            and assignee
-            and not (project.members.all().filter(pk=assignee.pk).exists())
+            changed & {"project", "assignee"}
+            and pks["assignee"]
+            and pks["assignee"] not in relations.members
         ):
             self.fail_with_default_error("assignee_is_not_project_member")
-        if project and epic and epic.project != project:
+        if (
+            changed & {"project", "epic"}
+            and pks["epic"]
+            and relations.epics[pks["epic"]] != project_pk
+        ):
             self.fail_with_default_error("epic_has_wrong_project")
-        if parent and parent.project != project:
+        if (
+            changed & {"project", "parent"}
+            and pks["parent"]
+            and relations.issues[pks["parent"]] != project_pk
+        ):
             self.fail_with_default_error("parent_has_wrong_project")
-        return validated_data
 
 
 class TaskSerializer(IssueSerializer):
@@ -152,3 +195,173 @@ class UserStorySerializer(IssueSerializer):
 
     class Meta(IssueSerializer.Meta):
         model = UserStory
+
+
+class IssueBulkSerializer(serializers.Serializer, ProjectSerializersMixin):
+    """
+    Creates and updates the issues of the context project in bulk. The items with
+    an `id` partially update the issue, the others create a new one. The items are
+    validated with the `IssueSerializer` rules against the relations loaded once
+    for the whole batch, and written in one transaction only when all of them are valid.
+    """
+
+    default_error_messages = {
+        "too_many_issues": _("Ensure this field has no more than {max_items} items."),
+        "duplicated_issue": _("The issue is updated more than once."),
+    }
+
+    issues = serializers.ListField(child=serializers.DictField(), allow_empty=False)
+
+    @staticmethod
+    def to_pk(model: type[models.Model], value: Any) -> Any:
+        try:
+            return cast(models.Field, model._meta.pk).to_python(value)
+        except (TypeError, ValueError, DjangoValidationError):
+            return None
+
+    def get_pks(
+        self, items: Iterable[dict[str, Any]], name: str, model: type[models.Model]
+    ) -> set[Any]:
+        pks = {self.to_pk(model, item.get(name)) for item in items}
+        pks.discard(None)
+        return pks
+
+    def validate_issues(self, items: list[dict[str, Any]]):
+        max_items: int = settings.PROJECT_ISSUES_BULK_MAX_ITEMS
+        if len(items) > max_items:
+            raise serializers.ValidationError(
+                self.error_messages["too_many_issues"].format(max_items=max_items)
+            )
+        project = cast(Project, self.context_project)
+        instances: dict[Any, Issue] = Issue.objects.filter(
+            project__pk=project.pk
+        ).in_bulk(self.get_pks(items, "id", Issue))
+        relations = load_issue_relations(
+            project_pk=project.pk,
+            user_pks={
+                getattr(self.context_user, "pk", None),
+                *self.get_pks(items, "creator", CustomUser),
+                *self.get_pks(items, "assignee", CustomUser),
+                *(instance.creator_id for instance in instances.values()),
+                *(instance.assignee_id for instance in instances.values()),
+            },
+            epic_pks={
+                *self.get_pks(items, "epic", Epic),
+                *(instance.epic_id for instance in instances.values()),
+            },
+            parent_pks={
+                *self.get_pks(items, "parent", Issue),
+                *(instance.parent_id for instance in instances.values()),
+            },
+        )
+        context = {**self.context, "issue_relations": relations}
+        id_field = RelatedIdField(Issue)
+        validated: list[tuple[Optional[Issue], dict[str, Any]]] = []
+        errors: list[dict[str, Any]] = []
+        updated_pks: set[Any] = set()
+        for item in items:
+            data = dict(item)
+            instance: Optional[Issue] = None
+            if "id" in data:
+                pk = data.pop("id")
+                instance = instances.get(self.to_pk(Issue, pk))
+                if instance is None:
+                    errors.append({"id": [id_field.get_does_not_exist_error(pk)]})
+                    continue
+                if instance.pk in updated_pks:
+                    errors.append({"id": [self.error_messages["duplicated_issue"]]})
+                    continue
+                updated_pks.add(instance.pk)
+            serializer = IssueSerializer(
+                instance, data=data, partial=instance is not None, context=context
+            )
+            if serializer.is_valid():
+                errors.append({})
+                validated.append((instance, serializer.validated_data))
+            else:
+                errors.append(serializer.errors)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return validated
+
+    def create(self, validated_data: dict[str, Any]) -> dict[str, list[Issue]]:
+        created: list[Issue] = []
+        updated: list[Issue] = []
+        fields: set[str] = set()
+        now = timezone.now()
+        for instance, data in validated_data["issues"]:
+            if instance is None:
+                created.append(Issue(**data))
+                continue
+            for attr, value in data.items():
+                setattr(instance, attr, value)
+            instance.modified = now
+            fields.update(data)
+            updated.append(instance)
+        with transaction.atomic():
+            created = Issue.objects.bulk_create(created)
+            if updated:
+                Issue.objects.bulk_update(updated, [*fields, "modified"])
+            # The bulk operations bypass the signals maintaining the aggregates.
+            counter_deltas = IssueCounterDeltas()
+            for instance in created:
+                counter_deltas.add_issue(instance, 1)
+            for instance in updated:
+                counter_deltas.add_changed_issue(instance)
+            counter_deltas.apply()
+            if "epic_id" in fields:
+                move_issues_time(updated)
+        return {"created": created, "updated": updated}
+
+    def to_representation(self, instance: dict[str, list[Issue]]) -> dict[str, Any]:
+        return {
+            key: IssueSerializer(issues, many=True, context=self.context).data
+            for key, issues in instance.items()
+        }
+
+
+class IssueTransitionSerializer(serializers.Serializer, ProjectSerializersMixin):
+    """
+    Moves the issues of the context project matching the optional `ids`
+    and `IssueFilter` parameters to the given status with a single UPDATE.
+    """
+
+    status = serializers.ChoiceField(choices=TASK_STATUSES)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, allow_empty=False
+    )
+    filter = serializers.DictField(required=False)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        queryset = Issue.objects.filter(
+            project__pk=cast(Project, self.context_project).pk
+        )
+        if "ids" in attrs:
+            queryset = queryset.filter(pk__in=attrs["ids"])
+        filterset = IssueFilter(data=attrs.get("filter", {}), queryset=queryset)
+        if not filterset.is_valid():
+            raise serializers.ValidationError({"filter": filterset.errors})
+        attrs["queryset"] = filterset.qs.exclude(status=attrs["status"])
+        return attrs
+
+    def create(self, validated_data: dict[str, Any]) -> dict[str, Any]:
+        new_status = validated_data["status"]
+        with transaction.atomic():
+            issues = list(
+                validated_data["queryset"]
+                .select_for_update()
+                .values_list("pk", "project_id", "epic_id", "status", "type")
+            )
+            pks = [pk for pk, *_ in issues]
+            Issue.objects.filter(pk__in=pks).update(
+                status=new_status, modified=timezone.now()
+            )
+            counter_deltas = IssueCounterDeltas()
+            for _pk, project_id, epic_id, status, type_ in issues:
+                counter_deltas.add(project_id, epic_id, status, type_, -1)
+                counter_deltas.add(project_id, epic_id, new_status, type_, 1)
+            counter_deltas.apply()
+        return {"status": new_status, "issues": pks}
+
+    def to_representation(self, instance: dict[str, Any]) -> dict[str, Any]:
+        return instance
@@ -4,9 +4,15 @@ from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
 from rest_flex_fields import FlexFieldsModelSerializer
 from rest_framework import serializers
+from rest_framework.request import Request
 
 from cobra.project.models import Project, ProjectMembership
-from cobra.project.utils.serializers import COMMON_USER_FIELDS, ProjectSerializersMixin
+from cobra.project.utils.access import get_project_access_index
+from cobra.project.utils.serializers import (
+    COMMON_USER_FIELDS,
+    IssueCountsField,
+    ProjectSerializersMixin,
+)
 from cobra.user.utils.serializers import CustomUserSerializer
 from cobra.utils.models import get_object_or_none
 from cobra.utils.serializers import CustomValidationErrorsMixin
@@ -41,6 +47,7 @@ class ProjectSerializer(
                 CustomUserSerializer,
                 {"many": False, "fields": COMMON_USER_FIELDS},
             ),
+            "issue_counts": IssueCountsField,
         }
 
     is_creator = serializers.SerializerMethodField()
@@ -54,11 +61,20 @@ class ProjectSerializer(
         return super().create(validated_data)
 
     def get_is_creator(self, obj: Project) -> bool:
-        return bool(obj.creator == self.context_user)
+        if hasattr(obj, "user_is_creator"):
+            return bool(getattr(obj, "user_is_creator"))
+        return obj.creator_id == getattr(self.context_user, "pk", None)
 
     def get_membership_role(self, obj: Project) -> str:
+        if hasattr(obj, "user_membership_role"):
+            return str(getattr(obj, "user_membership_role"))
+        request: Optional[Request] = self.context.get("request", None)
+        if request is not None:
+            return str(get_project_access_index(request).get_role(obj.pk))
         context_user_membership = get_object_or_none(
-            ProjectMembership, user__pk=self.context_user.pk, project__pk=obj.pk
+            ProjectMembership,
+            user__pk=getattr(self.context_user, "pk", None),
+            project__pk=obj.pk,
         )
         return (
             context_user_membership.role if context_user_membership is not None else ""
@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.conf import settings
+from rest_framework import serializers
+
+from cobra.project.utils.search import SEARCH_TARGETS
+
+
+class SearchParamsSerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=200, trim_whitespace=True)
+    kind = serializers.MultipleChoiceField(choices=list(SEARCH_TARGETS), required=False)
+    project = serializers.IntegerField(min_value=1, required=False)
+    limit = serializers.IntegerField(min_value=1, required=False)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        kinds = attrs.get("kind") or SEARCH_TARGETS
+        attrs["kind"] = [kind for kind in SEARCH_TARGETS if kind in kinds]
+        attrs["limit"] = min(
+            attrs.get("limit", settings.PROJECT_SEARCH_DEFAULT_RESULTS),
+            settings.PROJECT_SEARCH_MAX_RESULTS,
+        )
+        return attrs
+
+
+class SearchResultSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=list(SEARCH_TARGETS), read_only=True)
+    id = serializers.IntegerField(read_only=True)
+    project = serializers.IntegerField(read_only=True)
+    issue = serializers.IntegerField(read_only=True, allow_null=True)
+    title = serializers.CharField(read_only=True)
+    rank = serializers.FloatField(read_only=True)
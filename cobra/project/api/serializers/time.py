@@ -0,0 +1,60 @@
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from cobra.project.models import UserDailyTimeRollup
+from cobra.utils.serializers import CustomValidationErrorsMixin
+
+TIME_FIELD_KWARGS: dict[str, Any] = {
+    "max_digits": 12,
+    "decimal_places": 2,
+    "read_only": True,
+}
+
+
+class TimeSummarySerializer(serializers.Serializer):
+    estimate = serializers.DecimalField(**TIME_FIELD_KWARGS)
+    logged_time = serializers.DecimalField(**TIME_FIELD_KWARGS)
+    remaining = serializers.DecimalField(**TIME_FIELD_KWARGS)
+    entries = serializers.IntegerField(read_only=True)
+
+
+class UserDailyTimeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserDailyTimeRollup
+        fields = ["user", "day", "logged_time", "entries"]
+        read_only_fields = fields
+
+
+class DailyTimeRangeSerializer(serializers.Serializer, CustomValidationErrorsMixin):
+    default_error_messages = {
+        "invalid_range": _("The start of the range must not be after its end."),
+        "range_too_long": _("The range must not be longer than {max_days} days."),
+    }
+
+    since = serializers.DateField(required=False)
+    until = serializers.DateField(required=False)
+    user = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        until = attrs.setdefault("until", timezone.localdate())
+        since = attrs.setdefault(
+            "since",
+            until - timedelta(days=settings.PROJECT_DAILY_TIME_DEFAULT_DAYS - 1),
+        )
+        if since > until:
+            self.fail_with_default_error("invalid_range")
+        max_days: int = settings.PROJECT_DAILY_TIME_MAX_DAYS
+        if (until - since).days >= max_days:
+            raise serializers.ValidationError(
+                {
+                    "range_too_long": self.default_error_messages[
+                        "range_too_long"
+                    ].format(max_days=max_days)
+                }
+            )
+        return attrs
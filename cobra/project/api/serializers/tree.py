@@ -0,0 +1,61 @@
+from typing import Any, Union
+
+from django.conf import settings
+from rest_framework import serializers
+
+from cobra.project.api.serializers.issue import IssueSerializer
+from cobra.project.api.serializers.time import TIME_FIELD_KWARGS
+from cobra.project.utils.tree import IssueTreeNode
+
+NESTED = "nested"
+FLAT = "flat"
+
+
+class IssueTreeParamsSerializer(serializers.Serializer):
+    layout = serializers.ChoiceField(choices=[NESTED, FLAT], default=NESTED)
+    max_depth = serializers.IntegerField(min_value=1, required=False)
+    rollup = serializers.BooleanField(default=False)
+
+    def validate_max_depth(self, max_depth: int) -> int:
+        return min(max_depth, settings.PROJECT_ISSUE_TREE_MAX_DEPTH)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        attrs.setdefault("max_depth", settings.PROJECT_ISSUE_TREE_MAX_DEPTH)
+        return attrs
+
+
+class IssueTreeSerializer(serializers.BaseSerializer):
+    """
+    Represent the issue tree either as the nested root issue with its `children`,
+    or as the flat list of the issues in the pre-order. Every issue gets its `depth`
+    and, optionally, the estimate and the logged time rolled up its subtree.
+    """
+
+    time_field = serializers.DecimalField(**TIME_FIELD_KWARGS)
+
+    def __init__(self, *args, layout: str = NESTED, rollup: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layout = layout
+        self.rollup = rollup
+
+    def to_representation(
+        self, root: IssueTreeNode
+    ) -> Union[dict[str, Any], list[dict[str, Any]]]:
+        nodes = list(root)
+        if self.rollup:
+            root.roll_up()
+        issues = IssueSerializer(
+            [node.issue for node in nodes], many=True, context=self.context
+        ).data
+        items: dict[int, dict[str, Any]] = {}
+        for node, item in zip(nodes, issues):
+            item["depth"] = node.depth
+            if self.rollup:
+                for attr in ("logged_time", "estimate_total", "logged_time_total"):
+                    item[attr] = self.time_field.to_representation(getattr(node, attr))
+            items[id(node)] = item
+        if self.layout == FLAT:
+            return list(items.values())
+        for node in nodes:
+            items[id(node)]["children"] = [items[id(child)] for child in node.children]
+        return items[id(root)]
@@ -1,11 +1,13 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from cobra.project.api.views.access import ProjectAccessCacheStatsView
 from cobra.project.api.views.epic import EpicListViewSet, EpicUpdateRetrieveViewSet
 from cobra.project.api.views.invitation import ProjectInvitationViewSet
 from cobra.project.api.views.issue import IssueListViewSet, IssueUpdateRetrieveViewSet
 from cobra.project.api.views.membership import ProjectMembershipViewSet
 from cobra.project.api.views.project import ProjectViewSet, RetrieveProjectApiView
+from cobra.project.api.views.search import SearchApiView
 
 router = DefaultRouter()
 
@@ -26,4 +28,10 @@ urlpatterns = [
         RetrieveProjectApiView.as_view(),
         name="project-by-username-slug",
     ),
+    path(
+        "access-cache/stats/",
+        ProjectAccessCacheStatsView.as_view(),
+        name="access-cache-stats",
+    ),
+    path("search/", SearchApiView.as_view(), name="search"),
 ] + router.urls
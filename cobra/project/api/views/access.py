@@ -0,0 +1,18 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from cobra.project.utils.access import project_access_cache
+
+
+class ProjectAccessCacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, *args, **kwargs):
+        """
+        Expose the hit/miss counters of the project access cache of the current process.
+        """
+        return Response(
+            data=project_access_cache.get_stats(), status=status.HTTP_200_OK
+        )
@@ -1,21 +1,41 @@
+from django.db.models import QuerySet, Sum
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework import status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from cobra.project.api.filters import (
     EpicFilter,
+    IndexedOrderingFilter,
     IsEpicProjectMemberOrCreatorFilterBackend,
 )
-from cobra.project.api.permissions import IsEpicProjectCreator, IsEpicProjectMember
+from cobra.project.api.permissions import (
+    CustomIsAdminUser,
+    IsEpicProjectCreator,
+    IsEpicProjectMember,
+)
 from cobra.project.api.serializers.epic import EpicSerializer
-from cobra.project.models import Epic
+from cobra.project.api.serializers.time import TimeSummarySerializer
+from cobra.project.models import Epic, EpicTimeRollup, Issue
+from cobra.project.utils.rollups import TimeSummary
+from cobra.project.utils.serializers import prefetch_issue_counters
+from cobra.utils.views import (
+    BulkObjectPermissionsMixin,
+    ConditionalListModelMixin,
+    ConditionalRetrieveModelMixin,
+    ConditionalUpdateModelMixin,
+    ListOmittedFieldsMixin,
+    MemoizedObjectMixin,
+)
 
 
 class EpicUpdateRetrieveViewSet(
+    MemoizedObjectMixin,
     GenericViewSet,
-    UpdateModelMixin,
-    RetrieveModelMixin,
+    ConditionalUpdateModelMixin,
+    ConditionalRetrieveModelMixin,
 ):
     lookup_field = "id"
     queryset = Epic.objects.all()
@@ -23,10 +43,52 @@ class EpicUpdateRetrieveViewSet(
     permission_classes = [IsEpicProjectMember | IsEpicProjectCreator]
     filter_backends = [IsEpicProjectMemberOrCreatorFilterBackend]
 
+    def get_queryset(self) -> QuerySet[Epic]:
+        queryset: QuerySet[Epic] = prefetch_issue_counters(
+            super().get_queryset(), self.request
+        )
+        return queryset
+
+    @action(
+        detail=True,
+        methods=["get"],
+        serializer_class=TimeSummarySerializer,
+    )
+    def time(self, *args, **kwargs):
+        epic: Epic = self.get_object()
+        estimate = Issue.objects.filter(epic__pk=epic.pk).aggregate(
+            estimate=Sum("estimate")
+        )["estimate"]
+        summary = TimeSummary.from_rollup(
+            estimate, EpicTimeRollup.objects.filter(epic_id=epic.pk).first()
+        )
+        serializer = self.get_serializer(summary)
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
 
-class EpicListViewSet(GenericViewSet, ListModelMixin):
+class EpicListViewSet(
+    BulkObjectPermissionsMixin,
+    ListOmittedFieldsMixin,
+    GenericViewSet,
+    ConditionalListModelMixin,
+):
     queryset = Epic.objects.all()
     serializer_class = EpicSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, IsEpicProjectMemberOrCreatorFilterBackend]
+    bulk_permission_classes = {
+        "list": [CustomIsAdminUser | IsEpicProjectMember | IsEpicProjectCreator]
+    }
+    filter_backends = [
+        DjangoFilterBackend,
+        IndexedOrderingFilter,
+        IsEpicProjectMemberOrCreatorFilterBackend,
+    ]
     filterset_class = EpicFilter
+    ordering_fields = ["modified", "id"]
+    ordering = ["-modified", "-id"]
+    list_omitted_fields = {"list": ["description"]}
+
+    def get_queryset(self) -> QuerySet[Epic]:
+        return self.defer_omitted_fields(
+            prefetch_issue_counters(super().get_queryset(), self.request)
+        )
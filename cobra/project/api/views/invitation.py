@@ -15,6 +15,7 @@ from cobra.project.api.filters import IsInviterOrInvitedUserFilterBackend
 from cobra.project.api.permissions import IsInvitedUser
 from cobra.project.api.serializers.invitation import ProjectInvitationSerializer
 from cobra.project.models import ProjectInvitation, ProjectMembership
+from cobra.project.utils.access import project_access_cache
 from cobra.project.utils.models import ACCEPTED, REJECTED
 
 
@@ -42,6 +43,7 @@ class ProjectInvitationViewSet(RetrieveModelMixin, GenericViewSet):
             )
             invitation.status = ACCEPTED
             invitation.save(update_fields=["status"])
+            project_access_cache.invalidate(invitation.user_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=True, methods=["post"], permission_classes=[IsInvitedUser])
@@ -1,29 +1,51 @@
+from django.db.models import QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_flex_fields.views import FlexFieldsMixin
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from cobra.project.api.filters import (
+    IndexedOrderingFilter,
     IsIssueProjectMemberOrCreatorFilterBackend,
     IssueFilter,
 )
-from cobra.project.api.permissions import IsIssueProjectCreator, IsIssueProjectMember
+from cobra.project.api.permissions import (
+    CustomIsAdminUser,
+    IsIssueProjectCreator,
+    IsIssueProjectMember,
+)
 from cobra.project.api.serializers.comment import IssueCommentSerializer
 from cobra.project.api.serializers.issue import IssueSerializer
 from cobra.project.api.serializers.logged_time import LoggedTimeSerializer
-from cobra.project.models import Issue
+from cobra.project.api.serializers.time import TimeSummarySerializer
+from cobra.project.api.serializers.tree import (
+    IssueTreeParamsSerializer,
+    IssueTreeSerializer,
+)
+from cobra.project.models import Issue, IssueTimeRollup
+from cobra.project.utils.rollups import TimeSummary
+from cobra.project.utils.tree import build_issue_tree, get_subtree
 from cobra.project.utils.types import HTTP_METHODS
+from cobra.utils.views import (
+    BulkObjectPermissionsMixin,
+    ConditionalListModelMixin,
+    ConditionalRetrieveModelMixin,
+    ConditionalUpdateModelMixin,
+    ListOmittedFieldsMixin,
+    MemoizedObjectMixin,
+)
 
 
 class IssueUpdateRetrieveViewSet(
+    MemoizedObjectMixin,
     FlexFieldsMixin,
+    BulkObjectPermissionsMixin,
     GenericViewSet,
-    UpdateModelMixin,
-    RetrieveModelMixin,
+    ConditionalUpdateModelMixin,
+    ConditionalRetrieveModelMixin,
 ):
     lookup_field = "id"
     queryset = Issue.objects.all()
@@ -32,10 +54,13 @@ class IssueUpdateRetrieveViewSet(
     filter_backends = [IsIssueProjectMemberOrCreatorFilterBackend]
 
     permit_list_expands = ["parent", "project", "creator", "assignee"]
+    bulk_permission_related_fields = ["parent"]
 
     LOGGED_TIME_METHODS: HTTP_METHODS = ["get", "post"]
     COMMENTS_METHODS = LOGGED_TIME_METHODS
     SUBISSUES_METHODS: HTTP_METHODS = ["get"]
+    TREE_METHODS: HTTP_METHODS = ["get"]
+    TIME_METHODS: HTTP_METHODS = ["get"]
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -59,7 +84,7 @@ class IssueUpdateRetrieveViewSet(
         if self.request.method == "GET":
             issue = self.get_object()
             serializer = self.get_serializer(
-                issue.project_loggedtime_related.all(), many=True
+                issue.project_loggedtime_related.order_by("created"), many=True
             )
             return Response(data=serializer.data, status=status.HTTP_200_OK)
         if self.request.method == "POST":
@@ -93,14 +118,71 @@ class IssueUpdateRetrieveViewSet(
         permission_classes=[IsIssueProjectMember],
     )
     def sub_issues(self, *args, **kwargs):
-        sub_issues = self.get_object().child_issues.all()
+        sub_issues = self.filter_objects_by_permissions(
+            self.get_object().child_issues.all()
+        )
         serializer = self.get_serializer(sub_issues, many=True)
         return Response(data=serializer.data, status=status.HTTP_200_OK)
 
+    @action(
+        detail=True,
+        methods=TREE_METHODS,
+        permission_classes=[IsIssueProjectMember],
+    )
+    def tree(self, *args, **kwargs):
+        params_serializer = IssueTreeParamsSerializer(data=self.request.query_params)
+        params_serializer.is_valid(raise_exception=True)
+        params = params_serializer.validated_data
+        issue: Issue = self.get_object()
+        subtree = get_subtree(Issue.objects.all(), issue.pk, params["max_depth"])
+        if params["rollup"]:
+            subtree = subtree.select_related("time_rollup")
+        root = build_issue_tree(self.filter_objects_by_permissions(subtree), issue.pk)
+        serializer = IssueTreeSerializer(
+            root,
+            layout=params["layout"],
+            rollup=params["rollup"],
+            context=self.get_serializer_context(),
+        )
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
 
-class IssueListViewSet(GenericViewSet, ListModelMixin):
+    @action(
+        detail=True,
+        methods=TIME_METHODS,
+        serializer_class=TimeSummarySerializer,
+        permission_classes=[IsIssueProjectMember | IsIssueProjectCreator],
+    )
+    def time(self, *args, **kwargs):
+        issue: Issue = self.get_object()
+        summary = TimeSummary.from_rollup(
+            issue.estimate, IssueTimeRollup.objects.filter(issue_id=issue.pk).first()
+        )
+        serializer = self.get_serializer(summary)
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+
+class IssueListViewSet(
+    BulkObjectPermissionsMixin,
+    ListOmittedFieldsMixin,
+    GenericViewSet,
+    ConditionalListModelMixin,
+):
     queryset = Issue.objects.all()
     serializer_class = IssueSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, IsIssueProjectMemberOrCreatorFilterBackend]
+    bulk_permission_classes = {
+        "list": [CustomIsAdminUser | IsIssueProjectMember | IsIssueProjectCreator]
+    }
+    bulk_permission_related_fields = ["parent"]
+    filter_backends = [
+        DjangoFilterBackend,
+        IndexedOrderingFilter,
+        IsIssueProjectMemberOrCreatorFilterBackend,
+    ]
     filterset_class = IssueFilter
+    ordering_fields = ["modified", "id"]
+    ordering = ["-modified", "-id"]
+    list_omitted_fields = {"list": ["description"]}
+
+    def get_queryset(self) -> QuerySet[Issue]:
+        return self.defer_omitted_fields(super().get_queryset())
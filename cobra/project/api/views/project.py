@@ -1,7 +1,13 @@
-from django.db.models import QuerySet
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet, Sum
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 from rest_flex_fields import FlexFieldsModelViewSet
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import GenericAPIView, get_object_or_404
 from rest_framework.mixins import RetrieveModelMixin
 from rest_framework.permissions import IsAuthenticated
@@ -10,28 +16,88 @@ from rest_framework.response import Response
 from cobra.project.api.filters import IsProjectMemberOrCreatorFilterBackend
 from cobra.project.api.permissions import (
     CustomIsAdminUser,
+    IsEpicProjectCreator,
+    IsEpicProjectMember,
+    IsIssueProjectCreator,
+    IsIssueProjectMember,
     IsProjectCreator,
     IsProjectMaintainer,
     IsProjectMember,
     IsProjectMemberAndReadOnly,
 )
+from cobra.project.api.serializers.changes import (
+    ProjectChangesCursorField,
+    ProjectChangesParamsSerializer,
+    ProjectChangesSerializer,
+)
 from cobra.project.api.serializers.epic import EpicSerializer
-from cobra.project.api.serializers.invitation import ProjectInvitationSerializer
-from cobra.project.api.serializers.issue import IssueSerializer
+from cobra.project.api.serializers.invitation import (
+    ProjectInvitationBulkSerializer,
+    ProjectInvitationSerializer,
+)
+from cobra.project.api.serializers.issue import (
+    IssueBulkSerializer,
+    IssueSerializer,
+    IssueTransitionSerializer,
+)
 from cobra.project.api.serializers.membership import ProjectMembershipSerializer
 from cobra.project.api.serializers.project import ProjectSerializer
+from cobra.project.api.serializers.time import (
+    DailyTimeRangeSerializer,
+    TimeSummarySerializer,
+    UserDailyTimeSerializer,
+)
 from cobra.project.models import (
     Epic,
     Issue,
     Project,
     ProjectInvitation,
     ProjectMembership,
+    ProjectTimeRollup,
+    UserDailyTimeRollup,
+)
+from cobra.project.querysets import ProjectQueryset
+from cobra.project.utils.changes import get_project_changes
+from cobra.project.utils.export import EXPORT_FORMATS, iter_project_export
+from cobra.project.utils.rollups import TimeSummary
+from cobra.project.utils.serializers import (
+    prefetch_issue_counters,
+    prefetch_project_members,
 )
 from cobra.user.utils.serializers import ActiveCustomUserEmailSerializer
+from cobra.utils.views import (
+    BulkObjectPermissionsMixin,
+    ConditionalListModelMixin,
+    ConditionalRetrieveModelMixin,
+    ConditionalUpdateModelMixin,
+    ListOmittedFieldsMixin,
+    MemoizedObjectMixin,
+)
 
 
-class ProjectViewSet(FlexFieldsModelViewSet):
-    permit_list_expands = ["creator", "members", "project", "user", "parent", "epic"]
+class ProjectViewSet(
+    MemoizedObjectMixin,
+    BulkObjectPermissionsMixin,
+    ListOmittedFieldsMixin,
+    ConditionalListModelMixin,
+    ConditionalRetrieveModelMixin,
+    ConditionalUpdateModelMixin,
+    FlexFieldsModelViewSet,
+):
+    permit_list_expands = [
+        "creator",
+        "members",
+        "project",
+        "user",
+        "parent",
+        "epic",
+        "issue_counts",
+    ]
+    bulk_permission_classes = {
+        "issues": [IsIssueProjectMember | IsIssueProjectCreator],
+        "epics": [IsEpicProjectMember | IsEpicProjectCreator],
+    }
+    list_omitted_fields = {"issues": ["description"], "epics": ["description"]}
     permission_classes = [IsAuthenticated]
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
@@ -53,6 +119,15 @@ class ProjectViewSet(FlexFieldsModelViewSet):
             self.permission_classes = [CustomIsAdminUser | IsProjectCreator]
         return super().get_permissions()
 
+    def get_queryset(self) -> QuerySet[Project]:
+        queryset: QuerySet[Project] = super().get_queryset()
+        if issubclass(self.get_serializer_class(), ProjectSerializer):
+            projects: ProjectQueryset[Project] = prefetch_issue_counters(
+                prefetch_project_members(queryset, self.request), self.request
+            )
+            queryset = projects.annotate_user_access(self.request.user.pk)
+        return queryset
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
@@ -86,8 +161,26 @@ class ProjectViewSet(FlexFieldsModelViewSet):
         data = {"user": getattr(user_serializer.validated_data.get("user"), "pk", None)}
         serializer: ProjectInvitationSerializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
-        instance: ProjectInvitation = serializer.save()
-        instance.send()
+        with transaction.atomic():
+            instance: ProjectInvitation = serializer.save()
+            instance.send()
+        return Response(data=serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="invitations/bulk",
+        permission_classes=[IsProjectCreator | IsProjectMaintainer],
+        serializer_class=ProjectInvitationBulkSerializer,
+    )
+    def invitations_bulk(self, *args, **kwargs):
+        serializer: ProjectInvitationBulkSerializer = self.get_serializer(
+            data=self.request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            instance = serializer.save()
+            ProjectInvitation.send_many(instance["invited"])
         return Response(data=serializer.data, status=status.HTTP_201_CREATED)
 
     @action(
@@ -103,10 +196,15 @@ class ProjectViewSet(FlexFieldsModelViewSet):
             serializer.save()
             return Response(data=serializer.data, status=status.HTTP_201_CREATED)
         elif self.request.method == "GET":
-            serializer: EpicSerializer = self.get_serializer(
-                Epic.objects.filter(project=self.get_object()), many=True
+            page = self.paginate_queryset(
+                self.defer_omitted_fields(
+                    prefetch_issue_counters(
+                        Epic.objects.filter(project=self.get_object()), self.request
+                    )
+                )
             )
-            return Response(data=serializer.data, status=status.HTTP_200_OK)
+            serializer: EpicSerializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
 
     @action(
         detail=True,
@@ -121,10 +219,139 @@ class ProjectViewSet(FlexFieldsModelViewSet):
             serializer.save()
             return Response(data=serializer.data, status=status.HTTP_201_CREATED)
         elif self.request.method == "GET":
-            serializer: IssueSerializer = self.get_serializer(
-                Issue.objects.filter(project=self.get_object()), many=True
+            page = self.paginate_queryset(
+                self.defer_omitted_fields(
+                    Issue.objects.filter(project=self.get_object())
+                )
             )
-            return Response(data=serializer.data, status=status.HTTP_200_OK)
+            serializer: IssueSerializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="issues/bulk",
+        permission_classes=[IsProjectMember | IsProjectCreator],
+        serializer_class=IssueBulkSerializer,
+    )
+    def issues_bulk(self, *args, **kwargs):
+        serializer: IssueBulkSerializer = self.get_serializer(data=self.request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="issues/transition",
+        permission_classes=[IsProjectMember | IsProjectCreator],
+        serializer_class=IssueTransitionSerializer,
+    )
+    def issues_transition(self, *args, **kwargs):
+        serializer: IssueTransitionSerializer = self.get_serializer(
+            data=self.request.data
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[CustomIsAdminUser | IsProjectCreator | IsProjectMember],
+    )
+    def export(self, *args, **kwargs):
+        output = self.request.query_params.get("output", "ndjson")
+        export_format = EXPORT_FORMATS.get(output)
+        if export_format is None:
+            raise ValidationError(
+                {
+                    "output": _("The supported outputs are: {}.").format(
+                        ", ".join(EXPORT_FORMATS)
+                    )
+                }
+            )
+        project: Project = self.get_object()
+        response = StreamingHttpResponse(
+            export_format.render(iter_project_export(project.pk)),
+            content_type=export_format.content_type,
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{project.slug}.{export_format.extension}"'
+        return response
+
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[CustomIsAdminUser | IsProjectCreator | IsProjectMember],
+        serializer_class=TimeSummarySerializer,
+    )
+    def time(self, *args, **kwargs):
+        project: Project = self.get_object()
+        estimate = Issue.objects.filter(project__pk=project.pk).aggregate(
+            estimate=Sum("estimate")
+        )["estimate"]
+        summary = TimeSummary.from_rollup(
+            estimate, ProjectTimeRollup.objects.filter(project_id=project.pk).first()
+        )
+        serializer = self.get_serializer(summary)
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="time/daily",
+        permission_classes=[CustomIsAdminUser | IsProjectCreator | IsProjectMember],
+        serializer_class=UserDailyTimeSerializer,
+    )
+    def time_daily(self, *args, **kwargs):
+        range_serializer = DailyTimeRangeSerializer(data=self.request.query_params)
+        range_serializer.is_valid(raise_exception=True)
+        time_range = range_serializer.validated_data
+        project: Project = self.get_object()
+        rollups = UserDailyTimeRollup.objects.filter(
+            project__pk=project.pk,
+            day__range=(time_range["since"], time_range["until"]),
+        ).order_by("day", "user_id")
+        if "user" in time_range:
+            rollups = rollups.filter(user__pk=time_range["user"])
+        serializer = self.get_serializer(rollups, many=True)
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[CustomIsAdminUser | IsProjectCreator | IsProjectMember],
+        serializer_class=ProjectChangesSerializer,
+    )
+    def changes(self, *args, **kwargs):
+        params_serializer = ProjectChangesParamsSerializer(
+            data=self.request.query_params
+        )
+        params_serializer.is_valid(raise_exception=True)
+        params = params_serializer.validated_data
+        since = params["since"]
+        project: Project = self.get_object()
+        # The next sync overlaps this one, the rows saved before the request,
+        # but committed after it, are sent again rather than missed.
+        until = params.get("until", timezone.now() - settings.PROJECT_CHANGES_OVERLAP)
+        changes = get_project_changes(project.pk, since, params.get("positions"))
+        serializer = self.get_serializer(changes.changes)
+        cursor = {"since": since, "until": until, "positions": changes.positions}
+        return Response(
+            data={
+                "since": since,
+                "until": until,
+                "next": (
+                    None
+                    if changes.complete
+                    else ProjectChangesCursorField().to_representation(cursor)
+                ),
+                **serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class RetrieveProjectApiView(GenericAPIView, RetrieveModelMixin):
@@ -135,6 +362,13 @@ class RetrieveProjectApiView(GenericAPIView, RetrieveModelMixin):
     serializer_class = ProjectSerializer
     filter_backends = [IsProjectMemberOrCreatorFilterBackend]
 
+    def get_queryset(self) -> QuerySet[Project]:
+        projects: ProjectQueryset[Project] = prefetch_issue_counters(
+            prefetch_project_members(super().get_queryset(), self.request),
+            self.request,
+        )
+        return projects.annotate_user_access(self.request.user.pk)
+
     def get_object(self) -> Project:
         queryset: QuerySet[Project] = self.filter_queryset(self.get_queryset())
         filter_kwargs = {
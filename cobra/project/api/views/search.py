@@ -0,0 +1,41 @@
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from cobra.project.api.serializers.search import (
+    SearchParamsSerializer,
+    SearchResultSerializer,
+)
+from cobra.project.utils.access import get_project_access_index
+from cobra.project.utils.search import SEARCH_TARGETS, search
+
+
+class SearchApiView(GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = SearchResultSerializer
+
+    def get(self, *args, **kwargs):
+        """
+        Search the issues, the epics and the comments of the projects visible
+        to the user, ranked by relevance.
+        """
+        params_serializer = SearchParamsSerializer(data=self.request.query_params)
+        params_serializer.is_valid(raise_exception=True)
+        params = params_serializer.validated_data
+        visibility = {}
+        if not self.request.user.is_staff:
+            index = get_project_access_index(self.request)
+            visibility = {
+                kind: index.get_visibility_filter(SEARCH_TARGETS[kind].project_lookup)
+                for kind in params["kind"]
+            }
+        results = search(
+            params["q"],
+            kinds=params["kind"],
+            limit=params["limit"],
+            visibility=visibility,
+            project_pk=params.get("project"),
+        )
+        serializer = self.get_serializer(results, many=True)
+        return Response(data={"results": serializer.data}, status=status.HTTP_200_OK)
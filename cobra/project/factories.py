@@ -3,7 +3,17 @@ from operator import itemgetter
 import factory.fuzzy
 from factory.django import DjangoModelFactory
 
-from cobra.project.models import ROLES, Project, ProjectMembership
+from cobra.project.models import (
+    ROLES,
+    Epic,
+    Issue,
+    IssueComment,
+    LoggedTime,
+    Project,
+    ProjectInvitation,
+    ProjectMembership,
+)
+from cobra.project.utils.models import TASK_STATUSES, TASK_TYPES
 from cobra.user.factories import UserFactory
 
 
@@ -33,3 +43,54 @@ class ProjectMembershipFactory(DjangoModelFactory):
     user = factory.SubFactory(UserFactory)
     project = factory.SubFactory(ProjectFactory)
     role = factory.fuzzy.FuzzyChoice(ROLES, getter=itemgetter(0))
+
+
+class ProjectInvitationFactory(DjangoModelFactory):
+    class Meta:
+        model = ProjectInvitation
+
+    user = factory.SubFactory(UserFactory)
+    project = factory.SubFactory(ProjectFactory)
+    inviter = factory.SelfAttribute("project.creator")
+
+
+class EpicFactory(DjangoModelFactory):
+    class Meta:
+        model = Epic
+
+    title = factory.Faker("sentence", nb_words=4)
+    description = factory.Faker("paragraph")
+    project = factory.SubFactory(ProjectFactory)
+    creator = factory.SelfAttribute("project.creator")
+
+
+class IssueFactory(DjangoModelFactory):
+    class Meta:
+        model = Issue
+
+    title = factory.Faker("sentence", nb_words=4)
+    description = factory.Faker("paragraph")
+    project = factory.SubFactory(ProjectFactory)
+    creator = factory.SelfAttribute("project.creator")
+    status = factory.fuzzy.FuzzyChoice(TASK_STATUSES, getter=itemgetter(0))
+    type = factory.fuzzy.FuzzyChoice(TASK_TYPES, getter=itemgetter(0))
+    estimate = factory.fuzzy.FuzzyDecimal(0.5, 40)
+
+
+class LoggedTimeFactory(DjangoModelFactory):
+    class Meta:
+        model = LoggedTime
+
+    issue = factory.SubFactory(IssueFactory)
+    user = factory.SelfAttribute("issue.creator")
+    time = factory.fuzzy.FuzzyDecimal(0.25, 8)
+    comment = factory.Faker("sentence", nb_words=6)
+
+
+class IssueCommentFactory(DjangoModelFactory):
+    class Meta:
+        model = IssueComment
+
+    issue = factory.SubFactory(IssueFactory)
+    user = factory.SelfAttribute("issue.creator")
+    content = factory.Faker("paragraph")
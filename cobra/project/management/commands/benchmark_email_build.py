@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from cobra.services.email.models import TemplateEmail
+from cobra.services.email.rendering import get_email_template
+from cobra.utils.benchmarks import measure
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the cost of building the project invitation emails, "
+        "with the compiled template cache cleared before every email and kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--emails", type=int, default=1000)
+        parser.add_argument("--runs", type=int, default=5)
+
+    def get_email(self, index: int) -> TemplateEmail:
+        return TemplateEmail(
+            subject="Invitation to join a project",
+            mail_from=settings.DEFAULT_FROM_EMAIL,
+            mail_to=f"benchmark_user_{index}@example.com",
+            template={
+                "path": "email/project_invitation.html",
+                "context": {
+                    "project": f"Benchmark project {index}",
+                    "invitation_url": f"https://example.com/invitation/{index}/",
+                },
+            },
+        )
+
+    def build_emails(self, count: int, cold: bool):
+        for index in range(count):
+            if cold:
+                get_email_template.cache_clear()
+            self.get_email(index).email
+
+    def handle(self, *args, **options):
+        emails, runs = options["emails"], options["runs"]
+        for name, cold in (("cold template", True), ("cached template", False)):
+            timing = measure(lambda: self.build_emails(emails, cold), runs)
+            per_email = timing.median / emails * 1_000_000
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(f"{timing} per_email={per_email:.1f}us")
@@ -0,0 +1,83 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import QuerySet
+
+from cobra.project.models import Issue, LoggedTime, ProjectInvitation, ProjectMembership
+from cobra.project.utils.benchmarks import (
+    ACCESS_PATTERN_INDEXES,
+    drop_indexes,
+    measure_queryset,
+    seed_benchmark_data,
+)
+from cobra.project.utils.models import BUG, MAINTAINER, NEW, PENDING
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the query plans and timings of the hot project queries with and "
+        "without the indexes tuned to them, on seeded data. The seeded data and "
+        "the dropped indexes are rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=2000)
+        parser.add_argument("--issues", type=int, default=100000)
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument("--members-per-project", type=int, default=5)
+        parser.add_argument("--user-projects", type=int, default=200)
+        parser.add_argument("--invitations-per-project", type=int, default=10)
+        parser.add_argument("--logged-time-per-issue", type=int, default=2)
+        parser.add_argument("--runs", type=int, default=10)
+
+    def get_querysets(self, user_pk, project_pk) -> dict[str, QuerySet]:
+        issue_pk = (
+            Issue.objects.filter(project__pk=project_pk)
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if issue_pk is None:
+            raise CommandError("The benchmarked project has no issues.")
+        return {
+            "maintainer check": ProjectMembership.objects.filter(
+                user__pk=user_pk, role=MAINTAINER, project__pk=project_pk
+            ).values("pk")[:1],
+            "issue board": Issue.objects.filter(
+                project__pk=project_pk, type=BUG, status=NEW
+            ).order_by("-modified", "-id")[:50],
+            "pending invitation check": ProjectInvitation.objects.filter(
+                user__pk=user_pk,
+                project__pk=project_pk,
+                inviter__pk=user_pk,
+                status=PENDING,
+            ).values("pk")[:1],
+            "issue logged time": LoggedTime.objects.filter(issue__pk=issue_pk).order_by(
+                "created"
+            ),
+        }
+
+    def report(self, querysets: dict[str, QuerySet], runs: int):
+        for name, queryset in querysets.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(queryset.explain())
+            timing = measure_queryset(queryset, runs)
+            self.stdout.write(f"rows={len(queryset.all())} {timing}")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write("Seeding the benchmark data...")
+            seeded = seed_benchmark_data(
+                projects=options["projects"],
+                issues=options["issues"],
+                users=options["users"],
+                members_per_project=options["members_per_project"],
+                user_projects=options["user_projects"],
+                invitations_per_project=options["invitations_per_project"],
+                logged_time_per_issue=options["logged_time_per_issue"],
+            )
+            querysets = self.get_querysets(seeded.user_pks[1], seeded.project_pks[0])
+            self.stdout.write(self.style.SUCCESS("With the tuned indexes"))
+            self.report(querysets, options["runs"])
+            drop_indexes(ACCESS_PATTERN_INDEXES)
+            self.stdout.write(self.style.SUCCESS("Without the tuned indexes"))
+            self.report(querysets, options["runs"])
+            transaction.set_rollback(True)
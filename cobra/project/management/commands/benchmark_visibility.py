@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from cobra.project.models import Issue, Project
+from cobra.project.utils.access import ProjectAccessIndex
+from cobra.project.utils.benchmarks import measure_queryset, seed_benchmark_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the query plans and timings of the issue visibility filters "
+        "on seeded data. The seeded data is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=5000)
+        parser.add_argument("--issues", type=int, default=100000)
+        parser.add_argument("--users", type=int, default=2000)
+        parser.add_argument("--members-per-project", type=int, default=5)
+        parser.add_argument(
+            "--user-projects",
+            type=int,
+            default=200,
+            help="The number of projects the benchmarked user is a member of.",
+        )
+        parser.add_argument("--runs", type=int, default=10)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write("Seeding the benchmark data...")
+            seeded = seed_benchmark_data(
+                projects=options["projects"],
+                issues=options["issues"],
+                users=options["users"],
+                members_per_project=options["members_per_project"],
+                user_projects=options["user_projects"],
+            )
+            user = seeded.user
+            index = ProjectAccessIndex(user)
+            base_queryset: QuerySet[Issue] = Issue.objects.select_related(
+                "project", "assignee", "creator"
+            )
+            querysets = {
+                "join + DISTINCT (legacy)": base_queryset.filter(
+                    project__pk__in=Project.objects.filter(
+                        Q(members__pk__in=[user.pk]) | Q(creator__pk=user.pk)
+                    )
+                ).distinct(),
+                "correlated EXISTS": base_queryset.filter(
+                    index.get_visibility_filter("project_id", max_inline_pks=0)
+                ),
+                "visible project ids": base_queryset.filter(
+                    index.get_visibility_filter(
+                        "project_id", max_inline_pks=len(index.visible_project_pks)
+                    )
+                ),
+            }
+            for name, queryset in querysets.items():
+                self.stdout.write(self.style.MIGRATE_HEADING(name))
+                self.stdout.write(queryset.explain())
+                rows = queryset.count()
+                timing = measure_queryset(queryset, options["runs"])
+                self.stdout.write(f"rows={rows} {timing}")
+            transaction.set_rollback(True)
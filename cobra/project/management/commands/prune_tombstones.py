@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from cobra.project.utils.changes import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = "Delete the deletion tombstones older than PROJECT_TOMBSTONE_LIFETIME."
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted} tombstones have been deleted.")
+        )
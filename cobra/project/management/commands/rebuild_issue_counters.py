@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from cobra.project.utils.counters import rebuild_issue_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-status and per-type issue counters of the projects and epics."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="projects",
+            help="Rebuild the counters of the project only. Can be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        rebuild_issue_counters(project_pks=options["projects"])
+        self.stdout.write(self.style.SUCCESS("The issue counters have been rebuilt."))
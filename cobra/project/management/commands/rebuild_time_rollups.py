@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from cobra.project.utils.rollups import rebuild_time_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the logged time rollups from the logged time entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="projects",
+            help="Rebuild the rollups of the project only. Can be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        rebuild_time_rollups(project_pks=options["projects"])
+        self.stdout.write(self.style.SUCCESS("The time rollups have been rebuilt."))
@@ -0,0 +1,40 @@
+# Generated by Django 4.0 on 2026-10-17 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="epic",
+            index=models.Index(fields=["-modified", "-id"], name="epic_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="epic",
+            index=models.Index(
+                fields=["project", "-modified", "-id"], name="epic_project_modified_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(fields=["-modified", "-id"], name="issue_modified_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "-modified", "-id"],
+                name="issue_project_modified_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["-modified", "-id"], name="project_modified_idx"
+            ),
+        ),
+    ]
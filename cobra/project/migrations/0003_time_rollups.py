@@ -0,0 +1,202 @@
+# Generated by Django 4.0 on 2026-10-17 15:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+def build_time_rollups(apps, schema_editor):
+    """
+    Roll the logged time up as of this migration, without the application code,
+    which may no longer match the historical models.
+    """
+    logged_time = apps.get_model("project", "LoggedTime").objects.all()
+    rows = {
+        "IssueTimeRollup": logged_time.values("issue_id"),
+        "EpicTimeRollup": logged_time.filter(issue__epic__isnull=False).values(
+            epic_id=F("issue__epic_id")
+        ),
+        "ProjectTimeRollup": logged_time.values(project_id=F("issue__project_id")),
+        "UserDailyTimeRollup": logged_time.annotate(
+            day=TruncDate("created", tzinfo=timezone.get_current_timezone())
+        ).values("user_id", "day", project_id=F("issue__project_id")),
+    }
+    for name, queryset in rows.items():
+        model = apps.get_model("project", name)
+        model.objects.bulk_create(
+            model(**row)
+            for row in queryset.annotate(
+                logged_time=Sum("time"), entries=Count("pk")
+            ).order_by()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0005_pagination_indexes"),
+        ("project", "0002_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EpicTimeRollup",
+            fields=[
+                (
+                    "logged_time",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="logged time",
+                    ),
+                ),
+                (
+                    "entries",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="logged time entries"
+                    ),
+                ),
+                (
+                    "epic",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="time_rollup",
+                        serialize=False,
+                        to="project.epic",
+                        verbose_name="epic",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="IssueTimeRollup",
+            fields=[
+                (
+                    "logged_time",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="logged time",
+                    ),
+                ),
+                (
+                    "entries",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="logged time entries"
+                    ),
+                ),
+                (
+                    "issue",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="time_rollup",
+                        serialize=False,
+                        to="project.issue",
+                        verbose_name="issue",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ProjectTimeRollup",
+            fields=[
+                (
+                    "logged_time",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="logged time",
+                    ),
+                ),
+                (
+                    "entries",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="logged time entries"
+                    ),
+                ),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="time_rollup",
+                        serialize=False,
+                        to="project.project",
+                        verbose_name="project",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="UserDailyTimeRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "logged_time",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="logged time",
+                    ),
+                ),
+                (
+                    "entries",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="logged time entries"
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="day")),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(app_label)s_%(class)s_related",
+                        related_query_name="%(app_label)s_%(class)s",
+                        to="project.project",
+                        verbose_name="project",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_time_rollups",
+                        to="user.customuser",
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="userdailytimerollup",
+            constraint=models.UniqueConstraint(
+                fields=("project", "day", "user"), name="user_daily_time_rollup_unique"
+            ),
+        ),
+        migrations.RunPython(build_time_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,146 @@
+# Generated by Django 4.0 on 2026-10-17 15:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_issue_counters(apps, schema_editor):
+    """
+    Count the issues as of this migration, without the application code,
+    which may no longer match the historical models.
+    """
+    issues = apps.get_model("project", "Issue").objects.all()
+    rows = {
+        "ProjectIssueCounter": issues.values("project_id", "status", "type"),
+        "EpicIssueCounter": issues.filter(epic__isnull=False).values(
+            "epic_id", "status", "type"
+        ),
+    }
+    for name, queryset in rows.items():
+        model = apps.get_model("project", name)
+        model.objects.bulk_create(
+            model(**row) for row in queryset.annotate(count=Count("pk")).order_by()
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0003_time_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectIssueCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("new", "New"),
+                            ("in-progress", "In progress"),
+                            ("closed", "Closed"),
+                            ("release-ready", "Release ready"),
+                        ],
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("task", "Task"),
+                            ("user-story", "User story"),
+                            ("bug", "Bug"),
+                        ],
+                        max_length=20,
+                        verbose_name="type",
+                    ),
+                ),
+                ("count", models.IntegerField(default=0, verbose_name="issues count")),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="issue_counters",
+                        to="project.project",
+                        verbose_name="project",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="EpicIssueCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("new", "New"),
+                            ("in-progress", "In progress"),
+                            ("closed", "Closed"),
+                            ("release-ready", "Release ready"),
+                        ],
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("task", "Task"),
+                            ("user-story", "User story"),
+                            ("bug", "Bug"),
+                        ],
+                        max_length=20,
+                        verbose_name="type",
+                    ),
+                ),
+                ("count", models.IntegerField(default=0, verbose_name="issues count")),
+                (
+                    "epic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="issue_counters",
+                        to="project.epic",
+                        verbose_name="epic",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="projectissuecounter",
+            constraint=models.UniqueConstraint(
+                fields=("project", "status", "type"),
+                name="project_issue_counter_unique",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="epicissuecounter",
+            constraint=models.UniqueConstraint(
+                fields=("epic", "status", "type"), name="epic_issue_counter_unique"
+            ),
+        ),
+        migrations.RunPython(build_issue_counters, migrations.RunPython.noop),
+    ]
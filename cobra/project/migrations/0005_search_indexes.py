@@ -0,0 +1,48 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# The search vectors as of this migration. A change of the searched fields
+# or of `PROJECT_SEARCH_CONFIG` needs a new migration rebuilding the indexes.
+SEARCH_INDEXES = {
+    "Issue": GinIndex(
+        SearchVector("title", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english"),
+        name="issue_search_idx",
+    ),
+    "Epic": GinIndex(
+        SearchVector("title", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english"),
+        name="epic_search_idx",
+    ),
+    "IssueComment": GinIndex(
+        SearchVector("content", weight="B", config="english"),
+        name="issuecomment_search_idx",
+    ),
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    """The GIN indexes are Postgres only, the other databases fall back to LIKE."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, index in SEARCH_INDEXES.items():
+        schema_editor.add_index(apps.get_model("project", model_name), index)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for model_name, index in SEARCH_INDEXES.items():
+        schema_editor.remove_index(apps.get_model("project", model_name), index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0004_issue_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.0 on 2026-10-17 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0005_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "type", "status", "-modified", "-id"],
+                name="issue_project_board_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="loggedtime",
+            index=models.Index(
+                fields=["issue", "created"], name="loggedtime_issue_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["user", "project", "inviter"],
+                name="invitation_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectmembership",
+            index=models.Index(
+                fields=["user", "role", "project"], name="membership_user_role_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.0 on 2026-10-17 16:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("project", "0006_access_pattern_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DeletionTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("issue", "Issue"),
+                            ("epic", "Epic"),
+                            ("comment", "Comment"),
+                            ("logged-time", "Logged time"),
+                            ("membership", "Membership"),
+                        ],
+                        max_length=20,
+                        verbose_name="kind",
+                    ),
+                ),
+                ("object_id", models.BigIntegerField(verbose_name="object id")),
+                (
+                    "deleted",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="deleted at"
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="tombstones",
+                        to="project.project",
+                        verbose_name="project",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="deletiontombstone",
+            index=models.Index(
+                fields=["project", "deleted"], name="tombstone_project_deleted_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.0 on 2026-10-17 17:38
+
+from django.db import migrations, models
+
+import cobra.utils.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0005_pagination_indexes"),
+        ("project", "0007_deletion_tombstones"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="issue",
+            name="assignee",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=cobra.utils.models.SET_NULL_AND_TOUCH,
+                related_name="assigned_issues",
+                to="user.customuser",
+                verbose_name="assignee",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="issue",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=cobra.utils.models.SET_NULL_AND_TOUCH,
+                related_name="child_issues",
+                to="project.issue",
+                verbose_name="parent issue",
+            ),
+        ),
+    ]
@@ -1,11 +1,12 @@
-from typing import Union
+from typing import Iterable, Union
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
+from cobra.outbox.models import OutboxMessage
 from cobra.project.managers import (
     BugManager,
     ProjectManager,
@@ -23,18 +24,21 @@ from cobra.project.utils.models import (
     TASK,
     TASK_STATUSES,
     TASK_TYPES,
+    TOMBSTONE_KINDS,
     RelatedToIssue,
     RelatedToProject,
 )
 from cobra.utils.models import (
+    SET_NULL_AND_TOUCH,
     TimeStampedAndCreatedByUser,
     TimeStampedAndRelatedToUser,
     TimeStampedModel,
+    TracksLoadedValuesModel,
     UUIDPrimaryKeyModel,
 )
 
 
-class Project(TimeStampedAndCreatedByUser):
+class Project(TimeStampedAndCreatedByUser, TracksLoadedValuesModel):
     title = models.CharField(_("title"), max_length=250)
     description = models.TextField(_("description"), blank=True)
     slug = models.SlugField(_("slug"), max_length=250, blank=True)
@@ -47,6 +51,9 @@ class Project(TimeStampedAndCreatedByUser):
                 fields=["slug", "creator"], name="slug_and_creator_unique_constraint"
             )
         ]
+        indexes = [
+            models.Index(fields=["-modified", "-id"], name="project_modified_idx"),
+        ]
 
     members = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
@@ -63,6 +70,13 @@ class Project(TimeStampedAndCreatedByUser):
             self.slug = slugify(str(self.title))
         return super().save(*args, **kwargs)
 
+    def delete(self, *args, **kwargs):
+        # The objects deleted in the cascade update the aggregates at once.
+        from cobra.project.utils.deletion import cascade_deletion
+
+        with cascade_deletion():
+            return super().delete(*args, **kwargs)
+
     def __repr__(self):
         return f"Project(creator='{self.creator.username}', slug='{self.slug}')"
 
@@ -91,6 +105,12 @@ class ProjectMembership(TimeStampedModel):
                 fields=["project", "user"], name="project_and_user_unique_constraint"
             )
         ]
+        indexes = [
+            # The role checks of the permissions, e.g. `IsProjectMaintainer`
+            models.Index(
+                fields=["user", "role", "project"], name="membership_user_role_idx"
+            ),
+        ]
 
     def __repr__(self):
         return f"ProjectMembership(project={self.project}, user={self.user})"
@@ -112,6 +132,16 @@ class ProjectInvitation(
         _("status"), max_length=20, choices=INVITATION_STATUSES, default=PENDING
     )
 
+    class Meta:
+        indexes = [
+            # The duplicates checks only look for the pending invitations.
+            models.Index(
+                fields=["user", "project", "inviter"],
+                condition=models.Q(status=PENDING),
+                name="invitation_pending_idx",
+            ),
+        ]
+
     @property
     def is_expired(self) -> bool:
         return timezone.now() > self.created + settings.PROJECT_INVITATION_LIFETIME
@@ -132,10 +162,28 @@ class ProjectInvitation(
         return settings.PROJECT_INVITATION_URL.format(id=self.id)
 
     def send(self):
+        """Enqueue the email through the outbox, as part of the current transaction."""
         from cobra.project.tasks import send_project_invitation_email
 
         if self.pk is not None:
-            send_project_invitation_email.apply_async(kwargs={"invitation_pk": self.pk})
+            OutboxMessage.objects.enqueue(
+                send_project_invitation_email, {"invitation_pk": self.pk}
+            )
+
+    @staticmethod
+    def send_many(invitations: Iterable["ProjectInvitation"]):
+        """Enqueue a single task delivering the emails of all the invitations."""
+        from cobra.project.tasks import send_project_invitation_emails
+
+        invitation_pks = [
+            str(invitation.pk)
+            for invitation in invitations
+            if invitation.pk is not None
+        ]
+        if invitation_pks:
+            OutboxMessage.objects.enqueue(
+                send_project_invitation_emails, {"invitation_pks": invitation_pks}
+            )
 
     def __repr__(self):
         return f"ProjectInvitation(inviter={self.inviter}, invited={self.user}, project={self.project}"
@@ -148,6 +196,22 @@ class Epic(TimeStampedAndCreatedByUser, RelatedToProject):
     title = models.CharField(_("title"), max_length=250)
     description = models.TextField(_("description"), blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-modified", "-id"], name="epic_modified_idx"),
+            models.Index(
+                fields=["project", "-modified", "-id"],
+                name="epic_project_modified_idx",
+            ),
+        ]
+
+    def delete(self, *args, **kwargs):
+        # The objects deleted in the cascade update the aggregates at once.
+        from cobra.project.utils.deletion import cascade_deletion
+
+        with cascade_deletion():
+            return super().delete(*args, **kwargs)
+
     def __repr__(self):
         return (
             f"Epic(title={self.title}, creator={self.creator}, project={self.project})"
@@ -157,10 +221,10 @@ class Epic(TimeStampedAndCreatedByUser, RelatedToProject):
         return f"Epic: '{self.title}' in {self.project}"
 
 
-class Issue(TimeStampedAndCreatedByUser, RelatedToProject):
+class Issue(TimeStampedAndCreatedByUser, RelatedToProject, TracksLoadedValuesModel):
     assignee = models.ForeignKey(
         settings.AUTH_USER_MODEL,
-        on_delete=models.SET_NULL,
+        on_delete=SET_NULL_AND_TOUCH,
         verbose_name=_("assignee"),
         related_name="assigned_issues",
         blank=True,
@@ -180,7 +244,7 @@ class Issue(TimeStampedAndCreatedByUser, RelatedToProject):
     )
     parent = models.ForeignKey(
         "self",
-        on_delete=models.SET_NULL,
+        on_delete=SET_NULL_AND_TOUCH,
         verbose_name=_("parent issue"),
         related_name="child_issues",
         blank=True,
@@ -195,12 +259,38 @@ class Issue(TimeStampedAndCreatedByUser, RelatedToProject):
         null=True,
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-modified", "-id"], name="issue_modified_idx"),
+            models.Index(
+                fields=["project", "-modified", "-id"],
+                name="issue_project_modified_idx",
+            ),
+            # The boards filter the project issues by the type and the status.
+            models.Index(
+                fields=["project", "type", "status", "-modified", "-id"],
+                name="issue_project_board_idx",
+            ),
+        ]
+
     def __repr__(self):
         return (
             f"Issue(title={self.title}, project={self.project}, creator={self.creator}, "
             f"assignee={self.assignee})"
         )
 
+    def save(self, *args, **kwargs):
+        # Moving the issue between epics or projects moves its time rollups as well.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        # The objects deleted in the cascade update the aggregates at once.
+        from cobra.project.utils.deletion import cascade_deletion
+
+        with cascade_deletion():
+            return super().delete(*args, **kwargs)
+
     def __str__(self):
         return f"Issue: '{self.title}' in {self.project}"
 
@@ -228,7 +318,7 @@ class UserStory(Issue):
         verbose_name_plural = _("User stories")
 
 
-class LoggedTime(TimeStampedAndRelatedToUser, RelatedToIssue):
+class LoggedTime(TimeStampedAndRelatedToUser, RelatedToIssue, TracksLoadedValuesModel):
     time = models.DecimalField(
         _("logged time"),
         help_text=_("spent time working on an issue"),
@@ -240,10 +330,20 @@ class LoggedTime(TimeStampedAndRelatedToUser, RelatedToIssue):
     class Meta:
         verbose_name = _("Logged time")
         verbose_name_plural = _("Logged time")
+        indexes = [
+            models.Index(
+                fields=["issue", "created"], name="loggedtime_issue_created_idx"
+            )
+        ]
 
     def __repr__(self):
         return f"LoggedTime(user{self.user}, issue={self.issue}, time={self.time}"
 
+    def save(self, *args, **kwargs):
+        # The time rollups are updated by the signals in the same transaction.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+
     def __str__(self):
         return f"User {self.user} logged {self.time} working on {self.issue}"
 
@@ -256,3 +356,156 @@ class IssueComment(TimeStampedAndRelatedToUser, RelatedToIssue):
 
     def __str__(self):
         return f"User {self.user} comments {self.issue}"
+
+
+class TimeRollup(models.Model):
+    logged_time = models.DecimalField(
+        _("logged time"), decimal_places=2, max_digits=12, default=0
+    )
+    entries = models.PositiveIntegerField(_("logged time entries"), default=0)
+
+    class Meta:
+        abstract = True
+
+
+class IssueTimeRollup(TimeRollup):
+    issue = models.OneToOneField(
+        Issue,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="time_rollup",
+        verbose_name=_("issue"),
+    )
+
+    def __str__(self):
+        return f"{self.logged_time} logged on {self.issue_id}"
+
+
+class EpicTimeRollup(TimeRollup):
+    epic = models.OneToOneField(
+        Epic,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="time_rollup",
+        verbose_name=_("epic"),
+    )
+
+    def __str__(self):
+        return f"{self.logged_time} logged on the epic {self.epic_id}"
+
+
+class ProjectTimeRollup(TimeRollup):
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="time_rollup",
+        verbose_name=_("project"),
+    )
+
+    def __str__(self):
+        return f"{self.logged_time} logged on the project {self.project_id}"
+
+
+class UserDailyTimeRollup(TimeRollup, RelatedToProject):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="daily_time_rollups",
+        verbose_name=_("user"),
+    )
+    day = models.DateField(_("day"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "day", "user"],
+                name="user_daily_time_rollup_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.logged_time} logged by {self.user_id} on {self.day}"
+
+
+class IssueCounter(models.Model):
+    status = models.CharField(_("status"), max_length=20, choices=TASK_STATUSES)
+    type = models.CharField(_("type"), max_length=20, choices=TASK_TYPES)
+    count = models.IntegerField(_("issues count"), default=0)
+
+    class Meta:
+        abstract = True
+
+
+class ProjectIssueCounter(IssueCounter):
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="issue_counters",
+        verbose_name=_("project"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "status", "type"],
+                name="project_issue_counter_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.count} {self.type} issues {self.status} in {self.project_id}"
+
+
+class EpicIssueCounter(IssueCounter):
+    epic = models.ForeignKey(
+        Epic,
+        on_delete=models.CASCADE,
+        related_name="issue_counters",
+        verbose_name=_("epic"),
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["epic", "status", "type"],
+                name="epic_issue_counter_unique",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.count} {self.type} issues {self.status} in the epic {self.epic_id}"
+        )
+
+
+class DeletionTombstone(models.Model):
+    """
+    Records a deleted (or moved away) project object for the delta sync.
+    The tombstones are created while the objects are being deleted, possibly
+    together with the project, so the project relation has no database constraint.
+    The tombstones of a deleted project are removed by a signal. The project
+    relation is covered by the composite index.
+    """
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="tombstones",
+        verbose_name=_("project"),
+    )
+    kind = models.CharField(_("kind"), max_length=20, choices=TOMBSTONE_KINDS)
+    object_id = models.BigIntegerField(_("object id"))
+    deleted = models.DateTimeField(_("deleted at"), default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["project", "deleted"], name="tombstone_project_deleted_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} deleted from {self.project_id}"
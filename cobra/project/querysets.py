@@ -1,6 +1,17 @@
-from typing import Any, Iterable, TypeVar
+from typing import Any, Iterable, TypeVar, cast
 
 from django.db import models
+from django.db.models import (
+    BooleanField,
+    ExpressionWrapper,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.fields.reverse_related import ManyToManyRel
+from django.db.models.functions import Coalesce
 from django.utils.text import slugify
 
 ModelType = TypeVar("ModelType", bound=models.Model)
@@ -22,3 +33,40 @@ class ProjectQueryset(models.QuerySet[ModelType]):
             if not getattr(obj, "slug", ""):
                 setattr(obj, "slug", slugify(str(getattr(obj, "title", ""))))
         return super().bulk_create(objects, batch_size, ignore_conflicts)
+
+    def prefetch_members(self, *fields: str) -> "ProjectQueryset[ModelType]":
+        """
+        Prefetch the project members loading only the given columns,
+        the primary keys by default.
+        """
+        members = cast(
+            type[models.Model], self.model._meta.get_field("members").related_model
+        )
+        return self.prefetch_related(
+            Prefetch(
+                "members",
+                queryset=members._default_manager.only(*(fields or ("pk",))),
+            )
+        )
+
+    def annotate_user_access(self, user_pk: Any) -> "ProjectQueryset[ModelType]":
+        """
+        Annotate the projects with `user_is_creator` and `user_membership_role`
+        of the given user, so they are computed in the same query.
+        """
+        members = cast(
+            ManyToManyRel, self.model._meta.get_field("members").remote_field
+        )
+        through = cast(type[models.Model], members.through)
+        memberships = through._default_manager.filter(
+            project__pk=OuterRef("pk"), user__pk=user_pk
+        )
+        queryset: ProjectQueryset[ModelType] = self.annotate(
+            user_is_creator=ExpressionWrapper(
+                Q(creator__pk=user_pk), output_field=BooleanField()
+            ),
+            user_membership_role=Coalesce(
+                Subquery(memberships.values("role")[:1]), Value("")
+            ),
+        )
+        return queryset
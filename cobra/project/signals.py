@@ -0,0 +1,185 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from cobra.project.models import (
+    Bug,
+    DeletionTombstone,
+    Epic,
+    Issue,
+    IssueComment,
+    LoggedTime,
+    Project,
+    ProjectMembership,
+    Task,
+    UserStory,
+)
+from cobra.project.utils.access import project_access_cache
+from cobra.project.utils.changes import add_tombstone, get_issue_project_id
+from cobra.project.utils.counters import IssueCounterDeltas
+from cobra.project.utils.deletion import get_cascade_deletion
+from cobra.project.utils.models import COMMENT, EPIC, ISSUE, LOGGED_TIME, MEMBERSHIP
+from cobra.project.utils.rollups import (
+    get_loaded_time_contribution,
+    logged_time_changed,
+    move_issue_time,
+)
+
+
+@receiver(post_save, sender=ProjectMembership)
+@receiver(post_delete, sender=ProjectMembership)
+def invalidate_membership_user_access(sender, instance: ProjectMembership, **kwargs):
+    project_access_cache.invalidate(instance.user_id)
+
+
+@receiver(post_save, sender=Project)
+def invalidate_project_creator_access(
+    sender, instance: Project, created: bool, **kwargs
+):
+    """The previous creator is read from the values the project was loaded with."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "creator" not in update_fields:
+        return
+    previous_creator_id = instance.get_loaded_value("creator_id")
+    if created or previous_creator_id != instance.creator_id:
+        project_access_cache.invalidate(instance.creator_id, previous_creator_id)
+    instance.remember_loaded_values()
+
+
+@receiver(post_delete, sender=Project)
+def invalidate_deleted_project_creator_access(sender, instance: Project, **kwargs):
+    project_access_cache.invalidate(instance.creator_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_new_user_access(sender, instance, created: bool, **kwargs):
+    if created:
+        project_access_cache.invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_deleted_user_access(sender, instance, **kwargs):
+    """
+    The projects of a deleted user are handed over to the default admin
+    with a bulk update, which does not send any signals.
+    """
+    admin_pks = (
+        get_user_model().objects.all().filter_admins().values_list("pk", flat=True)
+    )
+    project_access_cache.invalidate(instance.pk, *admin_pks)
+
+
+@receiver(post_save, sender=LoggedTime)
+def update_logged_time_rollups(sender, instance: LoggedTime, created: bool, **kwargs):
+    if not created:
+        if not logged_time_changed(instance):
+            return
+        if previous := get_loaded_time_contribution(instance):
+            (-previous).apply()
+    instance.remember_loaded_values()
+    if current := get_loaded_time_contribution(instance):
+        current.apply()
+
+
+@receiver(pre_delete, sender=Project)
+def collect_deleted_project(sender, instance: Project, **kwargs):
+    if (deletion := get_cascade_deletion()) is not None:
+        deletion.add_project(instance)
+
+
+@receiver(pre_delete, sender=Epic)
+def collect_deleted_epic(sender, instance: Epic, **kwargs):
+    if (deletion := get_cascade_deletion()) is not None:
+        deletion.add_epic(instance)
+
+
+@receiver(pre_delete, sender=Issue)
+@receiver(pre_delete, sender=Task)
+@receiver(pre_delete, sender=Bug)
+@receiver(pre_delete, sender=UserStory)
+def collect_deleted_issue(sender, instance: Issue, **kwargs):
+    """The pre_delete signals of the cascade are sent before any row is deleted."""
+    if (deletion := get_cascade_deletion()) is not None:
+        deletion.add_issue(instance)
+
+
+@receiver(post_delete, sender=LoggedTime)
+def update_deleted_logged_time_rollups(sender, instance: LoggedTime, **kwargs):
+    """The project of the rollups is reused for the tombstone."""
+    deletion = get_cascade_deletion()
+    if deletion is not None and deletion.add_deleted_time(instance):
+        add_tombstone(
+            LOGGED_TIME,
+            deletion.get_issue_project_id(instance.get_loaded_value("issue_id")),
+            instance.pk,
+        )
+        return
+    if previous := get_loaded_time_contribution(instance):
+        (-previous).apply()
+        add_tombstone(LOGGED_TIME, previous.project_id, instance.pk)
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Bug)
+@receiver(post_save, sender=UserStory)
+def update_issue_aggregates(sender, instance: Issue, created: bool, **kwargs):
+    """The signals are not sent for the parent model when saving a proxy model."""
+    counter_deltas = IssueCounterDeltas()
+    if created:
+        counter_deltas.add_issue(instance, 1)
+    else:
+        counter_deltas.add_changed_issue(instance)
+        move_issue_time(instance)
+        previous_project_id = instance.get_loaded_value("project_id")
+        if previous_project_id != instance.project_id:
+            add_tombstone(ISSUE, previous_project_id, instance.pk)
+    counter_deltas.apply()
+    instance.remember_loaded_values()
+
+
+@receiver(post_delete, sender=Issue)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Bug)
+@receiver(post_delete, sender=UserStory)
+def update_deleted_issue_counters(sender, instance: Issue, **kwargs):
+    if (deletion := get_cascade_deletion()) is not None:
+        deletion.add_deleted_issue(instance)
+        return
+    counter_deltas = IssueCounterDeltas()
+    counter_deltas.add_issue(instance, -1, loaded=True)
+    counter_deltas.apply()
+
+
+@receiver(post_delete, sender=Issue)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Bug)
+@receiver(post_delete, sender=UserStory)
+def add_deleted_issue_tombstone(sender, instance: Issue, **kwargs):
+    add_tombstone(ISSUE, instance.get_loaded_value("project_id"), instance.pk)
+
+
+@receiver(post_delete, sender=Epic)
+def add_deleted_epic_tombstone(sender, instance: Epic, **kwargs):
+    add_tombstone(EPIC, instance.project_id, instance.pk)
+
+
+@receiver(post_delete, sender=ProjectMembership)
+def add_deleted_membership_tombstone(sender, instance: ProjectMembership, **kwargs):
+    add_tombstone(MEMBERSHIP, instance.project_id, instance.pk)
+
+
+@receiver(post_delete, sender=IssueComment)
+def add_deleted_comment_tombstone(sender, instance: IssueComment, **kwargs):
+    """The comments are deleted before their issue, when it is deleted."""
+    add_tombstone(COMMENT, get_issue_project_id(instance.issue_id), instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+def delete_project_tombstones(sender, instance: Project, **kwargs):
+    """
+    The tombstones of the objects deleted before the project go with it.
+    The objects deleted together with the project leave none behind.
+    """
+    DeletionTombstone.objects.filter(project_id=instance.pk).delete()
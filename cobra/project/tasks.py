@@ -2,20 +2,26 @@ import logging
 from typing import Optional
 
 from celery import shared_task
+from django.conf import settings
 
 from cobra.project.models import ProjectInvitation
-from cobra.project.utils.tasks import get_project_invitation_email_to_user
-from cobra.services.email.common import send_mail
+from cobra.project.utils.tasks import (
+    get_project_invitation_email_to_user,
+    get_project_invitation_or_none,
+    iter_project_invitations,
+)
+from cobra.services.email.common import send_mail, send_mails
 from cobra.services.email.models import TemplateEmail
-from cobra.utils.models import get_object_or_none
+from cobra.utils.tasks import instrumented_task
 
 logger = logging.getLogger("celery")
 
 
 @shared_task
+@instrumented_task
 def send_project_invitation_email(invitation_pk):
-    invitation: Optional[ProjectInvitation] = get_object_or_none(
-        ProjectInvitation, pk=invitation_pk
+    invitation: Optional[ProjectInvitation] = get_project_invitation_or_none(
+        invitation_pk
     )
     if invitation is None:
         return
@@ -24,7 +30,28 @@ def send_project_invitation_email(invitation_pk):
 
     logger.info(
         "Sending the project invitation email to the user with pk=%s",
-        invitation.user.pk,
+        invitation.user_id,
     )
 
     send_mail(email)
+
+
+@shared_task
+@instrumented_task
+def send_project_invitation_emails(invitation_pks):
+    """
+    Send the emails of many invitations at once over a single connection.
+    The invitations are loaded in chunks as the emails are delivered.
+    """
+    logger.info("Sending %s project invitation emails", len(invitation_pks))
+
+    sent = send_mails(
+        get_project_invitation_email_to_user(invitation)
+        for invitation in iter_project_invitations(
+            invitation_pks, settings.EMAIL_BATCH_SIZE
+        )
+    )
+    if sent < len(invitation_pks):
+        logger.warning(
+            "Sent %s of %s project invitation emails", sent, len(invitation_pks)
+        )
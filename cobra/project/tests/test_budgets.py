@@ -0,0 +1,252 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from cobra.project.factories import (
+    EpicFactory,
+    IssueCommentFactory,
+    IssueFactory,
+    LoggedTimeFactory,
+    ProjectFactory,
+    ProjectInvitationFactory,
+    ProjectMembershipFactory,
+)
+from cobra.project.models import Project
+from cobra.project.utils.access import project_access_cache
+from cobra.project.utils.models import DEVELOPER, MAINTAINER
+from cobra.user.factories import UserFactory
+from cobra.user.models import CustomUser
+from cobra.utils.test import EndpointBudget, EndpointBudgetMixin
+
+
+class ProjectEndpointBudgetTest(EndpointBudgetMixin, APITestCase):
+    """
+    The query budgets must not depend on the number of listed objects,
+    an N+1 in any of the endpoints below exceeds them.
+    """
+
+    client: APIClient
+    user: CustomUser
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.project: Project = ProjectFactory(members=UserFactory.create_batch(5))
+        ProjectMembershipFactory(user=cls.user, project=cls.project, role=MAINTAINER)
+        cls.epics = EpicFactory.create_batch(5, project=cls.project)
+        cls.issues = IssueFactory.create_batch(
+            30,
+            project=cls.project,
+            epic=cls.epics[0],
+            assignee=cls.project.members.first(),
+        )
+        cls.issue = cls.issues[0]
+        IssueFactory.create_batch(10, project=cls.project, parent=cls.issue)
+        LoggedTimeFactory.create_batch(10, issue=cls.issue)
+        IssueCommentFactory.create_batch(10, issue=cls.issue)
+        for role in (DEVELOPER, MAINTAINER) * 5:
+            project = ProjectFactory(members=UserFactory.create_batch(3))
+            ProjectMembershipFactory(user=cls.user, project=project, role=role)
+            IssueFactory.create_batch(5, project=project)
+        cls.membership = ProjectMembershipFactory(project=cls.project, role=DEVELOPER)
+        ProjectFactory.create_batch(5, creator=cls.user)
+        ProjectFactory.create_batch(5)
+
+    def setUp(self) -> None:
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_project_endpoints(self):
+        kwargs = {"pk": self.project.pk}
+        # The lists aggregate their conditional request validators first.
+        self.assert_within_budget(
+            EndpointBudget(4),
+            "get",
+            reverse("project:project-list"),
+            data={"page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(3),
+            "get",
+            reverse("project:project-list"),
+            data={"omit": "members", "page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(4),
+            "get",
+            reverse("project:project-list"),
+            data={"expand": "members,creator", "page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(3), "get", reverse("project:project-detail", kwargs=kwargs)
+        )
+        self.assert_within_budget(
+            EndpointBudget(2),
+            "get",
+            reverse("project:project-memberships", kwargs=kwargs),
+        )
+        self.assert_within_budget(
+            EndpointBudget(2),
+            "get",
+            reverse("project:project-issues", kwargs=kwargs),
+            data={"page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(2),
+            "get",
+            reverse("project:project-epics", kwargs=kwargs),
+            data={"page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(3), "get", reverse("project:project-time", kwargs=kwargs)
+        )
+        self.assert_within_budget(
+            EndpointBudget(2),
+            "get",
+            reverse("project:project-time-daily", kwargs=kwargs),
+        )
+        self.assert_within_budget(
+            EndpointBudget(3),
+            "get",
+            reverse(
+                "project:project-by-username-slug",
+                kwargs={
+                    "username": self.project.creator.username,
+                    "slug": self.project.slug,
+                },
+            ),
+        )
+        # The row is locked, in a transaction, while the update is written.
+        self.assert_within_budget(
+            EndpointBudget(7),
+            "patch",
+            reverse("project:project-detail", kwargs=kwargs),
+            data={"title": "Renamed"},
+        )
+        # The issue counters are updated, a new counter row is created in a savepoint.
+        self.assert_within_budget(
+            EndpointBudget(6),
+            "post",
+            reverse("project:project-issues", kwargs=kwargs),
+            data={
+                "title": "New issue",
+                "estimate": "2.00",
+                "project": self.project.pk,
+                "epic": self.epics[0].pk,
+                "parent": self.issue.pk,
+            },
+            expected_status=status.HTTP_201_CREATED,
+        )
+        self.assert_within_budget(
+            EndpointBudget(6),
+            "post",
+            reverse("project:project-epics", kwargs=kwargs),
+            data={"title": "New epic", "project": self.project.pk},
+            expected_status=status.HTTP_201_CREATED,
+        )
+
+    def test_issue_endpoints(self):
+        kwargs = {"id": self.issue.pk}
+        self.assert_within_budget(
+            EndpointBudget(3),
+            "get",
+            reverse("project:issue-list"),
+            data={"page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(3),
+            "get",
+            reverse("project:issue-list"),
+            data={"expand": "parent", "page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(1), "get", reverse("project:issue-detail", kwargs=kwargs)
+        )
+        self.assert_within_budget(
+            EndpointBudget(2),
+            "get",
+            reverse("project:issue-logged-time", kwargs=kwargs),
+        )
+        self.assert_within_budget(
+            EndpointBudget(2), "get", reverse("project:issue-comments", kwargs=kwargs)
+        )
+        self.assert_within_budget(
+            EndpointBudget(2), "get", reverse("project:issue-sub-issues", kwargs=kwargs)
+        )
+        # The row is locked, in a transaction, while the update is written.
+        self.assert_within_budget(
+            EndpointBudget(5),
+            "patch",
+            reverse("project:issue-detail", kwargs=kwargs),
+            data={"title": "Renamed"},
+        )
+        self.assert_within_budget(
+            EndpointBudget(2), "get", reverse("project:issue-time", kwargs=kwargs)
+        )
+        self.assert_within_budget(
+            EndpointBudget(2),
+            "get",
+            reverse("project:issue-tree", kwargs=kwargs),
+            data={"rollup": "true"},
+        )
+        # The four rollups are updated in the same transaction, the first entry
+        # of the day inserts the daily rollup in a savepoint.
+        self.assert_within_budget(
+            EndpointBudget(11),
+            "post",
+            reverse("project:issue-logged-time", kwargs=kwargs),
+            data={"time": "1.50"},
+            expected_status=status.HTTP_201_CREATED,
+        )
+        self.assert_within_budget(
+            EndpointBudget(4),
+            "post",
+            reverse("project:issue-comments", kwargs=kwargs),
+            data={"content": "Comment"},
+            expected_status=status.HTTP_201_CREATED,
+        )
+
+    def test_epic_endpoints(self):
+        kwargs = {"id": self.epics[0].pk}
+        self.assert_within_budget(
+            EndpointBudget(3),
+            "get",
+            reverse("project:epic-list"),
+            data={"page_size": 100},
+        )
+        self.assert_within_budget(
+            EndpointBudget(1), "get", reverse("project:epic-detail", kwargs=kwargs)
+        )
+        self.assert_within_budget(
+            EndpointBudget(3), "get", reverse("project:epic-time", kwargs=kwargs)
+        )
+        # The row is locked, in a transaction, while the update is written.
+        self.assert_within_budget(
+            EndpointBudget(5),
+            "patch",
+            reverse("project:epic-detail", kwargs=kwargs),
+            data={"title": "Renamed"},
+        )
+
+    def test_membership_and_invitation_endpoints(self):
+        invitation = ProjectInvitationFactory(user=self.user)
+        self.assert_within_budget(
+            EndpointBudget(3),
+            "patch",
+            reverse(
+                "project:projectmembership-change-role",
+                kwargs={"id": self.membership.pk},
+            ),
+            data={"role": MAINTAINER},
+        )
+        self.assert_within_budget(
+            EndpointBudget(1),
+            "get",
+            reverse("project:projectinvitation-detail", kwargs={"id": invitation.pk}),
+        )
+        self.assert_within_budget(
+            EndpointBudget(6),
+            "post",
+            reverse("project:projectinvitation-accept", kwargs={"id": invitation.pk}),
+            expected_status=status.HTTP_204_NO_CONTENT,
+        )
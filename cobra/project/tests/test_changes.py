@@ -0,0 +1,238 @@
+from datetime import timedelta
+from io import StringIO
+from typing import Any
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from cobra.project.factories import (
+    EpicFactory,
+    IssueCommentFactory,
+    IssueFactory,
+    LoggedTimeFactory,
+    ProjectFactory,
+    ProjectMembershipFactory,
+)
+from cobra.project.models import DeletionTombstone, Issue, Project
+from cobra.project.utils.access import project_access_cache
+from cobra.project.utils.models import (
+    CLOSED,
+    COMMENT,
+    EPIC,
+    ISSUE,
+    LOGGED_TIME,
+    MEMBERSHIP,
+    NEW,
+    TASK,
+)
+from cobra.user.factories import UserFactory
+
+
+def get_tombstones(project: Project) -> set[tuple[str, Any]]:
+    return set(
+        DeletionTombstone.objects.filter(project=project).values_list(
+            "kind", "object_id"
+        )
+    )
+
+
+class DeletionTombstonesTest(TestCase):
+    def setUp(self) -> None:
+        self.project: Project = ProjectFactory()
+        self.issue: Issue = IssueFactory(project=self.project, type=TASK)
+
+    def test_deleted_objects_leave_tombstones(self):
+        comment = IssueCommentFactory(issue=self.issue)
+        logged_time = LoggedTimeFactory(issue=self.issue)
+        epic = EpicFactory(project=self.project)
+        membership = ProjectMembershipFactory(project=self.project)
+        expected = {
+            (ISSUE, self.issue.pk),
+            (COMMENT, comment.pk),
+            (LOGGED_TIME, logged_time.pk),
+            (EPIC, epic.pk),
+            (MEMBERSHIP, membership.pk),
+        }
+        self.issue.delete()
+        epic.delete()
+        membership.delete()
+        self.assertEqual(get_tombstones(self.project), expected)
+
+    def test_moved_issue_leaves_a_tombstone(self):
+        other_project = ProjectFactory()
+        self.issue.project = other_project
+        self.issue.save()
+        self.assertEqual(get_tombstones(self.project), {(ISSUE, self.issue.pk)})
+        self.assertEqual(get_tombstones(other_project), set())
+
+    def test_deleted_project_tombstones_are_removed(self):
+        IssueCommentFactory(issue=self.issue)
+        self.project.delete()
+        self.assertFalse(DeletionTombstone.objects.exists())
+
+    def get_project_deletion_queries(self, size: int) -> int:
+        project: Project = ProjectFactory()
+        epic = EpicFactory(project=project)
+        ProjectMembershipFactory(project=project)
+        parent = IssueFactory(project=project, epic=epic)
+        for issue in IssueFactory.create_batch(
+            size, project=project, epic=epic, parent=parent
+        ):
+            LoggedTimeFactory(issue=issue)
+            IssueCommentFactory(issue=issue)
+        project = Project.objects.get(pk=project.pk)
+        with CaptureQueriesContext(connection) as context:
+            project.delete()
+        return len(context)
+
+    def test_project_deletion_queries_do_not_depend_on_its_size(self):
+        self.assertEqual(
+            self.get_project_deletion_queries(1), self.get_project_deletion_queries(5)
+        )
+        self.assertFalse(DeletionTombstone.objects.exists())
+
+    def test_old_tombstones_are_pruned(self):
+        self.issue.delete()
+        DeletionTombstone.objects.update(deleted=timezone.now() - timedelta(days=31))
+        IssueFactory(project=self.project).delete()
+        out = StringIO()
+        call_command("prune_tombstones", stdout=out)
+        self.assertIn("1 tombstones", out.getvalue())
+        self.assertEqual(DeletionTombstone.objects.count(), 1)
+
+
+class ProjectChangesViewTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user])
+        self.old_issue: Issue = IssueFactory(project=self.project)
+        self.since = timezone.now()
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("project:project-changes", kwargs={"pk": self.project.pk})
+
+    def test_changes_since(self):
+        issue = IssueFactory(project=self.project)
+        comment = IssueCommentFactory(issue=issue)
+        deleted_issue = IssueFactory(project=self.project)
+        deleted_issue_pk = deleted_issue.pk
+        deleted_issue.delete()
+        IssueFactory()
+        response = self.client.get(self.url, data={"since": self.since.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual([item["id"] for item in response.data["issues"]], [issue.pk])
+        self.assertEqual(
+            [item["id"] for item in response.data["comments"]], [comment.pk]
+        )
+        self.assertEqual(response.data["epics"], [])
+        self.assertEqual(
+            [(item["kind"], item["id"]) for item in response.data["deleted"]],
+            [(ISSUE, deleted_issue_pk)],
+        )
+
+        self.assertIsNone(response.data["next"])
+
+        with freeze_time(timezone.now() + settings.PROJECT_CHANGES_OVERLAP * 2):
+            response = self.client.get(self.url, data={"since": response.data["until"]})
+            self.assertIn(issue.pk, [item["id"] for item in response.data["issues"]])
+            response = self.client.get(self.url, data={"since": response.data["until"]})
+        self.assertEqual(response.data["issues"], [])
+        self.assertEqual(response.data["deleted"], [])
+
+    def test_changes_committed_late_are_not_missed(self):
+        response = self.client.get(self.url, data={"since": self.since.isoformat()})
+        # Saved before the sync, but committed after it.
+        issue = IssueFactory(project=self.project)
+        Issue.objects.filter(pk=issue.pk).update(
+            modified=timezone.now() - settings.PROJECT_CHANGES_OVERLAP / 2
+        )
+        response = self.client.get(self.url, data={"since": response.data["until"]})
+        self.assertIn(issue.pk, [item["id"] for item in response.data["issues"]])
+
+    @override_settings(PROJECT_CHANGES_LIMIT=2)
+    def test_changes_are_continued_with_the_cursor(self):
+        issues = IssueFactory.create_batch(4, project=self.project)
+        Issue.objects.filter(pk=issues[-1].pk).update(modified=timezone.now())
+        comment = IssueCommentFactory(issue=issues[0])
+        pages = [self.client.get(self.url, data={"since": self.since.isoformat()})]
+        while pages[-1].data["next"] is not None:
+            pages.append(
+                self.client.get(self.url, data={"cursor": pages[-1].data["next"]})
+            )
+        self.assertGreater(len(pages), 1)
+        self.assertEqual(
+            [item["id"] for page in pages for item in page.data["issues"]],
+            [issue.pk for issue in issues],
+        )
+        self.assertEqual(
+            [item["id"] for page in pages for item in page.data["comments"]],
+            [comment.pk],
+        )
+        self.assertEqual(
+            {(page.data["since"], page.data["until"]) for page in pages},
+            {(pages[0].data["since"], pages[0].data["until"])},
+        )
+
+    def test_cursor_is_validated(self):
+        response = self.client.get(self.url, data={"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+    def get_changed_issues(self) -> list[Any]:
+        response = self.client.get(self.url, data={"since": self.since.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [item["id"] for item in response.data["issues"]]
+
+    def test_cleared_relations_are_changes(self):
+        child = IssueFactory(project=self.project, parent=self.old_issue)
+        assignee = UserFactory()
+        assigned = IssueFactory(project=self.project, assignee=assignee)
+        Issue.objects.filter(pk__in=[child.pk, assigned.pk]).update(
+            modified=self.since - timedelta(seconds=1)
+        )
+        self.old_issue.delete()
+        assignee.delete()
+        self.assertEqual(set(self.get_changed_issues()), {child.pk, assigned.pk})
+
+    def test_bulk_updates_are_changes(self):
+        issues = IssueFactory.create_batch(2, project=self.project, status=NEW)
+        Issue.objects.update(modified=self.since - timedelta(seconds=1))
+        response = self.client.post(
+            reverse(
+                "project:project-issues-transition", kwargs={"pk": self.project.pk}
+            ),
+            data={"status": CLOSED, "ids": [issues[0].pk]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        response = self.client.post(
+            reverse("project:project-issues-bulk", kwargs={"pk": self.project.pk}),
+            data={"issues": [{"id": issues[1].pk, "title": "Renamed"}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(set(self.get_changed_issues()), {issue.pk for issue in issues})
+
+    def test_since_is_validated(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            self.url, data={"since": (self.since - timedelta(days=31)).isoformat()}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("since_is_too_old", response.data)
+
+    def test_foreign_project_changes_are_forbidden(self):
+        url = reverse("project:project-changes", kwargs={"pk": ProjectFactory().pk})
+        response = self.client.get(url, data={"since": self.since.isoformat()})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,228 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from cobra.project.factories import EpicFactory, IssueFactory, ProjectFactory
+from cobra.project.models import (
+    Bug,
+    Epic,
+    EpicIssueCounter,
+    Issue,
+    Project,
+    ProjectIssueCounter,
+)
+from cobra.project.utils.access import project_access_cache
+from cobra.project.utils.counters import rebuild_issue_counters
+from cobra.project.utils.models import BUG, CLOSED, IN_PROGRESS, NEW, TASK
+from cobra.user.factories import UserFactory
+
+
+def get_counts(counters) -> dict[tuple[str, str], int]:
+    return {
+        (counter.status, counter.type): counter.count
+        for counter in counters
+        if counter.count
+    }
+
+
+class IssueCountersTest(TestCase):
+    def setUp(self) -> None:
+        self.project: Project = ProjectFactory()
+        self.epic: Epic = EpicFactory(project=self.project)
+
+    def assert_counts(self, project_counts, epic_counts=None):
+        self.assertEqual(
+            get_counts(ProjectIssueCounter.objects.filter(project=self.project)),
+            project_counts,
+        )
+        self.assertEqual(
+            get_counts(EpicIssueCounter.objects.filter(epic=self.epic)),
+            project_counts if epic_counts is None else epic_counts,
+        )
+
+    def test_created_issues_are_counted(self):
+        IssueFactory.create_batch(
+            2, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        Bug.objects.create(
+            project=self.project,
+            epic=self.epic,
+            creator=self.project.creator,
+            title="Bug",
+            estimate=1,
+            type=BUG,
+        )
+        self.assert_counts({(NEW, TASK): 2, (NEW, BUG): 1})
+
+    def test_updated_issue_is_moved_between_counters(self):
+        issue: Issue = IssueFactory(
+            project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        issue = Issue.objects.get(pk=issue.pk)
+        issue.status = IN_PROGRESS
+        issue.save()
+        self.assert_counts({(IN_PROGRESS, TASK): 1})
+        issue.epic = None
+        issue.save()
+        self.assert_counts({(IN_PROGRESS, TASK): 1}, {})
+        issue.title = "No changes of the counters"
+        with self.assertNumQueries(1):
+            issue.save()
+
+    def test_deleted_issues_are_subtracted(self):
+        issues = IssueFactory.create_batch(
+            2, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        issues[0].delete()
+        self.assert_counts({(NEW, TASK): 1})
+
+    def test_epic_deletion_cascades_to_the_project_counters(self):
+        IssueFactory.create_batch(
+            2, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        IssueFactory(project=self.project, status=CLOSED, type=TASK)
+        self.epic.delete()
+        self.assertEqual(
+            get_counts(ProjectIssueCounter.objects.filter(project=self.project)),
+            {(CLOSED, TASK): 1},
+        )
+        self.assertFalse(EpicIssueCounter.objects.exists())
+
+    def test_epic_deletion_updates_every_counter_once(self):
+        IssueFactory.create_batch(
+            3, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        with CaptureQueriesContext(connection) as context:
+            self.epic.delete()
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in context
+                    if query["sql"].startswith("UPDATE")
+                    and "issuecounter" in query["sql"]
+                ]
+            ),
+            1,
+        )
+        self.assertEqual(
+            get_counts(ProjectIssueCounter.objects.filter(project=self.project)), {}
+        )
+
+    def test_project_deletion_does_not_update_the_counters(self):
+        IssueFactory.create_batch(
+            3, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        with CaptureQueriesContext(connection) as context:
+            self.project.delete()
+        self.assertFalse(
+            [
+                query
+                for query in context
+                if query["sql"].startswith("UPDATE") and "issuecounter" in query["sql"]
+            ]
+        )
+        self.assertFalse(ProjectIssueCounter.objects.exists())
+
+    def test_rebuild(self):
+        IssueFactory.create_batch(
+            3, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        Issue.objects.filter(project=self.project).update(status=CLOSED)
+        rebuild_issue_counters(project_pks=[self.project.pk])
+        self.assert_counts({(CLOSED, TASK): 3})
+
+    def test_rebuild_command(self):
+        IssueFactory(project=self.project, epic=self.epic, status=NEW, type=TASK)
+        ProjectIssueCounter.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_issue_counters", project=[self.project.pk], stdout=out)
+        self.assert_counts({(NEW, TASK): 1})
+        self.assertIn("rebuilt", out.getvalue())
+
+
+class IssueCountsViewsTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user])
+        self.epic: Epic = EpicFactory(project=self.project)
+        IssueFactory.create_batch(
+            2, project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        IssueFactory(project=self.project, status=CLOSED, type=BUG)
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+
+    def get_data(self, url: str, **params):
+        response = self.client.get(url, data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_project_issue_counts(self):
+        url = reverse("project:project-list")
+        data = self.get_data(url, expand="issue_counts")["results"][0]
+        self.assertEqual(
+            data["issue_counts"],
+            {
+                "total": 3,
+                "status": {NEW: 2, CLOSED: 1},
+                "type": {TASK: 2, BUG: 1},
+            },
+        )
+        self.assertNotIn("issue_counts", self.get_data(url)["results"][0])
+
+    def test_epic_issue_counts(self):
+        data = self.get_data(
+            reverse("project:epic-detail", kwargs={"id": self.epic.pk}),
+            expand="issue_counts",
+        )
+        self.assertEqual(data["issue_counts"]["status"], {NEW: 2})
+
+    def test_counts_are_prefetched(self):
+        EpicFactory.create_batch(3, project=self.project)
+        url = reverse("project:project-epics", kwargs={"pk": self.project.pk})
+        self.get_data(url, expand="issue_counts")
+        # The project, the epics and their counters
+        with self.assertNumQueries(3):
+            self.get_data(url, expand="issue_counts")
+
+    def test_bulk_actions_keep_the_counts(self):
+        bulk_url = reverse(
+            "project:project-issues-bulk", kwargs={"pk": self.project.pk}
+        )
+        response = self.client.post(
+            bulk_url,
+            data={
+                "issues": [
+                    {"title": "Imported", "estimate": "1.00", "epic": self.epic.pk},
+                    {
+                        "id": Issue.objects.filter(type=BUG).get().pk,
+                        "epic": self.epic.pk,
+                    },
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        response = self.client.post(
+            reverse(
+                "project:project-issues-transition", kwargs={"pk": self.project.pk}
+            ),
+            data={"status": IN_PROGRESS, "filter": {"type": TASK}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        expected = ProjectIssueCounter.objects.filter(project=self.project)
+        expected_epic = EpicIssueCounter.objects.filter(epic=self.epic)
+        counts = (get_counts(expected), get_counts(expected_epic))
+        rebuild_issue_counters()
+        self.assertEqual(counts, (get_counts(expected), get_counts(expected_epic)))
+        self.assertEqual(counts[0], {(IN_PROGRESS, TASK): 3, (CLOSED, BUG): 1})
@@ -1,8 +1,15 @@
 from django.test import TestCase
 from django.utils.text import slugify
 
-from cobra.project.factories import ProjectFactory
-from cobra.project.models import Project
+from cobra.project.factories import (
+    EpicFactory,
+    IssueCommentFactory,
+    IssueFactory,
+    LoggedTimeFactory,
+    ProjectFactory,
+    ProjectInvitationFactory,
+)
+from cobra.project.models import Epic, Issue, Project
 from cobra.user.factories import UserFactory
 from cobra.user.models import CustomUser
 from cobra.utils.test import TestFactoryMixin, fake
@@ -42,3 +49,41 @@ class ProjectFactoryTest(TestCase, TestFactoryMixin):
         self.assertEqual(set(project.members.all()), set(users))
         for user in users:
             self.assertIn(project, user.projects.all())
+
+
+class EpicFactoryTest(TestCase, TestFactoryMixin):
+    factory_class = EpicFactory
+    must_be_not_none = ["title", "creator", "project"]
+
+    def test_creator_is_project_creator(self):
+        epic: Epic = self.factory_class.create()
+        self.assertEqual(epic.creator, epic.project.creator)
+
+
+class IssueFactoryTest(TestCase, TestFactoryMixin):
+    factory_class = IssueFactory
+    must_be_not_none = ["title", "creator", "project", "status", "type", "estimate"]
+
+    def test_issue_within_epic_project(self):
+        epic: Epic = EpicFactory()
+        issue: Issue = self.factory_class.create(project=epic.project, epic=epic)
+        self.assertEqual(issue.project, issue.epic.project)
+        self.assertEqual(issue.creator, epic.project.creator)
+
+
+class LoggedTimeFactoryTest(TestCase, TestFactoryMixin):
+    factory_class = LoggedTimeFactory
+    batch_size = 16
+    must_be_not_none = ["issue", "user", "time"]
+
+
+class IssueCommentFactoryTest(TestCase, TestFactoryMixin):
+    factory_class = IssueCommentFactory
+    batch_size = 16
+    must_be_not_none = ["issue", "user", "content"]
+
+
+class ProjectInvitationFactoryTest(TestCase, TestFactoryMixin):
+    factory_class = ProjectInvitationFactory
+    batch_size = 16
+    must_be_not_none = ["user", "project", "inviter", "status"]
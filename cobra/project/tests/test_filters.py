@@ -0,0 +1,116 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.request import Request
+
+from cobra.project.api.filters import (
+    IsEpicProjectMemberOrCreatorFilterBackend,
+    IsIssueProjectMemberOrCreatorFilterBackend,
+    IsProjectMemberOrCreatorFilterBackend,
+)
+from cobra.project.factories import (
+    EpicFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectMembershipFactory,
+)
+from cobra.project.models import Epic, Issue, LoggedTime, Project
+from cobra.user.factories import UserFactory
+
+
+class VisibilityFilterBackendsTest(TestCase):
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.created_project: Project = ProjectFactory(creator=self.user)
+        self.member_project: Project = ProjectFactory()
+        self.foreign_project: Project = ProjectFactory(
+            members=UserFactory.create_batch(2)
+        )
+        ProjectMembershipFactory(user=self.user, project=self.member_project)
+        ProjectMembershipFactory(project=self.member_project)
+        self.visible_projects = {self.created_project, self.member_project}
+        self.request = Request(RequestFactory().get("/"))
+        self.request.user = self.user
+
+    def filter_queryset(self, backend_class, queryset):
+        return backend_class().filter_queryset(self.request, queryset, None)
+
+    def assert_visibility(self):
+        projects = self.filter_queryset(
+            IsProjectMemberOrCreatorFilterBackend, Project.objects.all()
+        )
+        self.assertNotIn("DISTINCT", str(projects.query))
+        self.assertEqual(
+            list(projects.order_by("pk")),
+            sorted(self.visible_projects, key=lambda p: p.pk),
+        )
+
+        for project in (
+            self.created_project,
+            self.member_project,
+            self.foreign_project,
+        ):
+            IssueFactory.create_batch(2, project=project)
+            EpicFactory(project=project)
+        issues = self.filter_queryset(
+            IsIssueProjectMemberOrCreatorFilterBackend, Issue.objects.all()
+        )
+        self.assertNotIn("DISTINCT", str(issues.query))
+        self.assertEqual(len(issues), 4)
+        self.assertEqual({issue.project for issue in issues}, self.visible_projects)
+        epics = self.filter_queryset(
+            IsEpicProjectMemberOrCreatorFilterBackend, Epic.objects.all()
+        )
+        self.assertNotIn("DISTINCT", str(epics.query))
+        self.assertEqual({epic.project for epic in epics}, self.visible_projects)
+
+    def test_visible_project_ids(self):
+        self.assert_visibility()
+
+    @override_settings(PROJECT_ACCESS_MAX_INLINE_PKS=0)
+    def test_correlated_exists(self):
+        self.assert_visibility()
+
+
+class BenchmarkVisibilityCommandTest(TestCase):
+    def test_benchmark_is_rolled_back(self):
+        projects_count = Project.objects.count()
+        out = StringIO()
+        call_command(
+            "benchmark_visibility",
+            projects=4,
+            issues=20,
+            users=6,
+            members_per_project=2,
+            user_projects=2,
+            runs=1,
+            stdout=out,
+        )
+        self.assertIn("correlated EXISTS", out.getvalue())
+        self.assertEqual(Project.objects.count(), projects_count)
+
+
+class BenchmarkIndexesCommandTest(TestCase):
+    def test_benchmark_is_rolled_back(self):
+        out = StringIO()
+        call_command(
+            "benchmark_indexes",
+            projects=2,
+            issues=10,
+            users=6,
+            members_per_project=2,
+            user_projects=1,
+            invitations_per_project=3,
+            logged_time_per_issue=1,
+            runs=1,
+            stdout=out,
+        )
+        self.assertIn("Without the tuned indexes", out.getvalue())
+        self.assertFalse(LoggedTime.objects.exists())
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Issue._meta.db_table
+            )
+        self.assertIn("issue_project_board_idx", constraints)
@@ -0,0 +1,176 @@
+from django.test import RequestFactory, TestCase
+from rest_framework.permissions import OR
+from rest_framework.request import Request
+
+from cobra.project.api.permissions import (
+    IsEpicProjectCreator,
+    IsEpicProjectMember,
+    IsIssueProjectCreator,
+    IsIssueProjectMember,
+    IsProjectCreator,
+    IsProjectMaintainer,
+    IsProjectMember,
+    IsProjectMembershipUserMaintainer,
+)
+from cobra.project.factories import (
+    EpicFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectMembershipFactory,
+)
+from cobra.project.models import Project
+from cobra.project.utils.access import ProjectAccessIndex, get_project_access_index
+from cobra.project.utils.models import DEVELOPER, MAINTAINER
+from cobra.user.factories import UserFactory
+from cobra.utils.permissions import has_object_permissions_bulk
+
+
+class ProjectAccessIndexTest(TestCase):
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.created_project: Project = ProjectFactory(creator=self.user)
+        self.maintained_project: Project = ProjectFactory()
+        self.developed_project: Project = ProjectFactory()
+        self.foreign_project: Project = ProjectFactory()
+        ProjectMembershipFactory(
+            user=self.user, project=self.maintained_project, role=MAINTAINER
+        )
+        ProjectMembershipFactory(
+            user=self.user, project=self.developed_project, role=DEVELOPER
+        )
+
+    def test_index_is_loaded_with_a_single_query(self):
+        index = ProjectAccessIndex(self.user)
+        with self.assertNumQueries(1):
+            self.assertTrue(index.is_creator(self.created_project.pk))
+            self.assertFalse(index.is_member(self.created_project.pk))
+            self.assertTrue(index.is_maintainer(self.maintained_project.pk))
+            self.assertTrue(index.is_member(self.developed_project.pk))
+            self.assertFalse(index.is_maintainer(self.developed_project.pk))
+            self.assertFalse(index.is_member_or_creator(self.foreign_project.pk))
+            self.assertEqual(index.get_role(self.maintained_project.pk), MAINTAINER)
+
+    def test_visible_project_pks(self):
+        index = ProjectAccessIndex(self.user)
+        self.assertEqual(
+            index.visible_project_pks,
+            {
+                self.created_project.pk,
+                self.maintained_project.pk,
+                self.developed_project.pk,
+            },
+        )
+
+    def test_index_is_bound_to_the_request(self):
+        request = Request(RequestFactory().get("/"))
+        request.user = self.user
+        self.assertIs(
+            get_project_access_index(request), get_project_access_index(request)
+        )
+        request.user = UserFactory()
+        self.assertNotEqual(get_project_access_index(request).user_pk, self.user.pk)
+
+
+class ProjectPermissionsTest(TestCase):
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory()
+        ProjectMembershipFactory(user=self.user, project=self.project, role=MAINTAINER)
+        self.request = Request(RequestFactory().get("/"))
+        self.request.user = self.user
+
+    def test_project_creator_check_does_not_query(self):
+        with self.assertNumQueries(0):
+            self.assertFalse(
+                IsProjectCreator().has_object_permission(
+                    self.request, None, self.project
+                )
+            )
+
+    def test_permissions_share_a_single_query(self):
+        epic = EpicFactory(project=self.project)
+        issue = IssueFactory(project=self.project)
+        membership = ProjectMembershipFactory(project=self.project)
+        with self.assertNumQueries(1):
+            self.assertTrue(
+                IsProjectMember().has_object_permission(
+                    self.request, None, self.project
+                )
+            )
+            self.assertTrue(
+                IsProjectMaintainer().has_object_permission(
+                    self.request, None, self.project
+                )
+            )
+            self.assertTrue(
+                OR(IsEpicProjectMember(), IsEpicProjectCreator()).has_object_permission(
+                    self.request, None, epic
+                )
+            )
+            self.assertTrue(
+                OR(
+                    IsIssueProjectCreator(), IsIssueProjectMember()
+                ).has_object_permission(self.request, None, issue)
+            )
+            self.assertTrue(
+                IsProjectMembershipUserMaintainer().has_object_permission(
+                    self.request, None, membership
+                )
+            )
+
+    def test_foreign_project_is_denied(self):
+        foreign_issue = IssueFactory()
+        self.assertFalse(
+            IsIssueProjectMember().has_object_permission(
+                self.request, None, foreign_issue
+            )
+        )
+        self.assertFalse(
+            IsIssueProjectCreator().has_object_permission(
+                self.request, None, foreign_issue
+            )
+        )
+
+
+class BulkPermissionsTest(TestCase):
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.member_project: Project = ProjectFactory()
+        self.created_project: Project = ProjectFactory(creator=self.user)
+        ProjectMembershipFactory(user=self.user, project=self.member_project)
+        self.request = Request(RequestFactory().get("/"))
+        self.request.user = self.user
+
+    def test_page_is_evaluated_with_a_single_query(self):
+        issues = [
+            *IssueFactory.create_batch(3, project=self.member_project),
+            *IssueFactory.create_batch(2, project=self.created_project),
+            *IssueFactory.create_batch(3),
+        ]
+        permission = (IsIssueProjectMember | IsIssueProjectCreator)()
+        with self.assertNumQueries(1):
+            results = has_object_permissions_bulk(
+                permission, self.request, None, issues
+            )
+        self.assertEqual(results, [True] * 5 + [False] * 3)
+
+    def test_composed_permissions_are_evaluated_per_operand(self):
+        issues = [
+            IssueFactory(project=self.member_project),
+            IssueFactory(project=self.created_project),
+        ]
+        self.assertEqual(
+            has_object_permissions_bulk(
+                (IsIssueProjectMember & IsIssueProjectCreator)(),
+                self.request,
+                None,
+                issues,
+            ),
+            [False, False],
+        )
+        self.assertEqual(
+            has_object_permissions_bulk(
+                (~IsIssueProjectCreator)(), self.request, None, issues
+            ),
+            [True, False],
+        )
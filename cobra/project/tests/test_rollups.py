@@ -0,0 +1,210 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from cobra.project.factories import (
+    EpicFactory,
+    IssueFactory,
+    LoggedTimeFactory,
+    ProjectFactory,
+)
+from cobra.project.models import (
+    Epic,
+    EpicTimeRollup,
+    Issue,
+    IssueTimeRollup,
+    LoggedTime,
+    ProjectTimeRollup,
+    Task,
+    UserDailyTimeRollup,
+)
+from cobra.project.utils.models import TASK
+from cobra.project.utils.rollups import rebuild_time_rollups
+from cobra.user.factories import UserFactory
+
+
+class TimeRollupsTest(TestCase):
+    def setUp(self) -> None:
+        self.project = ProjectFactory()
+        self.epic = EpicFactory(project=self.project)
+        self.issue: Issue = IssueFactory(
+            project=self.project, epic=self.epic, type=TASK
+        )
+        self.user = UserFactory()
+
+    def log_time(self, time: str, **kwargs) -> LoggedTime:
+        kwargs.setdefault("issue", self.issue)
+        kwargs.setdefault("user", self.user)
+        return LoggedTimeFactory(time=Decimal(time), **kwargs)
+
+    def get_rollups(self) -> dict[str, tuple[Decimal, int]]:
+        rollups = {
+            "issue": IssueTimeRollup.objects.get(issue=self.issue),
+            "epic": EpicTimeRollup.objects.get(epic=self.epic),
+            "project": ProjectTimeRollup.objects.get(project=self.project),
+            "user": UserDailyTimeRollup.objects.get(
+                project=self.project, user=self.user, day=timezone.localdate()
+            ),
+        }
+        return {
+            key: (rollup.logged_time, rollup.entries) for key, rollup in rollups.items()
+        }
+
+    def assert_rollups(self, logged_time: str, entries: int):
+        expected = (Decimal(logged_time), entries)
+        self.assertEqual(
+            self.get_rollups(),
+            {key: expected for key in ("issue", "epic", "project", "user")},
+        )
+
+    def test_logged_time_is_rolled_up(self):
+        self.log_time("1.50")
+        self.log_time("2.25")
+        self.assert_rollups("3.75", 2)
+
+    def test_updated_logged_time_is_rolled_up(self):
+        logged_time = self.log_time("1.50")
+        logged_time = LoggedTime.objects.get(pk=logged_time.pk)
+        logged_time.time = Decimal("4.00")
+        logged_time.save()
+        self.assert_rollups("4.00", 1)
+        logged_time.comment = "No changes of the rollups."
+        with self.assertNumQueries(1):
+            logged_time.save()
+
+    def test_deleted_logged_time_is_subtracted(self):
+        self.log_time("1.50")
+        self.log_time("2.00").delete()
+        self.assert_rollups("1.50", 1)
+
+    def test_logged_time_moved_to_another_issue(self):
+        other_issue: Issue = IssueFactory(project=self.project)
+        logged_time = self.log_time("2.00")
+        logged_time.issue = other_issue
+        logged_time.save()
+        self.assertEqual(
+            IssueTimeRollup.objects.get(issue=self.issue).logged_time, Decimal(0)
+        )
+        self.assertEqual(
+            IssueTimeRollup.objects.get(issue=other_issue).logged_time, Decimal("2.00")
+        )
+        self.assertEqual(
+            EpicTimeRollup.objects.get(epic=self.epic).logged_time, Decimal(0)
+        )
+        self.assertEqual(
+            ProjectTimeRollup.objects.get(project=self.project).logged_time,
+            Decimal("2.00"),
+        )
+
+    def test_issue_moved_to_another_epic(self):
+        self.log_time("3.00")
+        other_epic = EpicFactory(project=self.project)
+        task = Task.objects.get(pk=self.issue.pk)
+        task.epic = other_epic
+        task.save()
+        self.assertEqual(
+            EpicTimeRollup.objects.get(epic=self.epic).logged_time, Decimal(0)
+        )
+        self.assertEqual(
+            EpicTimeRollup.objects.get(epic=other_epic).logged_time, Decimal("3.00")
+        )
+
+    def test_issue_moved_to_another_project(self):
+        self.log_time("3.00")
+        other_project = ProjectFactory()
+        issue = Issue.objects.get(pk=self.issue.pk)
+        issue.project = other_project
+        issue.epic = None
+        issue.save()
+        self.assertEqual(
+            ProjectTimeRollup.objects.get(project=self.project).logged_time, Decimal(0)
+        )
+        self.assertEqual(
+            UserDailyTimeRollup.objects.get(
+                project=other_project, user=self.user
+            ).logged_time,
+            Decimal("3.00"),
+        )
+
+    def test_deleted_issue_is_subtracted(self):
+        self.log_time("1.00")
+        self.log_time("2.00", issue=IssueFactory(project=self.project, epic=self.epic))
+        Issue.objects.get(pk=self.issue.pk).delete()
+        self.assertEqual(
+            (
+                ProjectTimeRollup.objects.get(project=self.project).logged_time,
+                EpicTimeRollup.objects.get(epic=self.epic).logged_time,
+            ),
+            (Decimal("2.00"), Decimal("2.00")),
+        )
+
+    def test_deleted_epic_is_subtracted(self):
+        self.log_time("1.00")
+        self.log_time("2.00", issue=IssueFactory(project=self.project))
+        Epic.objects.get(pk=self.epic.pk).delete()
+        self.assertEqual(
+            (
+                ProjectTimeRollup.objects.get(project=self.project).logged_time,
+                UserDailyTimeRollup.objects.get(
+                    project=self.project, user=self.user
+                ).logged_time,
+            ),
+            (Decimal("2.00"), Decimal("2.00")),
+        )
+        self.assertFalse(IssueTimeRollup.objects.filter(issue=self.issue).exists())
+
+    def test_deleted_issue_rollups_are_updated_once(self):
+        for _ in range(3):
+            self.log_time("1.00")
+        with CaptureQueriesContext(connection) as context:
+            Issue.objects.get(pk=self.issue.pk).delete()
+        # The epic, project and user rollups get one update each.
+        self.assertEqual(
+            len(
+                [
+                    query
+                    for query in context
+                    if "UPDATE" in query["sql"] and "timerollup" in query["sql"]
+                ]
+            ),
+            3,
+        )
+        self.assertEqual(
+            EpicTimeRollup.objects.get(epic=self.epic).logged_time, Decimal(0)
+        )
+
+    def test_deleted_project_rollups_are_not_updated_by_row(self):
+        for issue in IssueFactory.create_batch(3, project=self.project):
+            self.log_time("1.00", issue=issue)
+        with CaptureQueriesContext(connection) as context:
+            self.project.delete()
+        self.assertFalse(
+            [
+                query
+                for query in context
+                if "UPDATE" in query["sql"] and "timerollup" in query["sql"]
+            ]
+        )
+        self.assertFalse(UserDailyTimeRollup.objects.exists())
+
+    def test_rebuild(self):
+        self.log_time("1.25")
+        self.log_time("0.50")
+        # The bulk update bypasses the signals.
+        LoggedTime.objects.update(time=Decimal("1.00"))
+        self.assert_rollups("1.75", 2)
+        rebuild_time_rollups(project_pks=[self.project.pk])
+        self.assert_rollups("2.00", 2)
+
+    def test_rebuild_command(self):
+        self.log_time("1.25")
+        IssueTimeRollup.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_time_rollups", stdout=out)
+        self.assert_rollups("1.25", 1)
+        self.assertIn("rebuilt", out.getvalue())
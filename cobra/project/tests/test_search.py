@@ -0,0 +1,122 @@
+from importlib import import_module
+from typing import Any
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from cobra.project.factories import (
+    EpicFactory,
+    IssueCommentFactory,
+    IssueFactory,
+    ProjectFactory,
+)
+from cobra.project.models import Project
+from cobra.project.utils.access import project_access_cache
+from cobra.project.utils.models import TASK
+from cobra.project.utils.search import SEARCH_TARGETS
+from cobra.user.factories import UserFactory
+
+
+class SearchApiViewTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user])
+        self.title_issue = IssueFactory(
+            project=self.project, title="Broken login form", description="Steps."
+        )
+        self.description_issue = IssueFactory(
+            project=self.project,
+            title="Session handling",
+            description="The login form keeps the session forever.",
+        )
+        self.epic = EpicFactory(
+            project=self.project, title="Login revamp", description=""
+        )
+        self.comment = IssueCommentFactory(
+            issue=self.description_issue, content="The login form is fixed now."
+        )
+        IssueFactory(title="Foreign login form")
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("project:search")
+
+    def search(self, **params: Any) -> list[dict[str, Any]]:
+        response = self.client.get(self.url, data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        results: list[dict[str, Any]] = response.data["results"]
+        return results
+
+    def test_results_are_ranked_and_visible(self):
+        results = self.search(q="login form")
+        self.assertEqual(
+            [(result["kind"], result["id"]) for result in results],
+            [
+                ("issue", self.title_issue.pk),
+                ("issue", self.description_issue.pk),
+                ("comment", self.comment.pk),
+            ],
+        )
+        self.assertEqual(results[2]["issue"], self.description_issue.pk)
+        self.assertEqual(results[2]["title"], self.description_issue.title)
+
+    def test_kinds_and_project_filters(self):
+        results = self.search(q="login", kind=["epic", "comment"])
+        self.assertEqual({result["kind"] for result in results}, {"epic", "comment"})
+        self.assertEqual(self.search(q="login", project=ProjectFactory().pk), [])
+
+    def test_issue_list_filter(self):
+        response = self.client.get(reverse("project:issue-list"), data={"q": "login"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {issue["id"] for issue in response.data["results"]},
+            {self.title_issue.pk, self.description_issue.pk},
+        )
+
+    def test_limit(self):
+        self.assertEqual(len(self.search(q="login", limit=2)), 2)
+
+    def test_admins_search_every_project(self):
+        self.client.force_authenticate(UserFactory.create_superuser())
+        self.assertEqual(len(self.search(q="login form", kind="issue")), 3)
+
+    def test_invalid_params(self):
+        for params in ({}, {"q": "a"}, {"q": "login", "kind": "user"}):
+            response = self.client.get(self.url, data=params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AdminSearchTest(TestCase):
+    def setUp(self) -> None:
+        self.client.force_login(UserFactory.create_superuser())
+
+    def test_search_fields(self):
+        issue = IssueFactory(title="Searchable", type=TASK)
+        for name, obj in (
+            ("task", issue),
+            ("epic", EpicFactory(title="Searchable")),
+            ("issuecomment", IssueCommentFactory(content="Searchable")),
+            ("loggedtime", None),
+            ("project", issue.project),
+            ("projectmembership", None),
+            ("projectinvitation", None),
+        ):
+            response = self.client.get(
+                reverse(f"admin:project_{name}_changelist"), data={"q": "Searchable"}
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class SearchIndexesTest(TestCase):
+    def test_migrated_indexes_match_the_search_vectors(self):
+        migration = import_module("cobra.project.migrations.0005_search_indexes")
+        self.assertEqual(
+            migration.SEARCH_INDEXES,
+            {
+                target.model.__name__: target.get_index()
+                for target in SEARCH_TARGETS.values()
+            },
+        )
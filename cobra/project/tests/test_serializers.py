@@ -0,0 +1,122 @@
+from django.test import RequestFactory, TestCase
+from rest_framework.request import Request
+
+from cobra.project.api.serializers.issue import IssueSerializer
+from cobra.project.factories import (
+    EpicFactory,
+    IssueFactory,
+    ProjectFactory,
+    ProjectMembershipFactory,
+)
+from cobra.project.models import Issue, Project
+from cobra.project.utils.models import NEW, TASK
+from cobra.user.factories import UserFactory
+
+
+class IssueSerializerValidationTest(TestCase):
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.assignee = UserFactory()
+        self.project: Project = ProjectFactory()
+        ProjectMembershipFactory(user=self.user, project=self.project)
+        ProjectMembershipFactory(user=self.assignee, project=self.project)
+        self.epic = EpicFactory(project=self.project)
+        self.parent = IssueFactory(
+            project=self.project, epic=self.epic, status=NEW, type=TASK
+        )
+        request = Request(RequestFactory().post("/"))
+        request.user = self.user
+        self.context = {"request": request, "project": self.project}
+
+    def get_data(self, **data):
+        return {
+            "title": "Issue",
+            "estimate": "1.00",
+            "assignee": self.assignee.pk,
+            "epic": self.epic.pk,
+            "parent": self.parent.pk,
+            **data,
+        }
+
+    def test_issue_is_created_with_a_constant_number_of_queries(self):
+        serializer = IssueSerializer(data=self.get_data(), context=self.context)
+        # The relations lookup, INSERT and the project and epic counters updates
+        with self.assertNumQueries(4):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            issue: Issue = serializer.save()
+        self.assertEqual(issue.project, self.project)
+        self.assertEqual(issue.creator, self.user)
+        self.assertEqual(issue.assignee, self.assignee)
+        self.assertEqual(issue.epic, self.epic)
+        self.assertEqual(issue.parent, self.parent)
+        self.assertEqual(serializer.data["project"], self.project.pk)
+
+    def test_missing_objects_are_field_errors(self):
+        serializer = IssueSerializer(
+            data=self.get_data(assignee=0, epic=0, parent=EpicFactory().pk + 1000),
+            context=self.context,
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(set(serializer.errors), {"assignee", "epic", "parent"})
+        self.assertEqual(serializer.errors["epic"][0].code, "invalid")
+
+    def test_objects_of_other_projects_are_rejected(self):
+        for data in (
+            {"assignee": UserFactory().pk},
+            {"epic": EpicFactory().pk},
+            {"parent": IssueFactory().pk},
+        ):
+            serializer = IssueSerializer(
+                data=self.get_data(**data), context=self.context
+            )
+            self.assertFalse(serializer.is_valid())
+            self.assertEqual(set(serializer.errors), set(data))
+
+    def test_consistency_without_context_project(self):
+        context = {"request": self.context["request"]}
+        for data, error in (
+            (
+                {"project": ProjectFactory().pk},
+                "creator_is_not_a_member_or_project_creator",
+            ),
+            ({"epic": EpicFactory().pk}, "epic_has_wrong_project"),
+            ({"parent": IssueFactory().pk}, "parent_has_wrong_project"),
+        ):
+            serializer = IssueSerializer(
+                data=self.get_data(**{"project": self.project.pk, **data}),
+                context=context,
+            )
+            self.assertFalse(serializer.is_valid())
+            self.assertIn(error, serializer.errors)
+
+    def test_creator_is_a_member_or_the_project_creator(self):
+        request = Request(RequestFactory().post("/"))
+        request.user = self.project.creator
+        serializer = IssueSerializer(
+            data=self.get_data(),
+            context={"request": request, "project": self.project},
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        request.user = UserFactory()
+        serializer = IssueSerializer(
+            data=self.get_data(),
+            context={"request": request, "project": self.project},
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("creator_is_not_a_member_or_project_creator", serializer.errors)
+
+    def test_partial_update_checks_the_changed_relations(self):
+        issue: Issue = IssueFactory(project=self.project, creator=self.user)
+        serializer = IssueSerializer(
+            issue, data={"title": "Renamed"}, partial=True, context=self.context
+        )
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer = IssueSerializer(
+            issue,
+            data={"parent": IssueFactory().pk},
+            partial=True,
+            context={"request": self.context["request"]},
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("parent_has_wrong_project", serializer.errors)
@@ -0,0 +1,92 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cobra.project.factories import ProjectFactory, ProjectMembershipFactory
+from cobra.project.models import Project
+from cobra.project.utils.access import ProjectAccessIndex, project_access_cache
+from cobra.project.utils.models import DEVELOPER, MAINTAINER
+from cobra.user.factories import UserFactory
+
+
+class ProjectAccessCacheTest(TestCase):
+    def setUp(self) -> None:
+        project_access_cache.backend.clear()
+        project_access_cache.reset_stats()
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory()
+
+    def test_access_map_is_shared_between_requests(self):
+        self.assertFalse(ProjectAccessIndex(self.user).is_member(self.project.pk))
+        with self.assertNumQueries(0):
+            self.assertFalse(ProjectAccessIndex(self.user).is_member(self.project.pk))
+        self.assertEqual(
+            project_access_cache.get_stats(),
+            {"hits": 1, "misses": 1, "hit_ratio": 0.5},
+        )
+
+    def test_membership_save_invalidates_the_entry(self):
+        self.assertFalse(ProjectAccessIndex(self.user).is_member(self.project.pk))
+        membership = ProjectMembershipFactory(
+            user=self.user, project=self.project, role=DEVELOPER
+        )
+        self.assertTrue(ProjectAccessIndex(self.user).is_member(self.project.pk))
+        membership.role = MAINTAINER
+        membership.save()
+        self.assertTrue(ProjectAccessIndex(self.user).is_maintainer(self.project.pk))
+
+    def test_membership_delete_invalidates_the_entry(self):
+        membership = ProjectMembershipFactory(user=self.user, project=self.project)
+        self.assertTrue(ProjectAccessIndex(self.user).is_member(self.project.pk))
+        membership.delete()
+        self.assertFalse(ProjectAccessIndex(self.user).is_member(self.project.pk))
+
+    def test_project_deletion_invalidates_members_entries(self):
+        ProjectMembershipFactory(user=self.user, project=self.project)
+        self.assertTrue(ProjectAccessIndex(self.user).is_member(self.project.pk))
+        project_pk = self.project.pk
+        self.project.delete()
+        self.assertFalse(ProjectAccessIndex(self.user).is_member(project_pk))
+
+    def test_creator_change_invalidates_both_creators(self):
+        previous_creator = self.project.creator
+        self.assertTrue(
+            ProjectAccessIndex(previous_creator).is_creator(self.project.pk)
+        )
+        self.assertFalse(ProjectAccessIndex(self.user).is_creator(self.project.pk))
+        self.project.creator = self.user
+        self.project.save()
+        self.assertFalse(
+            ProjectAccessIndex(previous_creator).is_creator(self.project.pk)
+        )
+        self.assertTrue(ProjectAccessIndex(self.user).is_creator(self.project.pk))
+
+    def test_creator_change_of_loaded_project_invalidates_both_creators(self):
+        previous_creator = self.project.creator
+        self.assertTrue(
+            ProjectAccessIndex(previous_creator).is_creator(self.project.pk)
+        )
+        project = Project.objects.get(pk=self.project.pk)
+        project.creator = self.user
+        project.save()
+        self.assertFalse(
+            ProjectAccessIndex(previous_creator).is_creator(self.project.pk)
+        )
+        self.assertTrue(ProjectAccessIndex(self.user).is_creator(self.project.pk))
+
+    def test_project_save_does_not_read_the_previous_creator(self):
+        project = Project.objects.get(pk=self.project.pk)
+        project.title = "Renamed"
+        with self.assertNumQueries(1):
+            project.save()
+
+    def test_stats_are_exposed_to_admins(self):
+        client = APIClient()
+        url = reverse("project:access-cache-stats")
+        client.force_authenticate(self.user)
+        self.assertEqual(client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+        client.force_authenticate(UserFactory.create_superuser())
+        response = client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {"hits", "misses", "hit_ratio"})
@@ -0,0 +1,146 @@
+from io import StringIO
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.template.loader import get_template
+from django.test import TestCase
+
+from cobra.project.factories import ProjectInvitationFactory
+from cobra.project.tasks import (
+    send_project_invitation_email,
+    send_project_invitation_emails,
+)
+from cobra.services.email.models import TemplateEmail
+from cobra.services.email.rendering import get_email_template
+from cobra.services.email.services import BatchEmailDelivery
+
+
+def get_template_email(index: int) -> TemplateEmail:
+    return TemplateEmail(
+        subject=f"Subject {index}",
+        mail_from="cobra@example.com",
+        mail_to=f"user{index}@example.com",
+        template={"path": "email/project_invitation.html", "context": {}},
+    )
+
+
+class TemplateEmailTest(TestCase):
+    def test_email_message_is_memoized(self):
+        email = get_template_email(0)
+        self.assertIs(email.email, email.email)
+        self.assertEqual(email.email.to, ["user0@example.com"])
+        self.assertEqual(email.email.content_subtype, "html")
+
+    def test_template_is_compiled_once(self):
+        get_email_template.cache_clear()
+        with mock.patch(
+            "cobra.services.email.rendering.get_template", wraps=get_template
+        ) as mock_get_template:
+            for index in range(3):
+                get_template_email(index).email
+        mock_get_template.assert_called_once_with("email/project_invitation.html")
+
+    def test_addresses_are_validated(self):
+        email = get_template_email(0)
+        email.mail_to = ["first@example.com", "second@example.com"]
+        self.assertEqual(email.email.to, email.mail_to)
+        for field, value in (
+            ("mail_to", "not an email"),
+            ("mail_to", []),
+            ("mail_from", ""),
+            ("subject", " "),
+        ):
+            email = get_template_email(0)
+            setattr(email, field, value)
+            self.assertIsNone(email.email, field)
+
+    def test_build_benchmark(self):
+        out = StringIO()
+        call_command("benchmark_email_build", emails=2, runs=1, stdout=out)
+        self.assertIn("cached template", out.getvalue())
+
+
+class BatchEmailDeliveryTest(TestCase):
+    def setUp(self) -> None:
+        self.connection = mock.MagicMock()
+        self.connection.send_messages.side_effect = len
+
+    def test_emails_are_flushed_by_size(self):
+        with BatchEmailDelivery(
+            batch_size=2, max_delay=60, connection=self.connection
+        ) as delivery:
+            for index in range(5):
+                delivery.add(get_template_email(index))
+            self.assertEqual(self.connection.send_messages.call_count, 2)
+        self.assertEqual(
+            [len(call.args[0]) for call in self.connection.send_messages.mock_calls],
+            [2, 2, 1],
+        )
+        self.assertEqual(delivery.sent, 5)
+        self.connection.open.assert_called_once()
+        self.connection.close.assert_called_once()
+
+    @mock.patch("cobra.services.email.services.time.monotonic")
+    def test_emails_are_flushed_by_time(self, mock_monotonic: mock.MagicMock):
+        delivery = BatchEmailDelivery(
+            batch_size=100, max_delay=5, connection=self.connection
+        )
+        mock_monotonic.return_value = 0
+        delivery.add(get_template_email(0))
+        mock_monotonic.return_value = 5
+        delivery.add(get_template_email(1))
+        self.connection.send_messages.assert_called_once()
+        delivery.close()
+        self.assertEqual(delivery.sent, 2)
+
+    def test_invalid_emails_are_skipped(self):
+        email = get_template_email(0)
+        email.mail_to = "not an email"
+        with BatchEmailDelivery(connection=self.connection) as delivery:
+            self.assertIsNone(delivery.add(email))
+        self.connection.send_messages.assert_not_called()
+        self.connection.open.assert_not_called()
+
+
+class ProjectInvitationEmailsTaskTest(TestCase):
+    def test_invitation_emails_are_sent_over_one_connection(self):
+        invitations = ProjectInvitationFactory.create_batch(3)
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open"
+        ) as mock_open:
+            send_project_invitation_emails(
+                [invitation.pk for invitation in invitations]
+            )
+        mock_open.assert_called_once()
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            sorted(invitation.user.email for invitation in invitations),
+        )
+
+    @mock.patch("cobra.project.tasks.settings.EMAIL_BATCH_SIZE", 2)
+    def test_invitations_are_loaded_in_chunks(self):
+        invitations = ProjectInvitationFactory.create_batch(5)
+        with self.assertNumQueries(3):
+            send_project_invitation_emails(
+                [invitation.pk for invitation in invitations]
+            )
+        self.assertEqual(len(mail.outbox), 5)
+
+    def test_invitation_email_is_sent_with_a_single_query(self):
+        invitation = ProjectInvitationFactory()
+        with self.assertNumQueries(1):
+            send_project_invitation_email(invitation.pk)
+        self.assertEqual(mail.outbox[0].to, [invitation.user.email])
+
+    @mock.patch("cobra.utils.tasks.logger")
+    def test_task_metrics_are_logged(self, mock_logger: mock.MagicMock):
+        invitation = ProjectInvitationFactory()
+        send_project_invitation_email(invitation.pk)
+        mock_logger.info.assert_called_once()
+        metrics = mock_logger.info.call_args.args[1]
+        self.assertEqual(
+            metrics.name, "cobra.project.tasks.send_project_invitation_email"
+        )
+        self.assertEqual(metrics.queries, 1)
+        self.assertGreater(metrics.duration, 0)
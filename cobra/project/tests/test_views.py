@@ -0,0 +1,1047 @@
+import csv
+import json
+import threading
+from base64 import b64decode, b64encode
+from decimal import Decimal
+from typing import Any, Optional, cast
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APITestCase, APITransactionTestCase
+
+from cobra.outbox.models import OutboxMessage
+from cobra.project.api.filters import IsIssueProjectMemberOrCreatorFilterBackend
+from cobra.project.factories import (
+    EpicFactory,
+    IssueCommentFactory,
+    IssueFactory,
+    LoggedTimeFactory,
+    ProjectFactory,
+    ProjectInvitationFactory,
+    ProjectMembershipFactory,
+)
+from cobra.project.models import Issue, Project, ProjectInvitation
+from cobra.project.tasks import send_project_invitation_emails
+from cobra.project.utils import export
+from cobra.project.utils.access import project_access_cache
+from cobra.project.utils.models import BUG, CLOSED, DEVELOPER, MAINTAINER, NEW, TASK
+from cobra.user.factories import UserFactory
+from cobra.utils.views import ConditionalUpdateModelMixin
+
+
+class PaginatedResponseMixin:
+    def get_all_pages(self, url: str, **params: Any) -> list[dict[str, Any]]:
+        client = cast(APIClient, getattr(self, "client"))
+        results: list[dict[str, Any]] = []
+        next_url: Optional[str] = url
+        while next_url is not None:
+            response: Response = client.get(next_url, data=params)
+            params = {}
+            assert response.status_code == status.HTTP_200_OK, response.data
+            results.extend(response.data["results"])
+            next_url = response.data["next"]
+        return results
+
+
+class CursorPaginationTest(PaginatedResponseMixin, APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(creator=self.user)
+        self.client.force_authenticate(self.user)
+
+    def test_issue_list_is_paginated(self):
+        issues = IssueFactory.create_batch(5, project=self.project)
+        results = self.get_all_pages(reverse("project:issue-list"), page_size=2)
+        self.assertEqual(
+            [result["id"] for result in results],
+            [issue.pk for issue in reversed(issues)],
+        )
+
+    def test_nested_project_issues_are_paginated(self):
+        issues = IssueFactory.create_batch(5, project=self.project)
+        IssueFactory.create_batch(2)
+        response: Response = self.client.get(
+            reverse("project:project-issues", kwargs={"pk": self.project.pk}),
+            data={"page_size": 2},
+        )
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+        results = self.get_all_pages(
+            reverse("project:project-issues", kwargs={"pk": self.project.pk}),
+            page_size=2,
+        )
+        self.assertEqual({result["id"] for result in results}, {i.pk for i in issues})
+
+    def test_nested_project_epics_are_paginated(self):
+        epics = EpicFactory.create_batch(3, project=self.project)
+        results = self.get_all_pages(
+            reverse("project:project-epics", kwargs={"pk": self.project.pk}),
+            page_size=2,
+        )
+        self.assertEqual({result["id"] for result in results}, {e.pk for e in epics})
+
+    def test_project_list_is_paginated(self):
+        projects = ProjectFactory.create_batch(3, creator=self.user)
+        ProjectMembershipFactory(user=self.user)
+        results = self.get_all_pages(reverse("project:project-list"), page_size=2)
+        self.assertEqual(len(results), 5)
+        self.assertTrue({p.pk for p in projects} <= {r["id"] for r in results})
+
+    def test_modified_row_does_not_break_the_pages(self):
+        issues = IssueFactory.create_batch(4, project=self.project)
+        response: Response = self.client.get(
+            reverse("project:issue-list"), data={"page_size": 2}
+        )
+        first_page = [result["id"] for result in response.data["results"]]
+        issues[0].save()
+        response = self.client.get(response.data["next"])
+        second_page = [result["id"] for result in response.data["results"]]
+        self.assertFalse(set(first_page) & set(second_page))
+
+    def test_rows_modified_at_the_same_time_are_paged_by_id(self):
+        issues = IssueFactory.create_batch(7, project=self.project)
+        Issue.objects.filter(project=self.project).update(modified=timezone.now())
+        url = reverse("project:issue-list")
+        results = self.get_all_pages(url, page_size=2)
+        self.assertEqual(
+            [result["id"] for result in results],
+            sorted((issue.pk for issue in issues), reverse=True),
+        )
+        response: Response = self.client.get(url, data={"page_size": 2})
+        cursor = parse_qs(urlparse(response.data["next"]).query)["cursor"][0]
+        self.assertNotIn("o=", b64decode(cursor).decode())
+
+    def test_previous_pages_mirror_the_next_pages(self):
+        IssueFactory.create_batch(5, project=self.project)
+        Issue.objects.filter(project=self.project).update(modified=timezone.now())
+        url = reverse("project:issue-list")
+        pages: list[list[int]] = []
+        response: Response = self.client.get(url, data={"page_size": 2})
+        while True:
+            pages.append([result["id"] for result in response.data["results"]])
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"])
+        for page in reversed(pages[:-1]):
+            response = self.client.get(response.data["previous"])
+            self.assertEqual(
+                [result["id"] for result in response.data["results"]], page
+            )
+        self.assertIsNone(response.data["previous"])
+
+    def test_invalid_cursor_is_rejected(self):
+        cursor = b64encode(b"p=not-a-key").decode()
+        response: Response = self.client.get(
+            reverse("project:issue-list"), data={"cursor": cursor}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BulkObjectPermissionsTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory()
+        ProjectMembershipFactory(user=self.user, project=self.project)
+        self.client.force_authenticate(self.user)
+
+    def test_sub_issues_are_filtered_by_permissions(self):
+        issue = IssueFactory(project=self.project)
+        visible = IssueFactory.create_batch(2, project=self.project, parent=issue)
+        IssueFactory(parent=issue)
+        response: Response = self.client.get(
+            reverse("project:issue-sub-issues", kwargs={"id": issue.pk})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {result["id"] for result in response.data}, {i.pk for i in visible}
+        )
+
+    def test_expanded_foreign_parents_are_hidden(self):
+        foreign_parent = IssueFactory()
+        visible = IssueFactory(project=self.project)
+        child = IssueFactory(project=self.project, parent=foreign_parent)
+        response: Response = self.client.get(
+            reverse("project:issue-list"), data={"expand": "parent"}
+        )
+        results = {result["id"]: result for result in response.data["results"]}
+        self.assertEqual(set(results), {visible.pk, child.pk})
+        self.assertIsNone(results[child.pk]["parent"])
+        response = self.client.get(reverse("project:issue-list"))
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_filtered_page_is_short_and_links_the_next_rows(self):
+        visible = IssueFactory(project=self.project)
+        IssueFactory()
+        # The re-check drops the foreign issues left by the visibility filter.
+        with mock.patch.object(
+            IsIssueProjectMemberOrCreatorFilterBackend,
+            "filter_queryset",
+            lambda backend, request, queryset, view: queryset,
+        ):
+            response: Response = self.client.get(
+                reverse("project:issue-list"), data={"page_size": 1}
+            )
+            self.assertEqual(response.data["results"], [])
+            self.assertIsNotNone(response.data["next"])
+            response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [result["id"] for result in response.data["results"]], [visible.pk]
+        )
+
+    def test_nested_issues_are_checked_against_issue_permissions(self):
+        issues = IssueFactory.create_batch(3, project=self.project)
+        response: Response = self.client.get(
+            reverse("project:project-issues", kwargs={"pk": self.project.pk})
+        )
+        self.assertEqual(
+            {result["id"] for result in response.data["results"]},
+            {i.pk for i in issues},
+        )
+
+
+class MemoizedObjectQueriesTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory()
+        ProjectMembershipFactory(user=self.user, project=self.project)
+        self.issue = IssueFactory(project=self.project)
+        IssueFactory.create_batch(2, project=self.project, parent=self.issue)
+        EpicFactory.create_batch(2, project=self.project)
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+
+    def assert_num_queries(self, num: int, url: str):
+        with self.assertNumQueries(num):
+            response: Response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_project_actions(self):
+        # The first request loads the access map, the project is resolved once
+        # per request. The members are only prefetched for the project itself.
+        kwargs = {"pk": self.project.pk}
+        self.assert_num_queries(3, reverse("project:project-detail", kwargs=kwargs))
+        self.assert_num_queries(
+            2, reverse("project:project-memberships", kwargs=kwargs)
+        )
+        self.assert_num_queries(2, reverse("project:project-issues", kwargs=kwargs))
+        self.assert_num_queries(2, reverse("project:project-epics", kwargs=kwargs))
+
+    def test_issue_actions(self):
+        # The first request loads the access map, the issue is resolved once
+        # per request.
+        kwargs = {"id": self.issue.pk}
+        self.assert_num_queries(2, reverse("project:issue-detail", kwargs=kwargs))
+        self.assert_num_queries(2, reverse("project:issue-logged-time", kwargs=kwargs))
+        self.assert_num_queries(2, reverse("project:issue-comments", kwargs=kwargs))
+        self.assert_num_queries(2, reverse("project:issue-sub-issues", kwargs=kwargs))
+
+
+class ProjectMembersPrefetchTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(
+            creator=self.user, members=UserFactory.create_batch(3)
+        )
+        self.client.force_authenticate(self.user)
+
+    def get_members_queries(self, **params: Any) -> list[str]:
+        with CaptureQueriesContext(connection) as context:
+            response: Response = self.client.get(
+                reverse("project:project-detail", kwargs={"pk": self.project.pk}),
+                data=params,
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.members = response.data.get("members")
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if "_prefetch_related_val_project_id" in query["sql"]
+        ]
+
+    def test_member_ids_are_prefetched_by_default(self):
+        (query,) = self.get_members_queries()
+        self.assertNotIn('"user_customuser"."email"', query)
+        self.assertNotIn('"user_customuser"."username"', query)
+        self.assertEqual(
+            set(self.members), {user.pk for user in self.project.members.all()}
+        )
+
+    def test_expanded_members_load_the_common_columns(self):
+        (query,) = self.get_members_queries(expand="members")
+        self.assertIn('"user_customuser"."username"', query)
+        self.assertNotIn('"user_customuser"."password"', query)
+        self.assertEqual(
+            {member["username"] for member in self.members},
+            {user.username for user in self.project.members.all()},
+        )
+
+    def test_omitted_members_are_not_prefetched(self):
+        self.assertEqual(self.get_members_queries(omit="members"), [])
+        self.assertIsNone(self.members)
+
+
+class ProjectUserAccessAnnotationsTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.created_project: Project = ProjectFactory(creator=self.user)
+        self.maintained_project: Project = ProjectFactory()
+        self.developed_project: Project = ProjectFactory()
+        ProjectMembershipFactory(
+            user=self.user, project=self.maintained_project, role=MAINTAINER
+        )
+        ProjectMembershipFactory(
+            user=self.user, project=self.developed_project, role=DEVELOPER
+        )
+        ProjectFactory.create_batch(20, creator=self.user)
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_projects_are_fetched_in_a_single_query(self):
+        # The access map is loaded first, the list validators
+        # and the projects follow in one query each.
+        with self.assertNumQueries(3):
+            response: Response = self.client.get(
+                reverse("project:project-list"),
+                data={"omit": "members", "page_size": 100},
+            )
+        self.assertEqual(len(response.data["results"]), 23)
+
+    def test_is_creator_and_membership_role(self):
+        response: Response = self.client.get(
+            reverse("project:project-list"), data={"page_size": 100}
+        )
+        results = {result["id"]: result for result in response.data["results"]}
+        for project, is_creator, role in (
+            (self.created_project, True, ""),
+            (self.maintained_project, False, MAINTAINER),
+            (self.developed_project, False, DEVELOPER),
+        ):
+            self.assertEqual(results[project.pk]["is_creator"], is_creator)
+            self.assertEqual(results[project.pk]["membership_role"], role)
+
+    def test_created_project_is_serialized_without_annotations(self):
+        response: Response = self.client.post(
+            reverse("project:project-list"), data={"title": "New project"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(response.data["is_creator"])
+        self.assertEqual(response.data["membership_role"], "")
+
+
+class IssueListFiltersTest(PaginatedResponseMixin, APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.assignee = UserFactory()
+        self.project: Project = ProjectFactory(
+            creator=self.user, members=[self.assignee]
+        )
+        self.issues = IssueFactory.create_batch(
+            4, project=self.project, status=NEW, type=BUG
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse("project:issue-list")
+
+    def get_ids(self, **params: Any) -> list[Any]:
+        return [result["id"] for result in self.get_all_pages(self.url, **params)]
+
+    def test_issues_are_filtered(self):
+        closed = IssueFactory(
+            project=self.project, status=CLOSED, type=BUG, assignee=self.assignee
+        )
+        child = IssueFactory(project=self.project, parent=closed, status=NEW)
+        Issue.objects.filter(pk=self.issues[0].pk).update(
+            modified=timezone.now() - timezone.timedelta(days=10)
+        )
+        self.assertEqual(self.get_ids(status=CLOSED), [closed.pk])
+        self.assertEqual(self.get_ids(assignee=self.assignee.pk), [closed.pk])
+        self.assertEqual(self.get_ids(parent=closed.pk), [child.pk])
+        self.assertEqual(
+            self.get_ids(
+                modified_before=(
+                    timezone.now() - timezone.timedelta(days=1)
+                ).isoformat()
+            ),
+            [self.issues[0].pk],
+        )
+
+    def test_issues_are_ordered_by_indexed_fields_only(self):
+        ids = [issue.pk for issue in self.issues]
+        self.assertEqual(self.get_ids(ordering="modified", page_size=3), ids)
+        self.assertEqual(self.get_ids(ordering="-id", page_size=3), ids[::-1])
+        self.assertEqual(self.get_ids(ordering="title"), ids[::-1])
+
+    def test_description_is_left_out_of_the_list(self):
+        with CaptureQueriesContext(connection) as queries:
+            response: Response = self.client.get(self.url)
+        self.assertNotIn("description", response.data["results"][0])
+        self.assertFalse(
+            any(
+                f'"{Issue._meta.db_table}"."description"' in query["sql"]
+                for query in queries.captured_queries
+            )
+        )
+        response = self.client.get(self.url, data={"fields": "id,description"})
+        self.assertEqual(set(response.data["results"][0]), {"id", "description"})
+        response = self.client.get(
+            reverse("project:project-issues", kwargs={"pk": self.project.pk}),
+            data={"omit": "title"},
+        )
+        self.assertFalse({"title", "description"} & set(response.data["results"][0]))
+        response = self.client.get(
+            reverse("project:issue-detail", kwargs={"id": self.issues[0].pk})
+        )
+        self.assertIn("description", response.data)
+
+
+class ConditionalRequestsTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(creator=self.user)
+        self.issue = IssueFactory(project=self.project)
+        self.client.force_authenticate(self.user)
+        self.detail_url = reverse("project:issue-detail", kwargs={"id": self.issue.pk})
+
+    def test_detail_is_not_modified(self):
+        response: Response = self.client.get(self.detail_url)
+        etag = response.headers["ETag"]
+        self.assertIn("Last-Modified", response.headers)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.issue.save()
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_list_is_not_modified(self):
+        url = reverse("project:issue-list")
+        etag = self.client.get(url).headers["ETag"]
+        # Only the validators are aggregated, the page is neither fetched nor serialized.
+        with self.assertNumQueries(1):
+            response: Response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        IssueFactory(project=self.project).delete()
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        self.issue.delete()
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_list_etag_depends_on_the_query_string(self):
+        url = reverse("project:issue-list")
+        IssueFactory(project=self.project)
+        etag = self.client.get(url).headers["ETag"]
+        response: Response = self.client.get(
+            url, data={"page_size": 1}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(
+            self.client.get(
+                f"{url}?page_size=1&ordering=-modified",
+                HTTP_IF_NONE_MATCH=self.client.get(
+                    f"{url}?ordering=-modified&page_size=1"
+                ).headers["ETag"],
+            ).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+    def test_etag_wins_over_the_date_of_same_second_writes(self):
+        url = reverse("project:issue-list")
+        modified = self.issue.modified.replace(microsecond=100)
+        Issue.objects.filter(pk=self.issue.pk).update(modified=modified)
+        validators = {}
+        for name, target in (("list", url), ("detail", self.detail_url)):
+            response: Response = self.client.get(target)
+            validators[name] = (
+                response.headers["ETag"],
+                response.headers["Last-Modified"],
+            )
+        Issue.objects.filter(pk=self.issue.pk).update(
+            modified=modified.replace(microsecond=200)
+        )
+        for name, target in (("list", url), ("detail", self.detail_url)):
+            etag, last_modified = validators[name]
+            response = self.client.get(
+                target,
+                HTTP_IF_NONE_MATCH=etag,
+                HTTP_IF_MODIFIED_SINCE=last_modified,
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK, name)
+            self.assertEqual(response.headers["Last-Modified"], last_modified)
+            self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_update_with_stale_etag_is_rejected(self):
+        etag = self.client.get(self.detail_url).headers["ETag"]
+        response: Response = self.client.patch(
+            self.detail_url, data={"title": "First"}, HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.headers["ETag"], etag)
+        response = self.client.patch(
+            self.detail_url, data={"title": "Second"}, HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.issue.refresh_from_db()
+        self.assertEqual(self.issue.title, "First")
+
+
+class ConcurrentUpdatesTest(APITransactionTestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(creator=self.user)
+        self.issue = IssueFactory(project=self.project)
+        self.client.force_authenticate(self.user)
+        self.detail_url = reverse("project:issue-detail", kwargs={"id": self.issue.pk})
+
+    def test_interleaved_updates_with_same_etag(self):
+        etag = self.client.get(self.detail_url).headers["ETag"]
+        lock_object = ConditionalUpdateModelMixin.lock_object
+        responses: list[Response] = []
+        interleaved = threading.Event()
+
+        def send_second_update():
+            client = APIClient()
+            client.force_authenticate(self.user)
+            try:
+                responses.append(
+                    client.patch(
+                        self.detail_url, data={"title": "Second"}, HTTP_IF_MATCH=etag
+                    )
+                )
+            finally:
+                connection.close()
+
+        def interleave(view, obj):
+            # The second update is committed after the first one fetched the issue.
+            if not interleaved.is_set():
+                interleaved.set()
+                thread = threading.Thread(target=send_second_update)
+                thread.start()
+                thread.join()
+            lock_object(view, obj)
+
+        with mock.patch.object(
+            ConditionalUpdateModelMixin, "lock_object", autospec=True
+        ) as mock_lock_object:
+            mock_lock_object.side_effect = interleave
+            response: Response = self.client.patch(
+                self.detail_url, data={"title": "First"}, HTTP_IF_MATCH=etag
+            )
+        self.assertEqual(responses[0].status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.issue.refresh_from_db()
+        self.assertEqual(self.issue.title, "Second")
+
+
+class IssueBulkActionsTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.assignee = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user, self.assignee])
+        self.epic = EpicFactory(project=self.project)
+        self.issues = IssueFactory.create_batch(
+            3, project=self.project, creator=self.user, status=NEW, type=TASK
+        )
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+        self.bulk_url = reverse(
+            "project:project-issues-bulk", kwargs={"pk": self.project.pk}
+        )
+        self.transition_url = reverse(
+            "project:project-issues-transition", kwargs={"pk": self.project.pk}
+        )
+
+    def get_payloads(self, count: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "title": f"Imported issue {index}",
+                "estimate": "1.00",
+                "assignee": self.assignee.pk,
+                "epic": self.epic.pk,
+            }
+            for index in range(count)
+        ]
+
+    def test_issues_are_created_and_updated(self):
+        response: Response = self.client.post(
+            self.bulk_url,
+            data={
+                "issues": [
+                    *self.get_payloads(2),
+                    {"id": self.issues[0].pk, "title": "Renamed"},
+                    {"id": self.issues[1].pk, "parent": self.issues[2].pk},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(len(response.data["created"]), 2)
+        self.assertEqual(len(response.data["updated"]), 2)
+        created = Issue.objects.filter(
+            pk__in=[i["id"] for i in response.data["created"]]
+        )
+        self.assertEqual({issue.creator for issue in created}, {self.user})
+        self.assertEqual({issue.epic for issue in created}, {self.epic})
+        self.issues[0].refresh_from_db()
+        self.issues[1].refresh_from_db()
+        self.assertEqual(self.issues[0].title, "Renamed")
+        self.assertEqual(self.issues[1].parent, self.issues[2])
+
+    def test_query_count_does_not_depend_on_the_batch_size(self):
+        # project, access map, relations lookup, in_bulk, the savepoint,
+        # INSERT, UPDATE and the release of the savepoint, then the counters:
+        # UPDATE of the project counter, the epic one is created in a savepoint
+        issue_pks = [issue.pk for issue in self.issues]
+        with self.assertNumQueries(13):
+            response: Response = self.client.post(
+                self.bulk_url,
+                data={
+                    "issues": [
+                        *self.get_payloads(50),
+                        *({"id": pk, "title": "Renamed"} for pk in issue_pks),
+                    ]
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+    def test_errors_are_reported_per_item(self):
+        foreign_epic, foreign_issue = EpicFactory(), IssueFactory()
+        issues_count = Issue.objects.count()
+        response: Response = self.client.post(
+            self.bulk_url,
+            data={
+                "issues": [
+                    *self.get_payloads(1),
+                    {
+                        "title": "Foreign epic",
+                        "estimate": "1.00",
+                        "epic": foreign_epic.pk,
+                    },
+                    {"id": foreign_issue.pk, "title": "Foreign issue"},
+                    {"id": self.issues[0].pk, "assignee": UserFactory().pk},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["issues"]
+        self.assertEqual(errors[0], {})
+        self.assertEqual(set(errors[1]), {"epic"})
+        self.assertEqual(set(errors[2]), {"id"})
+        self.assertEqual(set(errors[3]), {"assignee"})
+        self.assertEqual(Issue.objects.count(), issues_count)
+
+    def test_issues_are_transitioned(self):
+        bug = IssueFactory(project=self.project, status=NEW, type=BUG)
+        other = IssueFactory(status=NEW, type=TASK)
+        response: Response = self.client.post(
+            self.transition_url,
+            data={"status": CLOSED, "filter": {"type": TASK}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            set(response.data["issues"]), {issue.pk for issue in self.issues}
+        )
+        self.assertEqual(set(Issue.objects.filter(status=CLOSED)), set(self.issues))
+        bug.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((bug.status, other.status), (NEW, NEW))
+
+    def test_issues_are_transitioned_by_ids(self):
+        response: Response = self.client.post(
+            self.transition_url,
+            data={"status": CLOSED, "ids": [self.issues[0].pk]},
+            format="json",
+        )
+        self.assertEqual(response.data["issues"], [self.issues[0].pk])
+        self.issues[0].refresh_from_db()
+        self.assertEqual(self.issues[0].status, CLOSED)
+
+    def test_bulk_actions_require_membership(self):
+        self.client.force_authenticate(UserFactory())
+        for url, data in (
+            (self.bulk_url, {"issues": self.get_payloads(1)}),
+            (self.transition_url, {"status": CLOSED}),
+        ):
+            response: Response = self.client.post(url, data=data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(PROJECT_EXPORT_CHUNK_SIZE=2)
+class ProjectInvitationBulkTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(creator=self.user)
+        self.member = UserFactory()
+        ProjectMembershipFactory(project=self.project, user=self.member)
+        self.invited = UserFactory()
+        ProjectInvitationFactory(
+            project=self.project, inviter=self.user, user=self.invited
+        )
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+        self.url = reverse(
+            "project:project-invitations-bulk", kwargs={"pk": self.project.pk}
+        )
+
+    def post(self, emails: list[str]) -> Response:
+        return self.client.post(self.url, data={"emails": emails}, format="json")
+
+    def test_users_are_invited_with_a_single_task(self):
+        users = UserFactory.create_batch(3)
+        emails = [user.email for user in users]
+        response = self.post(
+            [
+                *emails,
+                emails[0],
+                self.member.email,
+                self.invited.email,
+                "nobody@example.com",
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            [invitation["user"] for invitation in response.data["invited"]],
+            [user.pk for user in users],
+        )
+        self.assertEqual(
+            response.data["skipped"],
+            [
+                {"email": self.member.email, "code": "user_is_already_a_member"},
+                {
+                    "email": self.invited.email,
+                    "code": "pending_invitation_already_exists",
+                },
+                {"email": "nobody@example.com", "code": "user_does_not_exist"},
+            ],
+        )
+        self.assertEqual(
+            ProjectInvitation.objects.filter(
+                project=self.project, user__in=users
+            ).count(),
+            3,
+        )
+        self.assertEqual(
+            list(OutboxMessage.objects.values_list("task", "kwargs")),
+            [
+                (
+                    send_project_invitation_emails.name,
+                    {
+                        "invitation_pks": [
+                            str(invitation["id"])
+                            for invitation in response.data["invited"]
+                        ]
+                    },
+                )
+            ],
+        )
+
+    def test_queries_do_not_grow_with_the_emails(self):
+        def count_queries(emails: list[str]) -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.post(emails)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(context.captured_queries)
+
+        # The first request warms the project access cache up.
+        count_queries([UserFactory().email])
+        few = count_queries([user.email for user in UserFactory.create_batch(2)])
+        many = count_queries([user.email for user in UserFactory.create_batch(20)])
+        self.assertEqual(few, many)
+
+    @override_settings(PROJECT_INVITATIONS_BULK_MAX_ITEMS=2)
+    def test_too_many_emails_are_rejected(self):
+        response = self.post([user.email for user in UserFactory.create_batch(3)])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("emails", response.data)
+
+    def test_developers_cannot_invite(self):
+        developer = UserFactory()
+        ProjectMembershipFactory(project=self.project, user=developer, role=DEVELOPER)
+        self.client.force_authenticate(developer)
+        response = self.post([UserFactory().email])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ProjectExportTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user])
+        self.issues = IssueFactory.create_batch(4, project=self.project)
+        for issue in self.issues[1:]:
+            LoggedTimeFactory.create_batch(2, issue=issue)
+        for issue in self.issues[::2]:
+            IssueCommentFactory.create_batch(3, issue=issue)
+        LoggedTimeFactory(issue=IssueFactory())
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("project:project-export", kwargs={"pk": self.project.pk})
+
+    def get_content(self, **params: Any) -> str:
+        response = self.client.get(self.url, data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(
+            cast(StreamingHttpResponse, response).streaming_content
+        ).decode()
+
+    def test_ndjson_export(self):
+        records = [json.loads(line) for line in self.get_content().splitlines()]
+        self.assertEqual(
+            [record["id"] for record in records if record["record"] == "issue"],
+            [issue.pk for issue in self.issues],
+        )
+        self.assertEqual(len(records), 4 + 6 + 6)
+        current_issue = None
+        for record in records:
+            if record["record"] == "issue":
+                current_issue = record["id"]
+            else:
+                self.assertEqual(record["issue"], current_issue)
+
+    def test_csv_export(self):
+        rows = list(csv.DictReader(self.get_content(output="csv").splitlines()))
+        self.assertEqual(len(rows), 16)
+        self.assertEqual(
+            [row["record"] for row in rows[:3]], ["issue", "comment", "comment"]
+        )
+        self.assertEqual(rows[0]["title"], self.issues[0].title)
+
+    def test_rows_of_a_vanished_issue_do_not_stall_the_export(self):
+        # The issue is deleted after the cursors of the related rows are opened.
+        vanished = self.issues[1]
+        iter_rows = export.iter_export_rows
+
+        def iter_rows_without_vanished_issue(queryset, fields, chunk_size):
+            rows = iter_rows(queryset, fields, chunk_size)
+            if queryset.model is Issue:
+                return (row for row in rows if row["id"] != vanished.pk)
+            return rows
+
+        with mock.patch.object(
+            export, "iter_export_rows", iter_rows_without_vanished_issue
+        ):
+            records = [json.loads(line) for line in self.get_content().splitlines()]
+        self.assertNotIn(
+            vanished.pk,
+            {record["issue"] for record in records if record["record"] != "issue"},
+        )
+        self.assertEqual(len(records), 3 + 4 + 6)
+
+    def test_queries_do_not_depend_on_the_project_size(self):
+        # The project with its members and one cursor per exported table
+        self.get_content()
+        with self.assertNumQueries(5):
+            self.get_content()
+        IssueFactory.create_batch(10, project=self.project)
+        LoggedTimeFactory.create_batch(10, issue=self.issues[0])
+        with self.assertNumQueries(5):
+            self.get_content()
+
+    def test_unsupported_output(self):
+        response = self.client.get(self.url, data={"output": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TimeRollupViewsTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user])
+        self.epic = EpicFactory(project=self.project)
+        self.issues = IssueFactory.create_batch(
+            2, project=self.project, epic=self.epic, estimate=Decimal("5.00")
+        )
+        for issue in self.issues:
+            LoggedTimeFactory(issue=issue, user=self.user, time=Decimal("2.00"))
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+
+    def get_data(self, url: str, **params: Any) -> Any:
+        response = self.client.get(url, data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_issue_time(self):
+        url = reverse("project:issue-time", kwargs={"id": self.issues[0].pk})
+        self.assertEqual(
+            self.get_data(url),
+            {
+                "estimate": "5.00",
+                "logged_time": "2.00",
+                "remaining": "3.00",
+                "entries": 1,
+            },
+        )
+
+    def test_epic_and_project_time(self):
+        expected = {
+            "estimate": "10.00",
+            "logged_time": "4.00",
+            "remaining": "6.00",
+            "entries": 2,
+        }
+        self.assertEqual(
+            self.get_data(reverse("project:epic-time", kwargs={"id": self.epic.pk})),
+            expected,
+        )
+        url = reverse("project:project-time", kwargs={"pk": self.project.pk})
+        self.assertEqual(self.get_data(url), expected)
+
+    def test_reads_do_not_depend_on_the_logged_time(self):
+        url = reverse("project:issue-time", kwargs={"id": self.issues[0].pk})
+        self.get_data(url)
+        LoggedTimeFactory.create_batch(5, issue=self.issues[0], user=self.user)
+        # The issue and its rollup
+        with self.assertNumQueries(2):
+            self.get_data(url)
+
+    def test_project_daily_time(self):
+        url = reverse("project:project-time-daily", kwargs={"pk": self.project.pk})
+        today = timezone.localdate().isoformat()
+        self.assertEqual(
+            self.get_data(url),
+            [
+                {
+                    "user": self.user.pk,
+                    "day": today,
+                    "logged_time": "4.00",
+                    "entries": 2,
+                }
+            ],
+        )
+        self.assertEqual(self.get_data(url, user=self.user.pk + 1), [])
+        response = self.client.get(url, data={"since": today, "until": "2000-01-01"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_time_requires_membership(self):
+        self.client.force_authenticate(UserFactory())
+        for url in (
+            reverse("project:issue-time", kwargs={"id": self.issues[0].pk}),
+            reverse("project:epic-time", kwargs={"id": self.epic.pk}),
+            reverse("project:project-time", kwargs={"pk": self.project.pk}),
+            reverse("project:project-time-daily", kwargs={"pk": self.project.pk}),
+        ):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class IssueTreeTest(APITestCase):
+    client: APIClient
+
+    def setUp(self) -> None:
+        self.user = UserFactory()
+        self.project: Project = ProjectFactory(members=[self.user])
+        self.root: Issue = IssueFactory(project=self.project, estimate=Decimal("1.00"))
+        self.children = IssueFactory.create_batch(
+            2, project=self.project, parent=self.root, estimate=Decimal("2.00")
+        )
+        self.grandchild: Issue = IssueFactory(
+            project=self.project, parent=self.children[0], estimate=Decimal("3.00")
+        )
+        LoggedTimeFactory(issue=self.grandchild, time=Decimal("1.50"))
+        IssueFactory(project=self.project, parent=self.grandchild)
+        project_access_cache.backend.clear()
+        self.client.force_authenticate(self.user)
+        self.url = reverse("project:issue-tree", kwargs={"id": self.root.pk})
+
+    def get_data(self, **params: Any) -> Any:
+        response = self.client.get(self.url, data=params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_nested_tree(self):
+        data = self.get_data(max_depth=2)
+        self.assertEqual(data["id"], self.root.pk)
+        self.assertEqual(
+            [child["id"] for child in data["children"]],
+            [child.pk for child in self.children],
+        )
+        grandchild = data["children"][0]["children"][0]
+        self.assertEqual(
+            (grandchild["id"], grandchild["depth"]), (self.grandchild.pk, 2)
+        )
+        self.assertEqual(grandchild["children"], [])
+
+    def test_flat_tree_with_rollups(self):
+        data = self.get_data(layout="flat", rollup=True)
+        self.assertEqual(
+            [(item["id"], item["depth"]) for item in data[:4]],
+            [
+                (self.root.pk, 0),
+                (self.children[0].pk, 1),
+                (self.grandchild.pk, 2),
+                (self.grandchild.pk + 1, 3),
+            ],
+        )
+        self.assertEqual(len(data), 5)
+        self.assertEqual(data[0]["logged_time_total"], "1.50")
+        self.assertEqual(data[0]["logged_time"], "0.00")
+        self.assertEqual(
+            Decimal(data[0]["estimate_total"]),
+            sum(
+                Issue.objects.filter(project=self.project).values_list(
+                    "estimate", flat=True
+                ),
+                Decimal(0),
+            ),
+        )
+
+    def test_tree_is_fetched_with_a_single_query(self):
+        self.get_data()
+        # The issue and its subtree
+        with self.assertNumQueries(2):
+            self.get_data(rollup=True)
+        IssueFactory.create_batch(3, project=self.project, parent=self.grandchild)
+        with self.assertNumQueries(2):
+            self.assertEqual(len(self.get_data(layout="flat")), 8)
+
+    def test_tree_without_recursive_cte(self):
+        expected = self.get_data(layout="flat")
+        with mock.patch("cobra.project.utils.tree.RECURSIVE_CTE_VENDORS", set()):
+            self.assertEqual(self.get_data(layout="flat"), expected)
+
+    def test_foreign_sub_issues_are_left_out(self):
+        foreign: Issue = IssueFactory(parent=self.children[1])
+        IssueFactory(project=self.project, parent=foreign)
+        data = self.get_data(layout="flat")
+        self.assertEqual(len(data), 5)
+        self.assertNotIn(foreign.pk, [item["id"] for item in data])
@@ -0,0 +1,236 @@
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Optional, Union
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser, AnonymousUser
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q, Subquery
+from django.http import HttpRequest
+from rest_framework.request import Request
+
+from cobra.project.models import Project, ProjectMembership
+from cobra.project.utils.models import MAINTAINER
+
+PROJECT_ACCESS_INDEX_ATTR = "_project_access_index"
+
+
+@dataclass(frozen=True)
+class ProjectAccess:
+    role: str
+    is_creator: bool
+
+    @property
+    def is_member(self) -> bool:
+        return bool(self.role)
+
+    @property
+    def is_maintainer(self) -> bool:
+        return bool(self.role == MAINTAINER)
+
+
+def load_project_access(user_pk: Any) -> dict[Any, ProjectAccess]:
+    """
+    Load the (project_id -> role, is_creator) map of a user with a single query.
+
+    :param user_pk: the primary key of the user
+    :return: dict[Any, ProjectAccess]
+    """
+    memberships = ProjectMembership.objects.filter(
+        project__pk=OuterRef("pk"), user__pk=user_pk
+    )
+    rows = (
+        Project.objects.filter(Q(Exists(memberships)) | Q(creator__pk=user_pk))
+        .annotate(role=Subquery(memberships.values("role")[:1]))
+        .values_list("pk", "creator_id", "role")
+    )
+    return {
+        project_pk: ProjectAccess(role=role or "", is_creator=creator_pk == user_pk)
+        for project_pk, creator_pk, role in rows
+    }
+
+
+class ProjectAccessCache:
+    """
+    The cross-request cache of the users' project access maps.
+    The entries are invalidated by the signals in `cobra.project.signals`.
+    `QuerySet.update` and `bulk_update` / `bulk_create` do not send the signals,
+    so the code changing the memberships or the project creators in bulk
+    must call `invalidate` for the affected users itself.
+    """
+
+    key_prefix: str = "project-access"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> BaseCache:
+        return caches[settings.PROJECT_ACCESS_CACHE_ALIAS]
+
+    def make_key(self, user_pk: Any) -> str:
+        return f"{self.key_prefix}:{user_pk}"
+
+    def get(self, user_pk: Any) -> Optional[dict[Any, ProjectAccess]]:
+        projects: Optional[dict[Any, ProjectAccess]] = self.backend.get(
+            self.make_key(user_pk)
+        )
+        with self._lock:
+            if projects is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return projects
+
+    def set(self, user_pk: Any, projects: dict[Any, ProjectAccess]) -> None:
+        self.backend.set(
+            self.make_key(user_pk),
+            projects,
+            timeout=settings.PROJECT_ACCESS_CACHE_TIMEOUT,
+        )
+
+    def invalidate(self, *user_pks: Any) -> None:
+        """
+        Drop the entries of the users immediately and once again after the commit
+        of the current transaction, so that a concurrent request can not store
+        the state which is about to change.
+
+        :param user_pks: the primary keys of the users
+        :return: None
+        """
+        keys = [self.make_key(user_pk) for user_pk in user_pks if user_pk is not None]
+        if not keys:
+            return
+        self.backend.delete_many(keys)
+        transaction.on_commit(lambda: self.backend.delete_many(keys))
+
+    def get_stats(self) -> dict[str, Union[int, float]]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+project_access_cache = ProjectAccessCache()
+
+
+class ProjectAccessIndex:
+    """
+    The in-memory index of the projects a user is related to.
+    The index is loaded lazily on the first lookup, so that all the checks
+    performed within a request share a single database round trip,
+    which is skipped altogether on a cache hit.
+    """
+
+    def __init__(self, user: Optional[Union[AbstractUser, AnonymousUser]]):
+        self.user_pk = user.pk if user is not None and user.is_authenticated else None
+
+    @cached_property
+    def projects(self) -> dict[Any, ProjectAccess]:
+        if self.user_pk is None:
+            return {}
+        projects = project_access_cache.get(self.user_pk)
+        if projects is None:
+            projects = load_project_access(self.user_pk)
+            project_access_cache.set(self.user_pk, projects)
+        return projects
+
+    @property
+    def visible_project_pks(self) -> set[Any]:
+        return set(self.projects.keys())
+
+    @property
+    def member_project_pks(self) -> set[Any]:
+        return {
+            project_pk
+            for project_pk, access in self.projects.items()
+            if access.is_member
+        }
+
+    def get_visibility_filter(
+        self, project_lookup: str = "pk", max_inline_pks: Optional[int] = None
+    ) -> Q:
+        """
+        Build the condition matching the rows related to the projects visible to the user.
+        Small sets of projects are inlined as a list of primary keys, larger ones are
+        checked with correlated EXISTS subqueries, so neither needs a join nor DISTINCT.
+
+        :param project_lookup: the lookup of the project's primary key on the filtered model
+        :param max_inline_pks: overrides the PROJECT_ACCESS_MAX_INLINE_PKS setting
+        :return: Q
+        """
+        if self.user_pk is None:
+            return Q(pk__in=[])
+        if max_inline_pks is None:
+            max_inline_pks = settings.PROJECT_ACCESS_MAX_INLINE_PKS
+        visible_project_pks = self.visible_project_pks
+        if len(visible_project_pks) <= max_inline_pks:
+            return Q(**{f"{project_lookup}__in": visible_project_pks})
+        return Q(
+            Exists(
+                ProjectMembership.objects.filter(
+                    project__pk=OuterRef(project_lookup), user__pk=self.user_pk
+                )
+            )
+        ) | Q(
+            Exists(
+                Project.objects.filter(
+                    pk=OuterRef(project_lookup), creator__pk=self.user_pk
+                )
+            )
+        )
+
+    def get(self, project_pk: Any) -> Optional[ProjectAccess]:
+        return self.projects.get(project_pk)
+
+    def get_role(self, project_pk: Any) -> str:
+        access = self.get(project_pk)
+        return access.role if access is not None else ""
+
+    def is_member(self, project_pk: Any) -> bool:
+        access = self.get(project_pk)
+        return access is not None and access.is_member
+
+    def is_maintainer(self, project_pk: Any) -> bool:
+        access = self.get(project_pk)
+        return access is not None and access.is_maintainer
+
+    def is_creator(self, project_pk: Any) -> bool:
+        access = self.get(project_pk)
+        return access is not None and access.is_creator
+
+    def is_member_or_creator(self, project_pk: Any) -> bool:
+        return self.is_member(project_pk) or self.is_creator(project_pk)
+
+
+def get_project_access_index(
+    request: Optional[Union[Request, HttpRequest]],
+) -> ProjectAccessIndex:
+    """
+    Return the access index bound to the request, creating it if necessary.
+
+    :param request: Request
+    :return: ProjectAccessIndex
+    """
+    user = getattr(request, "user", None)
+    if request is None:
+        return ProjectAccessIndex(user)
+    index: Optional[ProjectAccessIndex] = getattr(
+        request, PROJECT_ACCESS_INDEX_ATTR, None
+    )
+    if index is None or index.user_pk != getattr(user, "pk", None):
+        index = ProjectAccessIndex(user)
+        setattr(request, PROJECT_ACCESS_INDEX_ATTR, index)
+    return index
@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from itertools import cycle, islice
+from typing import Any
+
+from django.contrib.auth.models import AbstractUser
+from django.db import connection, models
+from django.db.models import QuerySet
+
+from cobra.project.models import (
+    Issue,
+    LoggedTime,
+    Project,
+    ProjectInvitation,
+    ProjectMembership,
+)
+from cobra.project.utils.models import (
+    DEVELOPER,
+    INVITATION_STATUSES,
+    MAINTAINER,
+    TASK_STATUSES,
+    TASK_TYPES,
+)
+from cobra.user.models import CustomUser
+from cobra.utils.benchmarks import Timing, measure
+
+BENCHMARK_USERNAME_PREFIX = "benchmark_user_"
+
+
+@dataclass
+class SeededData:
+    user: AbstractUser
+    user_pks: list[Any] = field(default_factory=list)
+    project_pks: list[Any] = field(default_factory=list)
+
+
+def seed_benchmark_data(
+    projects: int,
+    issues: int,
+    users: int,
+    members_per_project: int,
+    user_projects: int,
+    invitations_per_project: int = 0,
+    logged_time_per_issue: int = 0,
+    batch_size: int = 5000,
+) -> SeededData:
+    """
+    Seed the database with the bulk-created users, projects, memberships and issues,
+    optionally with the invitations and the logged time.
+    The returned user is a member of `user_projects` projects. The caller is responsible
+    for running the function in a transaction and rolling it back afterwards.
+    """
+    CustomUser.objects.bulk_create(
+        (
+            CustomUser(
+                username=f"{BENCHMARK_USERNAME_PREFIX}{index}",
+                email=f"{BENCHMARK_USERNAME_PREFIX}{index}@example.com",
+                first_name="Benchmark",
+                last_name=str(index),
+                password="!",
+            )
+            for index in range(max(users, members_per_project + 1))
+        ),
+        batch_size=batch_size,
+    )
+    user_pks: list[Any] = list(
+        CustomUser.objects.filter(
+            username__startswith=BENCHMARK_USERNAME_PREFIX
+        ).values_list(  # type: ignore
+            "id", flat=True
+        )
+    )
+    user, *other_user_pks = user_pks
+
+    Project.objects.bulk_create(
+        [
+            Project(title=f"Benchmark project {index}", creator_id=user_pk)
+            for index, user_pk in zip(range(projects), cycle(other_user_pks))
+        ],
+        batch_size=batch_size,
+    )
+    project_pks_with_creators = list(
+        Project.objects.filter(
+            creator__username__startswith=BENCHMARK_USERNAME_PREFIX
+        ).values_list("pk", "creator_id")
+    )
+    project_pks = [project_pk for project_pk, _ in project_pks_with_creators]
+
+    memberships = []
+    members = cycle(other_user_pks)
+    for index, project_pk in enumerate(project_pks):
+        if index < user_projects:
+            memberships.append(
+                ProjectMembership(project_id=project_pk, user_id=user, role=DEVELOPER)
+            )
+        for member_pk in islice(members, members_per_project):
+            memberships.append(
+                ProjectMembership(
+                    project_id=project_pk, user_id=member_pk, role=MAINTAINER
+                )
+            )
+    ProjectMembership.objects.bulk_create(
+        memberships, batch_size=batch_size, ignore_conflicts=True
+    )
+
+    statuses = cycle(status for status, _ in TASK_STATUSES)
+    types = cycle(type_ for type_, _ in TASK_TYPES)
+    Issue.objects.bulk_create(
+        (
+            Issue(
+                title=f"Benchmark issue {index}",
+                description="Benchmark issue description. " * 8,
+                project_id=project_pk,
+                creator_id=creator_pk,
+                status=next(statuses),
+                type=next(types),
+                estimate=Decimal("1.00"),
+            )
+            for index, (project_pk, creator_pk) in zip(
+                range(issues), cycle(project_pks_with_creators)
+            )
+        ),
+        batch_size=batch_size,
+    )
+
+    statuses = cycle(status for status, _ in INVITATION_STATUSES)
+    invitees = cycle(other_user_pks)
+    ProjectInvitation.objects.bulk_create(
+        (
+            ProjectInvitation(
+                project_id=project_pk,
+                inviter_id=creator_pk,
+                user_id=next(invitees),
+                status=next(statuses),
+            )
+            for project_pk, creator_pk in project_pks_with_creators
+            for _ in range(invitations_per_project)
+        ),
+        batch_size=batch_size,
+    )
+
+    if logged_time_per_issue:
+        issues_with_creators = Issue.objects.filter(
+            project__pk__in=project_pks
+        ).values_list("pk", "creator_id")
+        LoggedTime.objects.bulk_create(
+            (
+                LoggedTime(issue_id=issue_pk, user_id=creator_pk, time=Decimal("0.50"))
+                for issue_pk, creator_pk in issues_with_creators.iterator()
+                for _ in range(logged_time_per_issue)
+            ),
+            batch_size=batch_size,
+        )
+    return SeededData(
+        user=CustomUser.objects.get(**{"pk": user}),
+        user_pks=user_pks,
+        project_pks=project_pks,
+    )
+
+
+def measure_queryset(queryset: QuerySet, runs: int) -> Timing:
+    return measure(lambda: list(queryset.all()), runs)
+
+
+# The indexes tuned to the access patterns of the project app.
+ACCESS_PATTERN_INDEXES: dict[type[models.Model], list[str]] = {
+    ProjectMembership: ["membership_user_role_idx"],
+    Issue: ["issue_project_board_idx"],
+    ProjectInvitation: ["invitation_pending_idx"],
+    LoggedTime: ["loggedtime_issue_created_idx"],
+}
+
+
+def drop_indexes(indexes: dict[type[models.Model], list[str]]):
+    """
+    Drop the indexes with plain DDL, so that it can run inside the benchmark transaction
+    (the SQLite schema editor cannot be used in an atomic block).
+    """
+    schema_editor = connection.schema_editor()
+    with connection.cursor() as cursor:
+        for model, names in indexes.items():
+            for index in model._meta.indexes:
+                if index.name in names:
+                    cursor.execute(str(index.remove_sql(model, schema_editor)))
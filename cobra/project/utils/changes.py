@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Type
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from cobra.project.models import (
+    DeletionTombstone,
+    Epic,
+    Issue,
+    IssueComment,
+    LoggedTime,
+    ProjectMembership,
+)
+from cobra.project.utils.deletion import get_cascade_deletion
+
+# The position of a change set, i.e. the timestamp and the pk of its last sent row.
+Position = tuple[Any, Any]
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    name: str
+    model: Type[models.Model]
+    project_lookup: str
+    timestamp: str = "modified"
+
+    def get_changed(
+        self, project_pk: Any, since: datetime, after: Optional[Position] = None
+    ) -> QuerySet:
+        """
+        The objects changed since the time, in the order of the change.
+
+        :param project_pk: the pk of the project
+        :param since: the time of the oldest change
+        :param after: the position to continue after, if any
+        :return: QuerySet
+        """
+        queryset = self.model._default_manager.filter(
+            **{self.project_lookup: project_pk, f"{self.timestamp}__gte": since}
+        ).order_by(self.timestamp, "pk")
+        if after is not None:
+            changed, pk = after
+            queryset = queryset.filter(
+                Q(**{f"{self.timestamp}__gt": changed})
+                | Q(**{self.timestamp: changed, "pk__gt": pk})
+            )
+        return queryset
+
+    def get_position(self, obj: models.Model) -> Position:
+        return getattr(obj, self.timestamp), obj.pk
+
+
+CHANGE_SETS: list[ChangeSet] = [
+    ChangeSet("issues", Issue, "project_id"),
+    ChangeSet("epics", Epic, "project_id"),
+    ChangeSet("comments", IssueComment, "issue__project_id"),
+    ChangeSet("logged_time", LoggedTime, "issue__project_id"),
+    ChangeSet("memberships", ProjectMembership, "project_id"),
+    ChangeSet("deleted", DeletionTombstone, "project_id", "deleted"),
+]
+
+
+@dataclass(frozen=True)
+class ProjectChanges:
+    changes: dict[str, list[models.Model]]
+    positions: dict[str, Position]
+    complete: bool
+
+
+def add_tombstone(kind: str, project_id: Optional[Any], object_id: Any):
+    """The tombstones of a cascade deletion are created at once, at its end."""
+    if project_id is None:
+        return
+    if (deletion := get_cascade_deletion()) is not None:
+        deletion.add_tombstone(kind, project_id, object_id)
+    else:
+        DeletionTombstone.objects.create(
+            project_id=project_id, kind=kind, object_id=object_id
+        )
+
+
+def get_issue_project_id(issue_id: Any) -> Optional[Any]:
+    deletion = get_cascade_deletion()
+    if deletion is not None and issue_id in deletion.issues:
+        return deletion.get_issue_project_id(issue_id)
+    return (
+        Issue.objects.filter(pk=issue_id).values_list("project_id", flat=True).first()
+    )
+
+
+def get_project_changes(
+    project_pk: Any,
+    since: datetime,
+    positions: Optional[dict[str, Position]] = None,
+    limit: Optional[int] = None,
+) -> ProjectChanges:
+    """
+    Collect the project objects created or modified since the time,
+    and the tombstones of the objects deleted from the project since then.
+    At most `limit` changes of each kind are collected, the following ones
+    are collected by passing the returned positions again.
+
+    :param project_pk: the pk of the project
+    :param since: the time of the oldest change
+    :param positions: the positions of the change sets to continue after
+    :param limit: the maximum number of the changes of each kind
+    :return: ProjectChanges
+    """
+    positions = dict(positions or {})
+    limit = limit or settings.PROJECT_CHANGES_LIMIT
+    changes = {}
+    complete = True
+    for change_set in CHANGE_SETS:
+        changed = list(
+            change_set.get_changed(project_pk, since, positions.get(change_set.name))[
+                : limit + 1
+            ]
+        )
+        complete = complete and len(changed) <= limit
+        changes[change_set.name] = changed = changed[:limit]
+        if changed:
+            positions[change_set.name] = change_set.get_position(changed[-1])
+    return ProjectChanges(changes=changes, positions=positions, complete=complete)
+
+
+def prune_tombstones() -> int:
+    """Delete the tombstones which are too old to be synced."""
+    deleted, _ = DeletionTombstone.objects.filter(
+        deleted__lt=timezone.now() - settings.PROJECT_TOMBSTONE_LIFETIME
+    ).delete()
+    return deleted
@@ -0,0 +1,102 @@
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Count
+
+from cobra.project.models import EpicIssueCounter, Issue, ProjectIssueCounter
+from cobra.utils.models import add_deltas
+
+COUNTED_ISSUE_FIELDS = ("project_id", "epic_id", "status", "type")
+
+
+class IssueCounterDeltas:
+    """
+    Collect the changes of the per-status and per-type issue counters, so that
+    every counter row is updated once, however many issues have changed.
+    """
+
+    def __init__(self):
+        self.projects: Counter[tuple[Any, str, str]] = Counter()
+        self.epics: Counter[tuple[Any, str, str]] = Counter()
+
+    def add(self, project_id: Any, epic_id: Any, status: str, type_: str, delta: int):
+        self.projects[project_id, status, type_] += delta
+        if epic_id is not None:
+            self.epics[epic_id, status, type_] += delta
+
+    def add_issue(self, issue: Issue, delta: int, loaded: bool = False):
+        """Count the issue in its current state, or as it was loaded."""
+        project_id, epic_id, status, type_ = (
+            issue.get_loaded_value(attname) if loaded else getattr(issue, attname)
+            for attname in COUNTED_ISSUE_FIELDS
+        )
+        self.add(project_id, epic_id, status, type_, delta)
+
+    def add_changed_issue(self, issue: Issue):
+        if any(
+            issue.get_loaded_value(attname) != getattr(issue, attname)
+            for attname in COUNTED_ISSUE_FIELDS
+        ):
+            self.add_issue(issue, -1, loaded=True)
+            self.add_issue(issue, 1)
+
+    def apply(self):
+        for (project_id, status, type_), delta in self.projects.items():
+            add_deltas(
+                ProjectIssueCounter,
+                {"project_id": project_id, "status": status, "type": type_},
+                count=delta,
+            )
+        for (epic_id, status, type_), delta in self.epics.items():
+            add_deltas(
+                EpicIssueCounter,
+                {"epic_id": epic_id, "status": status, "type": type_},
+                count=delta,
+            )
+
+
+def rebuild_issue_counters(project_pks: Optional[Iterable[Any]] = None):
+    """Recompute the issue counters from the issues."""
+    issues = Issue.objects.all()
+    stale_project_counters = ProjectIssueCounter.objects.all()
+    stale_epic_counters = EpicIssueCounter.objects.all()
+    if project_pks is not None:
+        project_pks = list(project_pks)
+        issues = issues.filter(project__pk__in=project_pks)
+        stale_project_counters = stale_project_counters.filter(
+            project__pk__in=project_pks
+        )
+        stale_epic_counters = stale_epic_counters.filter(
+            epic__project__pk__in=project_pks
+        )
+    with transaction.atomic():
+        stale_project_counters.delete()
+        stale_epic_counters.delete()
+        ProjectIssueCounter.objects.bulk_create(
+            ProjectIssueCounter(**row)
+            for row in issues.values("project_id", "status", "type")
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+        EpicIssueCounter.objects.bulk_create(
+            EpicIssueCounter(**row)
+            for row in issues.filter(epic__isnull=False)
+            .values("epic_id", "status", "type")
+            .annotate(count=Count("pk"))
+            .order_by()
+        )
+
+
+def get_issue_counts(counters: Iterable[Any]) -> dict[str, Any]:
+    """Sum the counters up per status and per type."""
+    by_status: Counter[str] = Counter()
+    by_type: Counter[str] = Counter()
+    for counter in counters:
+        by_status[counter.status] += counter.count
+        by_type[counter.type] += counter.count
+    return {
+        "total": sum(by_status.values()),
+        "status": dict(by_status),
+        "type": dict(by_type),
+    }
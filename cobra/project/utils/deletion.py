@@ -0,0 +1,118 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from cobra.project.models import DeletionTombstone, Epic, Issue, LoggedTime, Project
+from cobra.project.utils.counters import IssueCounterDeltas
+from cobra.project.utils.rollups import TimeContribution, TimeRollupDeltas
+
+_local = threading.local()
+
+
+class CascadeDeletion:
+    """
+    Collect the projects, epics and issues deleted together with their related
+    objects. The signal receivers of the objects deleted in the cascade skip
+    the per-row work, their changes are collected and applied once instead,
+    leaving out the aggregates deleted in the cascade as well.
+    """
+
+    def __init__(self):
+        self.projects: set[Any] = set()
+        self.epics: set[Any] = set()
+        self.issues: dict[Any, tuple[Any, Any]] = {}
+        self.time_deltas = TimeRollupDeltas()
+        self.counter_deltas = IssueCounterDeltas()
+        self.tombstones: list[DeletionTombstone] = []
+
+    def add_project(self, project: Project):
+        self.projects.add(project.pk)
+
+    def add_epic(self, epic: Epic):
+        self.epics.add(epic.pk)
+
+    def add_issue(self, issue: Issue):
+        self.issues[issue.pk] = (
+            issue.get_loaded_value("epic_id"),
+            issue.get_loaded_value("project_id"),
+        )
+
+    def add_tombstone(self, kind: str, project_id: Any, object_id: Any):
+        """The objects of a project deleted in the cascade need no tombstones."""
+        if project_id not in self.projects:
+            self.tombstones.append(
+                DeletionTombstone(project_id=project_id, kind=kind, object_id=object_id)
+            )
+
+    def get_issue_project_id(self, issue_id: Any) -> Optional[Any]:
+        """The project of an issue deleted in the cascade."""
+        return self.issues.get(issue_id, (None, None))[1]
+
+    def add_deleted_issue(self, issue: Issue):
+        """Uncount the issue, unless its counters are deleted in the cascade as well."""
+        epic_id, project_id = self.issues[issue.pk]
+        if project_id not in self.projects:
+            self.counter_deltas.add(
+                project_id,
+                None if epic_id in self.epics else epic_id,
+                issue.get_loaded_value("status"),
+                issue.get_loaded_value("type"),
+                -1,
+            )
+
+    def add_deleted_time(self, logged_time: LoggedTime) -> bool:
+        """
+        Collect the logged time deleted together with its issue.
+
+        :param logged_time: the deleted logged time
+        :return: whether the logged time is deleted in the cascade
+        """
+        issue_id = logged_time.get_loaded_value("issue_id")
+        if issue_id not in self.issues:
+            return False
+        epic_id, project_id = self.issues[issue_id]
+        if project_id not in self.projects:
+            self.time_deltas.add(
+                TimeContribution(
+                    issue_id=None,
+                    epic_id=None if epic_id in self.epics else epic_id,
+                    project_id=project_id,
+                    user_id=logged_time.get_loaded_value("user_id"),
+                    day=timezone.localdate(logged_time.created),
+                    time=-logged_time.get_loaded_value("time"),
+                    entries=-1,
+                )
+            )
+        return True
+
+    def apply(self):
+        self.time_deltas.apply()
+        self.counter_deltas.apply()
+        DeletionTombstone.objects.bulk_create(self.tombstones)
+
+
+def get_cascade_deletion() -> Optional[CascadeDeletion]:
+    deletion: Optional[CascadeDeletion] = getattr(_local, "deletion", None)
+    return deletion
+
+
+@contextmanager
+def cascade_deletion() -> Iterator[CascadeDeletion]:
+    """
+    Run the deletion in a transaction applying the collected changes at its end.
+    The deletions started while the deletion is running join it.
+    """
+    deletion = get_cascade_deletion()
+    if deletion is not None:
+        yield deletion
+        return
+    deletion = _local.deletion = CascadeDeletion()
+    try:
+        with transaction.atomic():
+            yield deletion
+            deletion.apply()
+    finally:
+        _local.deletion = None
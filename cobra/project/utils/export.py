@@ -0,0 +1,149 @@
+import csv
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from cobra.project.models import Issue, IssueComment, LoggedTime
+
+ISSUE = "issue"
+LOGGED_TIME = "logged_time"
+COMMENT = "comment"
+
+ISSUE_EXPORT_FIELDS: list[str] = [
+    "id",
+    "title",
+    "description",
+    "type",
+    "status",
+    "estimate",
+    "creator",
+    "assignee",
+    "epic",
+    "parent",
+    "created",
+    "modified",
+]
+LOGGED_TIME_EXPORT_FIELDS: list[str] = [
+    "id",
+    "issue",
+    "user",
+    "time",
+    "comment",
+    "created",
+    "modified",
+]
+COMMENT_EXPORT_FIELDS: list[str] = [
+    "id",
+    "issue",
+    "user",
+    "content",
+    "created",
+    "modified",
+]
+
+ExportRecord = tuple[str, dict[str, Any]]
+
+
+def iter_export_rows(queryset, fields: list[str], chunk_size: int) -> Iterator[dict]:
+    """
+    Iterate over the rows of a queryset with a server-side cursor,
+    the foreign keys are exported by their primary keys.
+    """
+    columns = {
+        field: f"{field}_id"
+        if queryset.model._meta.get_field(field).is_relation
+        else field
+        for field in fields
+    }
+    for row in queryset.values(*columns.values()).iterator(chunk_size=chunk_size):
+        yield {field: row[column] for field, column in columns.items()}
+
+
+def iter_project_export(
+    project_pk: Any, chunk_size: Optional[int] = None
+) -> Iterator[ExportRecord]:
+    """
+    Stream the issues of a project, each followed by its logged time and comments.
+    The three querysets are ordered by the issue and walked side by side, so the
+    memory usage does not depend on the size of the project.
+
+    The cursors are opened one after another, so a related row may belong to
+    an issue deleted or moved to another project in between. Such rows have
+    no issue to follow and are skipped, so that they do not stall their cursor.
+    """
+    chunk_size = chunk_size or settings.PROJECT_EXPORT_CHUNK_SIZE
+    issues = iter_export_rows(
+        Issue.objects.filter(project__pk=project_pk).order_by("pk"),
+        ISSUE_EXPORT_FIELDS,
+        chunk_size,
+    )
+    related = [
+        (
+            kind,
+            iter_export_rows(
+                model.objects.filter(issue__project__pk=project_pk).order_by(
+                    "issue_id", "pk"
+                ),
+                fields,
+                chunk_size,
+            ),
+        )
+        for kind, model, fields in (
+            (LOGGED_TIME, LoggedTime, LOGGED_TIME_EXPORT_FIELDS),
+            (COMMENT, IssueComment, COMMENT_EXPORT_FIELDS),
+        )
+    ]
+    pending: dict[str, Any] = {kind: next(rows, None) for kind, rows in related}
+    for issue in issues:
+        yield ISSUE, issue
+        for kind, rows in related:
+            row = pending[kind]
+            while row is not None and row["issue"] <= issue["id"]:
+                if row["issue"] == issue["id"]:
+                    yield kind, row
+                row = next(rows, None)
+            pending[kind] = row
+
+
+def render_ndjson(records: Iterable[ExportRecord]) -> Iterator[str]:
+    for kind, row in records:
+        yield json.dumps({"record": kind, **row}, cls=DjangoJSONEncoder) + "\n"
+
+
+class EchoBuffer:
+    """
+    A file-like object returning the written value instead of buffering it.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_csv(records: Iterable[ExportRecord]) -> Iterator[str]:
+    header = ["record"]
+    for fields in (
+        ISSUE_EXPORT_FIELDS,
+        LOGGED_TIME_EXPORT_FIELDS,
+        COMMENT_EXPORT_FIELDS,
+    ):
+        header.extend(field for field in fields if field not in header)
+    writer = csv.DictWriter(EchoBuffer(), fieldnames=header)
+    yield writer.writeheader()
+    for kind, row in records:
+        yield writer.writerow({"record": kind, **row})
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    content_type: str
+    extension: str
+    render: Callable[[Iterable[ExportRecord]], Iterator[str]]
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    "ndjson": ExportFormat("application/x-ndjson", "ndjson", render_ndjson),
+    "csv": ExportFormat("text/csv", "csv", render_csv),
+}
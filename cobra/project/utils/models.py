@@ -67,3 +67,16 @@ TASK_TYPES: Sequence[tuple[str, str]] = (
     (USER_STORY, _("User story")),
     (BUG, _("Bug")),
 )
+
+ISSUE = "issue"
+EPIC = "epic"
+COMMENT = "comment"
+LOGGED_TIME = "logged-time"
+MEMBERSHIP = "membership"
+TOMBSTONE_KINDS: Sequence[tuple[str, str]] = (
+    (ISSUE, _("Issue")),
+    (EPIC, _("Epic")),
+    (COMMENT, _("Comment")),
+    (LOGGED_TIME, _("Logged time")),
+    (MEMBERSHIP, _("Membership")),
+)
@@ -0,0 +1,281 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable, Optional, Type
+
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from cobra.project.models import (
+    EpicTimeRollup,
+    Issue,
+    IssueTimeRollup,
+    LoggedTime,
+    ProjectTimeRollup,
+    TimeRollup,
+    UserDailyTimeRollup,
+)
+from cobra.utils.models import add_deltas
+
+
+@dataclass(frozen=True)
+class TimeSummary:
+    estimate: Decimal
+    logged_time: Decimal = Decimal(0)
+    entries: int = 0
+
+    @property
+    def remaining(self) -> Decimal:
+        return max(self.estimate - self.logged_time, Decimal(0))
+
+    @classmethod
+    def from_rollup(
+        cls, estimate: Optional[Decimal], rollup: Optional[TimeRollup]
+    ) -> "TimeSummary":
+        if rollup is None:
+            return cls(estimate=estimate or Decimal(0))
+        return cls(
+            estimate=estimate or Decimal(0),
+            logged_time=rollup.logged_time,
+            entries=rollup.entries,
+        )
+
+
+def add_to_rollup(
+    model: Type[models.Model], lookup: dict[str, Any], time: Decimal, entries: int
+):
+    add_deltas(model, lookup, logged_time=time, entries=entries)
+
+
+@dataclass(frozen=True)
+class TimeContribution:
+    issue_id: Any
+    epic_id: Any
+    project_id: Any
+    user_id: Any
+    day: date
+    time: Decimal
+    entries: int = 1
+
+    def __neg__(self) -> "TimeContribution":
+        return TimeContribution(
+            issue_id=self.issue_id,
+            epic_id=self.epic_id,
+            project_id=self.project_id,
+            user_id=self.user_id,
+            day=self.day,
+            time=-self.time,
+            entries=-self.entries,
+        )
+
+    def get_rollups(self) -> list[tuple[Type[TimeRollup], dict[str, Any]]]:
+        """The rollup rows of the contribution, the issue and the epic are optional."""
+        rollups: list[tuple[Type[TimeRollup], dict[str, Any]]] = []
+        if self.issue_id is not None:
+            rollups.append((IssueTimeRollup, {"issue_id": self.issue_id}))
+        if self.epic_id is not None:
+            rollups.append((EpicTimeRollup, {"epic_id": self.epic_id}))
+        rollups.append((ProjectTimeRollup, {"project_id": self.project_id}))
+        rollups.append(
+            (
+                UserDailyTimeRollup,
+                {
+                    "project_id": self.project_id,
+                    "user_id": self.user_id,
+                    "day": self.day,
+                },
+            )
+        )
+        return rollups
+
+    def apply(self):
+        for model, lookup in self.get_rollups():
+            add_to_rollup(model, lookup, self.time, self.entries)
+
+
+class TimeRollupDeltas:
+    """
+    Collect the time contributions, so that every rollup row is updated once,
+    however many logged time entries have changed.
+    """
+
+    def __init__(self):
+        self.rollups: dict[
+            tuple[Type[TimeRollup], tuple[tuple[str, Any], ...]], tuple[Decimal, int]
+        ] = {}
+
+    def add(self, contribution: TimeContribution):
+        for model, lookup in contribution.get_rollups():
+            key = (model, tuple(lookup.items()))
+            time, entries = self.rollups.get(key, (Decimal(0), 0))
+            self.rollups[key] = (
+                time + contribution.time,
+                entries + contribution.entries,
+            )
+
+    def apply(self):
+        for (model, lookup), (time, entries) in self.rollups.items():
+            add_to_rollup(model, dict(lookup), time, entries)
+
+
+def get_issue_epic_and_project(
+    logged_time: LoggedTime, issue_id: Any
+) -> tuple[Any, Any]:
+    """
+    Use the issue cached on the instance, if it is the same issue.
+    Otherwise, fetch the epic and the project ids only.
+    """
+    issue_field = LoggedTime._meta.get_field("issue")
+    if issue_field.is_cached(logged_time) and logged_time.issue.pk == issue_id:
+        return logged_time.issue.epic_id, logged_time.issue.project_id
+    return (
+        Issue.objects.filter(pk=issue_id).values_list("epic_id", "project_id").first()
+    ) or (None, None)
+
+
+def get_loaded_time_contribution(
+    logged_time: LoggedTime,
+) -> Optional[TimeContribution]:
+    """Return the contribution of the logged time as it was loaded from the database."""
+    issue_id = logged_time.get_loaded_value("issue_id")
+    epic_id, project_id = get_issue_epic_and_project(logged_time, issue_id)
+    if project_id is None:
+        return None
+    return TimeContribution(
+        issue_id=issue_id,
+        epic_id=epic_id,
+        project_id=project_id,
+        user_id=logged_time.get_loaded_value("user_id"),
+        day=timezone.localdate(logged_time.created),
+        time=logged_time.get_loaded_value("time"),
+    )
+
+
+def logged_time_changed(logged_time: LoggedTime) -> bool:
+    return any(
+        logged_time.get_loaded_value(attname) != getattr(logged_time, attname)
+        for attname in ("issue_id", "user_id", "time")
+    )
+
+
+def move_issue_time(issue: Issue):
+    """
+    Move the logged time of the issue between the epics and projects rollups,
+    if the issue has been moved since it was loaded.
+    """
+    previous_epic_id = issue.get_loaded_value("epic_id")
+    previous_project_id = issue.get_loaded_value("project_id")
+    if previous_epic_id == issue.epic_id and previous_project_id == issue.project_id:
+        return
+    rollup = IssueTimeRollup.objects.filter(issue_id=issue.pk).first()
+    if rollup is None or not rollup.entries:
+        return
+    if previous_epic_id != issue.epic_id:
+        if previous_epic_id is not None:
+            add_to_rollup(
+                EpicTimeRollup,
+                {"epic_id": previous_epic_id},
+                -rollup.logged_time,
+                -rollup.entries,
+            )
+        if issue.epic_id is not None:
+            add_to_rollup(
+                EpicTimeRollup,
+                {"epic_id": issue.epic_id},
+                rollup.logged_time,
+                rollup.entries,
+            )
+    if previous_project_id != issue.project_id:
+        add_to_rollup(
+            ProjectTimeRollup,
+            {"project_id": previous_project_id},
+            -rollup.logged_time,
+            -rollup.entries,
+        )
+        add_to_rollup(
+            ProjectTimeRollup,
+            {"project_id": issue.project_id},
+            rollup.logged_time,
+            rollup.entries,
+        )
+        for row in get_daily_time(LoggedTime.objects.filter(issue_id=issue.pk)):
+            for project_id, sign in ((previous_project_id, -1), (issue.project_id, 1)):
+                add_to_rollup(
+                    UserDailyTimeRollup,
+                    {
+                        "project_id": project_id,
+                        "user_id": row["user_id"],
+                        "day": row["day"],
+                    },
+                    sign * row["logged_time"],
+                    sign * row["entries"],
+                )
+
+
+def move_issues_time(issues: Iterable[Issue]):
+    for issue in issues:
+        move_issue_time(issue)
+        issue.remember_loaded_values()
+
+
+def get_daily_time(queryset: "models.QuerySet[LoggedTime]", *fields: str):
+    """Sum the logged time per user and (local) day, grouped by the fields as well."""
+    return (
+        queryset.annotate(
+            day=TruncDate("created", tzinfo=timezone.get_current_timezone())
+        )
+        .values(*fields, "user_id", "day")
+        .annotate(logged_time=Sum("time"), entries=Count("pk"))
+        .order_by()
+    )
+
+
+def rebuild_time_rollups(project_pks: Optional[Iterable[Any]] = None):
+    """
+    Recompute the time rollups from the logged time, e.g. after the raw SQL writes
+    or the bulk operations which bypass the signals.
+    """
+    logged_time = LoggedTime.objects.all()
+    rollups: dict[str, Type[TimeRollup]] = {
+        "IssueTimeRollup": IssueTimeRollup,
+        "EpicTimeRollup": EpicTimeRollup,
+        "ProjectTimeRollup": ProjectTimeRollup,
+        "UserDailyTimeRollup": UserDailyTimeRollup,
+    }
+    project_lookups = {
+        "IssueTimeRollup": "issue__project__pk__in",
+        "EpicTimeRollup": "epic__project__pk__in",
+        "ProjectTimeRollup": "project__pk__in",
+        "UserDailyTimeRollup": "project__pk__in",
+    }
+    if project_pks is not None:
+        project_pks = list(project_pks)
+        logged_time = logged_time.filter(issue__project__pk__in=project_pks)
+    totals = {"logged_time": Sum("time"), "entries": Count("pk")}
+    rows = {
+        "IssueTimeRollup": logged_time.values("issue_id"),
+        "EpicTimeRollup": logged_time.filter(issue__epic__isnull=False).values(
+            epic_id=F("issue__epic_id")
+        ),
+        "ProjectTimeRollup": logged_time.values(project_id=F("issue__project_id")),
+    }
+    with transaction.atomic():
+        for name, model in rollups.items():
+            stale_rollups = model._default_manager.all()
+            if project_pks is not None:
+                stale_rollups = stale_rollups.filter(
+                    **{project_lookups[name]: project_pks}
+                )
+            stale_rollups.delete()
+        for name, queryset in rows.items():
+            rollups[name]._default_manager.bulk_create(
+                rollups[name](**row) for row in queryset.annotate(**totals).order_by()
+            )
+        UserDailyTimeRollup.objects.bulk_create(
+            UserDailyTimeRollup(**row)
+            for row in get_daily_time(
+                logged_time.annotate(project_id=F("issue__project_id")), "project_id"
+            )
+        )
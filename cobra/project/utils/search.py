@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from functools import reduce
+from operator import add, and_, itemgetter, or_
+from typing import Any, Optional, Type
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections, models
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+
+from cobra.project.models import Epic, Issue, IssueComment
+
+# The weights of the search vectors and the matching LIKE fallback ranks.
+WEIGHTS = {"A": 1.0, "B": 0.4, "C": 0.2, "D": 0.1}
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    kind: str
+    model: Type[models.Model]
+    weighted_fields: dict[str, str]
+    project_lookup: str
+    title_lookup: str
+    index_name: str
+    issue_lookup: Optional[str] = None
+
+    def get_search_vector(self) -> SearchVector:
+        return reduce(
+            add,
+            (
+                SearchVector(
+                    field, weight=weight, config=settings.PROJECT_SEARCH_CONFIG
+                )
+                for field, weight in self.weighted_fields.items()
+            ),
+        )
+
+    def get_index(self) -> GinIndex:
+        """
+        The GIN index matching the search vector expression of the queries.
+        The indexes are created by the migrations, which must be kept in sync.
+        """
+        return GinIndex(self.get_search_vector(), name=self.index_name)
+
+
+SEARCH_TARGETS: dict[str, SearchTarget] = {
+    target.kind: target
+    for target in (
+        SearchTarget(
+            kind="issue",
+            model=Issue,
+            weighted_fields={"title": "A", "description": "B"},
+            project_lookup="project_id",
+            title_lookup="title",
+            index_name="issue_search_idx",
+        ),
+        SearchTarget(
+            kind="epic",
+            model=Epic,
+            weighted_fields={"title": "A", "description": "B"},
+            project_lookup="project_id",
+            title_lookup="title",
+            index_name="epic_search_idx",
+        ),
+        SearchTarget(
+            kind="comment",
+            model=IssueComment,
+            weighted_fields={"content": "B"},
+            project_lookup="issue__project_id",
+            title_lookup="issue__title",
+            index_name="issuecomment_search_idx",
+            issue_lookup="issue_id",
+        ),
+    )
+}
+
+
+def supports_full_text_search(using: str) -> bool:
+    return connections[using].vendor == "postgresql"
+
+
+def search_queryset(queryset: QuerySet, target: SearchTarget, text: str) -> QuerySet:
+    """
+    Filter the queryset down to the rows matching the text and annotate them
+    with their `search_rank`. Postgres uses the GIN-indexed search vectors,
+    the other databases fall back to LIKE matching every word in any field.
+    """
+    if supports_full_text_search(queryset.db):
+        query = SearchQuery(
+            text, config=settings.PROJECT_SEARCH_CONFIG, search_type="websearch"
+        )
+        vector = target.get_search_vector()
+        matches: QuerySet = queryset.annotate(
+            search_vector=vector, search_rank=SearchRank(vector, query)
+        ).filter(search_vector=query)
+        return matches
+    words = text.split()
+    if not words:
+        no_matches: QuerySet = queryset.none()
+        return no_matches
+    like_matches: QuerySet = queryset.filter(
+        reduce(
+            and_,
+            (
+                reduce(
+                    or_,
+                    (
+                        Q(**{f"{field}__icontains": word})
+                        for field in target.weighted_fields
+                    ),
+                )
+                for word in words
+            ),
+        )
+    ).annotate(
+        search_rank=reduce(
+            add,
+            (
+                Case(
+                    When(
+                        **{f"{field}__icontains": word},
+                        then=Value(WEIGHTS[weight]),
+                    ),
+                    default=Value(0.0),
+                    output_field=FloatField(),
+                )
+                for field, weight in target.weighted_fields.items()
+                for word in words
+            ),
+        )
+    )
+    return like_matches
+
+
+def search(
+    text: str,
+    kinds: list[str],
+    limit: int,
+    visibility: dict[str, Optional[Q]],
+    project_pk: Optional[Any] = None,
+) -> list[dict[str, Any]]:
+    """
+    Search every kind of the objects and merge the best `limit` results by rank.
+    `visibility` maps the kinds to the conditions restricting the visible rows.
+    """
+    results: list[dict[str, Any]] = []
+    for kind in kinds:
+        target = SEARCH_TARGETS[kind]
+        queryset = target.model._default_manager.all()
+        if (condition := visibility.get(kind)) is not None:
+            queryset = queryset.filter(condition)
+        if project_pk is not None:
+            queryset = queryset.filter(**{target.project_lookup: project_pk})
+        rows = (
+            search_queryset(queryset, target, text)
+            .annotate(
+                result_project=F(target.project_lookup),
+                result_title=F(target.title_lookup),
+                result_issue=F(target.issue_lookup or "pk"),
+            )
+            .order_by("-search_rank", "-pk")
+            .values(
+                "pk", "result_project", "result_title", "result_issue", "search_rank"
+            )[:limit]
+        )
+        results.extend(
+            {
+                "kind": kind,
+                "id": row["pk"],
+                "project": row["result_project"],
+                "issue": row["result_issue"] if target.issue_lookup else None,
+                "title": row["result_title"],
+                "rank": row["search_rank"],
+            }
+            for row in rows
+        )
+    results.sort(key=itemgetter("rank"), reverse=True)
+    return results[:limit]
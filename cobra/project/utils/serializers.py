@@ -1,11 +1,17 @@
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Optional, Union, cast
+from typing import Any, Iterable, Optional, Union, cast
 
 from django.contrib.auth.models import AnonymousUser
+from django.db.models import BigIntegerField, CharField, F, Manager, QuerySet, Value
+from rest_flex_fields import is_expanded, is_included
+from rest_framework.fields import ReadOnlyField
 from rest_framework.request import Request
 from rest_framework.serializers import Serializer
 
-from cobra.project.models import Issue, Project
+from cobra.project.models import Epic, Issue, Project, ProjectMembership
+from cobra.project.querysets import ProjectQueryset
+from cobra.project.utils.counters import get_issue_counts
 from cobra.user.models import CustomUser
 
 
@@ -35,3 +41,140 @@ class IssueSerializerMixin(BaseSerializerMixin):
 COMMON_USER_FIELDS: list[str] = ["id", "username", "full_name"]
 COMMON_PROJECT_FIELDS: list[str] = ["id", "title", "slug", "creator"]
 COMMON_ISSUE_FIELDS: list[str] = ["id", "title", "type", "status", "assignee"]
+# The columns rendered by `COMMON_USER_FIELDS`
+COMMON_USER_COLUMNS: list[str] = ["id", "username", "first_name", "last_name"]
+
+
+def prefetch_project_members(
+    queryset: QuerySet[Project], request: Request
+) -> ProjectQueryset[Project]:
+    """
+    Prefetch the members only when the project serializer renders them:
+    the primary keys by default and the `COMMON_USER_COLUMNS` when expanded.
+    """
+    projects = cast(ProjectQueryset[Project], queryset)
+    if not is_included(request, "members"):
+        return projects
+    if is_expanded(request, "members"):
+        return projects.prefetch_members(*COMMON_USER_COLUMNS)
+    return projects.prefetch_members()
+
+
+class IssueCountsField(ReadOnlyField):
+    """
+    The issue counts per status and per type, read from the maintained counters,
+    e.g. `Project.issue_counters`. Use `prefetch_issue_counters` when listing.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("source", "issue_counters")
+        super().__init__(**kwargs)
+
+    def to_representation(self, value: Manager) -> dict[str, Any]:
+        counts: dict[str, Any] = get_issue_counts(value.all())
+        return counts
+
+
+def prefetch_issue_counters(queryset: QuerySet, request: Request) -> QuerySet:
+    if is_expanded(request, "issue_counts"):
+        return queryset.prefetch_related("issue_counters")
+    return queryset
+
+
+@dataclass
+class IssueRelations:
+    """
+    The primary keys of the objects an issue is related to.
+    Projects and the epics/issues are mapped to the project they belong to
+    (the projects to their creators), the users to None.
+    """
+
+    projects: dict[Any, Any] = field(default_factory=dict)
+    users: set[Any] = field(default_factory=set)
+    members: set[Any] = field(default_factory=set)
+    epics: dict[Any, Any] = field(default_factory=dict)
+    issues: dict[Any, Any] = field(default_factory=dict)
+
+
+def load_issue_relations(
+    project_pk: Any = None,
+    user_pks: Iterable[Any] = (),
+    epic_pks: Iterable[Any] = (),
+    parent_pks: Iterable[Any] = (),
+) -> IssueRelations:
+    """
+    Resolve the objects referenced by one or more issues of a project with
+    a single UNION ALL query of the (kind, primary key, project) rows:
+    the project, the active users and their memberships in the project,
+    the epics and the parent issues.
+    """
+    user_pks = {pk for pk in user_pks if pk is not None}
+    epic_pks = {pk for pk in epic_pks if pk is not None}
+    parent_pks = {pk for pk in parent_pks if pk is not None}
+
+    def rows(queryset: QuerySet, kind: str, pk: str, project: Any) -> QuerySet:
+        relation_rows: QuerySet = (
+            queryset.order_by()
+            .annotate(
+                relation_kind=Value(kind, output_field=CharField()),
+                relation_pk=F(pk),
+                relation_project=project,
+            )
+            .values_list("relation_kind", "relation_pk", "relation_project")
+        )
+        return relation_rows
+
+    parts = []
+    if project_pk is not None:
+        parts.append(
+            rows(
+                Project.objects.filter(pk=project_pk), "project", "pk", F("creator_id")
+            )
+        )
+        if user_pks:
+            parts.append(
+                rows(
+                    ProjectMembership.objects.filter(
+                        project__pk=project_pk, user__pk__in=user_pks
+                    ),
+                    "member",
+                    "user_id",
+                    F("project_id"),
+                )
+            )
+    if user_pks:
+        parts.append(
+            rows(
+                CustomUser.objects.filter(**{"pk__in": user_pks}, is_active=True),
+                "user",
+                "pk",
+                Value(None, output_field=BigIntegerField()),
+            )
+        )
+    if epic_pks:
+        parts.append(
+            rows(Epic.objects.filter(pk__in=epic_pks), "epic", "pk", F("project_id"))
+        )
+    if parent_pks:
+        parts.append(
+            rows(
+                Issue.objects.filter(pk__in=parent_pks), "issue", "pk", F("project_id")
+            )
+        )
+
+    relations = IssueRelations()
+    if not parts:
+        return relations
+    first, *rest = parts
+    for kind, pk, project in first.union(*rest, all=True) if rest else first:
+        if kind == "project":
+            relations.projects[pk] = project
+        elif kind == "member":
+            relations.members.add(pk)
+        elif kind == "user":
+            relations.users.add(pk)
+        elif kind == "epic":
+            relations.epics[pk] = project
+        elif kind == "issue":
+            relations.issues[pk] = project
+    return relations
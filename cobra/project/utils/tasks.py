@@ -1,8 +1,19 @@
+from typing import Any, Iterator, Optional, Sequence
+
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from cobra.project.models import ProjectInvitation
 from cobra.services.email.models import TemplateEmail
+from cobra.utils.models import get_object_or_none
+
+
+def get_project_invitation_or_none(invitation_pk: Any) -> Optional[ProjectInvitation]:
+    """Load the invitation with everything its email needs in a single query."""
+    return get_object_or_none(
+        ProjectInvitation.objects.select_related("inviter", "user", "project"),
+        pk=invitation_pk,
+    )
 
 
 def get_project_invitation_email_to_user(
@@ -26,3 +37,13 @@ def get_project_invitation_email_to_user(
             "context": context,
         },
     )
+
+
+def iter_project_invitations(
+    invitation_pks: Sequence[Any], chunk_size: int
+) -> Iterator[ProjectInvitation]:
+    """Load the invitations with their users and projects, one chunk of pks at a time."""
+    for start in range(0, len(invitation_pks), chunk_size):
+        yield from ProjectInvitation.objects.filter(
+            pk__in=invitation_pks[start : start + chunk_size]
+        ).select_related("inviter", "user", "project")
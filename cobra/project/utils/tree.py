@@ -0,0 +1,113 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, Optional
+
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+
+from cobra.project.models import Issue, IssueTimeRollup
+
+# The database backends supporting `WITH RECURSIVE` in a subquery.
+RECURSIVE_CTE_VENDORS = {"postgresql", "sqlite"}
+
+SUBTREE_PKS_SQL = """
+WITH RECURSIVE subtree (id, depth) AS (
+    SELECT {table}.id, 0 FROM {table} WHERE {table}.id = %s
+    UNION
+    SELECT child.id, subtree.depth + 1
+    FROM {table} child INNER JOIN subtree ON child.parent_id = subtree.id
+    WHERE subtree.depth < %s
+)
+SELECT subtree.id FROM subtree
+"""
+
+
+def collect_subtree_pks(root_pk: Any, max_depth: int) -> set[Any]:
+    """Walk the subtree level by level, with one query per level."""
+    pks = {root_pk}
+    level = {root_pk}
+    for _ in range(max_depth):
+        level = (
+            set(Issue.objects.filter(parent__pk__in=level).values_list("pk", flat=True))
+            - pks
+        )
+        if not level:
+            break
+        pks |= level
+    return pks
+
+
+def get_subtree(
+    queryset: QuerySet[Issue], root_pk: Any, max_depth: int
+) -> QuerySet[Issue]:
+    """
+    Filter the issues down to the subtree of the root issue, the root included.
+    The subtree is resolved with a recursive CTE inside the query, where supported.
+    """
+    if connections[queryset.db].vendor not in RECURSIVE_CTE_VENDORS:
+        return queryset.filter(pk__in=collect_subtree_pks(root_pk, max_depth))
+    sql = SUBTREE_PKS_SQL.format(
+        table=connections[queryset.db].ops.quote_name(Issue._meta.db_table)
+    )
+    return queryset.filter(pk__in=RawSQL(sql, (root_pk, max_depth)))
+
+
+@dataclass
+class IssueTreeNode:
+    issue: Issue
+    depth: int
+    children: list["IssueTreeNode"] = field(default_factory=list)
+    estimate_total: Decimal = Decimal(0)
+    logged_time_total: Decimal = Decimal(0)
+
+    def __iter__(self) -> Iterator["IssueTreeNode"]:
+        """Iterate over the subtree in the pre-order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    @property
+    def logged_time(self) -> Decimal:
+        rollup: Optional[IssueTimeRollup] = getattr(self.issue, "time_rollup", None)
+        return rollup.logged_time if rollup is not None else Decimal(0)
+
+    def roll_up(self):
+        """Sum the estimates and the logged time up the subtree, children first."""
+        for node in reversed(list(self)):
+            node.estimate_total = node.issue.estimate + sum(
+                (child.estimate_total for child in node.children), Decimal(0)
+            )
+            node.logged_time_total = node.logged_time + sum(
+                (child.logged_time_total for child in node.children), Decimal(0)
+            )
+
+
+def build_issue_tree(issues: Iterable[Issue], root_pk: Any) -> Optional[IssueTreeNode]:
+    """
+    Link the issues into a tree by their parents. The issues which are not
+    reachable from the root, e.g. because their parent has been filtered out,
+    are left out.
+    """
+    root: Optional[Issue] = None
+    children: dict[Any, list[Issue]] = defaultdict(list)
+    for issue in sorted(issues, key=attrgetter("pk")):
+        if issue.pk == root_pk:
+            root = issue
+        else:
+            children[issue.parent_id].append(issue)
+    if root is None:
+        return None
+    root_node = IssueTreeNode(issue=root, depth=0)
+    stack = [root_node]
+    while stack:
+        node = stack.pop()
+        for child in children.pop(node.issue.pk, []):
+            child_node = IssueTreeNode(issue=child, depth=node.depth + 1)
+            node.children.append(child_node)
+            stack.append(child_node)
+    return root_node
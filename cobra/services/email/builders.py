@@ -1,39 +1,68 @@
-from typing import Generic, Optional, Type, TypeVar
+from typing import Any, Generic, Optional, Type, TypeVar
 
-from django import forms
+from django.core.exceptions import ValidationError
 from django.core.mail import EmailMessage
+from django.core.validators import validate_email
 
 from cobra.services.email.base import BaseEmailBuilder, BaseEmailModel
 
 ModelType = TypeVar("ModelType", bound=BaseEmailModel)
 
 
+def is_valid_email(value: Any) -> bool:
+    if not isinstance(value, str):
+        return False
+    try:
+        validate_email(value)
+    except ValidationError:
+        return False
+    return True
+
+
 class TemplateEmailBuilder(BaseEmailBuilder, Generic[ModelType]):
-    class EmailTemplateForm(forms.Form):
-        mail_from = forms.EmailField()
-        mail_to = forms.EmailField()
-        subject = forms.CharField()
+    """
+    Builds the email message of the model on the first access and memoizes it
+    on the instance, so the later changes of the instance are not reflected.
+    The emails without a subject or with an invalid address are built as `None`.
+    """
+
+    name = "email"
+
+    def __set_name__(self, owner: Type[ModelType], name: str):
+        self.name = name
 
     def __get__(
         self, instance: ModelType, owner: Optional[Type[ModelType]] = None
     ) -> Optional[EmailMessage]:
-        form_class = self.EmailTemplateForm
-        form = form_class(
-            data={
-                field: getattr(instance, field, None)
-                for field in form_class().fields.keys()
-            }
+        if instance is None:
+            return self
+        email_message = self.build(instance)
+        # The builder is a non-data descriptor, the instance attribute takes precedence.
+        instance.__dict__[self.name] = email_message
+        return email_message
+
+    def build(self, instance: ModelType) -> Optional[EmailMessage]:
+        subject = str(getattr(instance, "subject", None) or "").strip()
+        mail_from = str(getattr(instance, "mail_from", None) or "").strip()
+        mail_to = getattr(instance, "mail_to", None) or []
+        recipients = [
+            recipient.strip()
+            for recipient in ([mail_to] if isinstance(mail_to, str) else mail_to)
+        ]
+        if not (
+            subject
+            and is_valid_email(mail_from)
+            and recipients
+            and all(map(is_valid_email, recipients))
+        ):
+            return None
+        msg = EmailMessage(
+            subject=subject,
+            body=str(instance.content),
+            from_email=mail_from,
+            to=recipients,
+            **getattr(instance, "extra_email_message_kwargs", {}),
         )
-        if form.is_valid():
-            cd = form.cleaned_data
-            msg = EmailMessage(
-                subject=cd.get("subject"),
-                body=str(instance.content),
-                from_email=cd.get("mail_from"),
-                to=[cd.get("mail_to")],
-                **instance.extra_email_message_kwargs,
-            )
-            if instance.is_html:
-                msg.content_subtype = "html"
-            return msg
-        return None
+        if getattr(instance, "is_html", False):
+            msg.content_subtype = "html"
+        return msg
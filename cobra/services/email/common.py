@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from cobra.services.email.models import TemplateEmail
 from cobra.services.email.services import TemplateEmailService
 
@@ -5,3 +7,9 @@ from cobra.services.email.services import TemplateEmailService
 def send_mail(email: TemplateEmail):
     template_email_service = TemplateEmailService()
     template_email_service.send(email)
+
+
+def send_mails(emails: Iterable[TemplateEmail]) -> int:
+    template_email_service = TemplateEmailService()
+    sent: int = template_email_service.send_many(emails)
+    return sent
@@ -3,10 +3,10 @@ from pathlib import Path
 from typing import Any, ClassVar, Optional, TypedDict, Union
 
 from django.http import HttpRequest
-from django.template.loader import render_to_string
 
 from cobra.services.email.base import BaseEmailModel
 from cobra.services.email.builders import TemplateEmailBuilder
+from cobra.services.email.rendering import render_email_template
 
 
 class TemplateParams(TypedDict):
@@ -18,7 +18,7 @@ class TemplateParams(TypedDict):
 class TemplateEmail(BaseEmailModel):
     subject: str
     mail_from: str
-    mail_to: list[str]
+    mail_to: Union[str, list[str]]
     template: TemplateParams
     is_html: bool = True
     request: Optional[HttpRequest] = None
@@ -27,8 +27,8 @@ class TemplateEmail(BaseEmailModel):
     email: ClassVar[TemplateEmailBuilder] = TemplateEmailBuilder["TemplateEmail"]()
 
     def get_content(self):
-        return render_to_string(
-            template_name=self.template.get("path", ""),
-            context=self.template.get("context", ""),
+        return render_email_template(
+            self.template.get("path", ""),
+            context=self.template.get("context"),
             request=self.request,
         )
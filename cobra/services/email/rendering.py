@@ -0,0 +1,40 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.template.loader import get_template
+from django.utils.autoreload import file_changed  # type: ignore[attr-defined]
+
+
+@lru_cache(maxsize=None)
+def get_email_template(path: str) -> Any:
+    """
+    Load and compile the template once per path. Unlike the cached template
+    loader, the cache does not depend on the `DEBUG` setting.
+    """
+    return get_template(path)
+
+
+def render_email_template(
+    path: Union[str, Path],
+    context: Optional[dict[str, Any]] = None,
+    request: Optional[HttpRequest] = None,
+) -> str:
+    rendered: str = get_email_template(str(path)).render(context, request)
+    return rendered
+
+
+@receiver(setting_changed)
+def clear_email_templates(setting: str, **kwargs):
+    if setting == "TEMPLATES":
+        get_email_template.cache_clear()
+
+
+@receiver(file_changed)
+def clear_changed_email_templates(file_path: Path, **kwargs):
+    """The development server reloads the changed templates without a restart."""
+    if file_path.suffix != ".py":
+        get_email_template.cache_clear()
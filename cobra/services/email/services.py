@@ -1,14 +1,97 @@
-from typing import Optional, cast
+import time
+from typing import Iterable, Optional, cast
 
-from django.core.mail import EmailMessage
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 
 from cobra.services.email.base import BaseEmailService
 from cobra.services.email.models import TemplateEmail
 
 
 class TemplateEmailService(BaseEmailService):
-    def send(self, mail: TemplateEmail) -> Optional[EmailMessage]:
+    def send(
+        self, mail: TemplateEmail, connection: Optional[BaseEmailBackend] = None
+    ) -> Optional[EmailMessage]:
         email_message: Optional[EmailMessage]
         if email_message := mail.email:
+            if connection is not None:
+                email_message.connection = connection
             email_message.send()
         return cast(Optional[EmailMessage], email_message)
+
+    def send_many(self, mails: Iterable[TemplateEmail]) -> int:
+        """Send the emails in batches over a single backend connection."""
+        with BatchEmailDelivery() as delivery:
+            for mail in mails:
+                delivery.add(mail)
+        return delivery.sent
+
+
+class BatchEmailDelivery:
+    """
+    Queues the template emails and sends them with `send_messages` over
+    a single backend connection, which is opened once and kept open between
+    the batches. A batch is flushed when `batch_size` emails are queued, or when
+    an email is added `max_delay` seconds after the first queued one. The rest
+    is flushed and the connection is closed when the delivery is closed.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        max_delay: Optional[float] = None,
+        connection: Optional[BaseEmailBackend] = None,
+    ):
+        self.batch_size: int = batch_size or settings.EMAIL_BATCH_SIZE
+        self.max_delay: float = (
+            settings.EMAIL_BATCH_MAX_DELAY if max_delay is None else max_delay
+        )
+        self.connection = connection or get_connection()
+        self.queue: list[EmailMessage] = []
+        self.queued_at: Optional[float] = None
+        self.sent: int = 0
+        self.is_open = False
+
+    def __enter__(self) -> "BatchEmailDelivery":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, mail: TemplateEmail) -> Optional[EmailMessage]:
+        """Queue the email, the invalid emails are skipped."""
+        email_message: Optional[EmailMessage] = mail.email
+        if email_message is None:
+            return None
+        if not self.queue:
+            self.queued_at = time.monotonic()
+        self.queue.append(email_message)
+        if self.is_due():
+            self.flush()
+        return email_message
+
+    def is_due(self) -> bool:
+        return len(self.queue) >= self.batch_size or (
+            self.queued_at is not None
+            and time.monotonic() - self.queued_at >= self.max_delay
+        )
+
+    def flush(self) -> int:
+        messages, self.queue, self.queued_at = self.queue, [], None
+        if not messages:
+            return 0
+        if not self.is_open:
+            self.connection.open()
+            self.is_open = True
+        sent = self.connection.send_messages(messages) or 0
+        self.sent += sent
+        return sent
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            if self.is_open:
+                self.connection.close()
+                self.is_open = False
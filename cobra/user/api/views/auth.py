@@ -1,6 +1,7 @@
 from typing import cast
 
 from django.contrib.auth.models import AbstractUser
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from djoser import views as djoser_views
 from djoser.conf import settings as djoser_settings
@@ -17,6 +18,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
+from cobra.outbox.models import OutboxMessage
 from cobra.user.api.exceptions import InactiveUserException
 from cobra.user.api.serializers.auth.requests import (
     ActivationRequestSerializer,
@@ -120,9 +122,12 @@ class AuthUserViewSet(djoser_views.UserViewSet):
         :param serializer: Serializer
         :return: None
         """
-        user: UserCreatePasswordRetypeSerializer = serializer.save()
-        if djoser_settings.SEND_ACTIVATION_EMAIL:
-            send_activation_email.apply_async(kwargs={"user_pk": user.pk})
+        with transaction.atomic():
+            user: UserCreatePasswordRetypeSerializer = serializer.save()
+            if djoser_settings.SEND_ACTIVATION_EMAIL:
+                OutboxMessage.objects.enqueue(
+                    send_activation_email, {"user_pk": user.pk}
+                )
 
     def perform_update(self, serializer: UserSerializer):
         """
@@ -130,10 +135,13 @@ class AuthUserViewSet(djoser_views.UserViewSet):
         :param serializer: UserSerializer
         :return: None
         """
-        super(djoser_views.UserViewSet, self).perform_update(serializer)
         user = serializer.instance
-        if djoser_settings.SEND_ACTIVATION_EMAIL and not user.is_active:
-            send_activation_email.apply_async(kwargs={"user_pk": user.pk})
+        if not djoser_settings.SEND_ACTIVATION_EMAIL or user.is_active:
+            super(djoser_views.UserViewSet, self).perform_update(serializer)
+            return
+        with transaction.atomic():
+            super(djoser_views.UserViewSet, self).perform_update(serializer)
+            OutboxMessage.objects.enqueue(send_activation_email, {"user_pk": user.pk})
 
     @action(detail=False, methods=["post"])
     def activation(self, request, *args, **kwargs):
@@ -171,7 +179,7 @@ class AuthUserViewSet(djoser_views.UserViewSet):
         if not djoser_settings.SEND_ACTIVATION_EMAIL or not user:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        send_activation_email.apply_async(kwargs={"user_pk": user.pk})
+        OutboxMessage.objects.enqueue(send_activation_email, {"user_pk": user.pk})
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -191,7 +199,7 @@ class AuthUserViewSet(djoser_views.UserViewSet):
         user: AbstractUser = serializer.get_user()
         if not user:
             return Response(status=status.HTTP_400_BAD_REQUEST)
-        send_password_reset_email.apply_async(kwargs={"user_pk": user.pk})
+        OutboxMessage.objects.enqueue(send_password_reset_email, {"user_pk": user.pk})
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -10,6 +10,7 @@ from cobra.user.utils.serializers import (
     USER_SEARCH_FIELDS,
     CustomUserSerializer,
 )
+from cobra.utils.pagination import DateJoinedCursorPagination
 
 
 class UserListViewSet(GenericViewSet, ListModelMixin, FlexFieldsMixin):
@@ -18,4 +19,6 @@ class UserListViewSet(GenericViewSet, ListModelMixin, FlexFieldsMixin):
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = USER_SEARCH_FIELDS
     ordering_fields = USER_ORDERING_FIELDS
+    ordering = DateJoinedCursorPagination.ordering
+    pagination_class = DateJoinedCursorPagination
     permission_classes = [IsAuthenticated]
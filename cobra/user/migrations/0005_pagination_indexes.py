@@ -0,0 +1,19 @@
+# Generated by Django 4.0 on 2026-10-17 15:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0004_alter_customuser_first_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["-date_joined", "-id"], name="user_date_joined_idx"
+            ),
+        ),
+    ]
@@ -22,6 +22,11 @@ class CustomUser(AbstractUser):
 
     objects: UserManager[AbstractUser] = CustomUserManager[AbstractUser]()  # type: ignore
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["-date_joined", "-id"], name="user_date_joined_idx"),
+        ]
+
     def __repr__(self):
         return f"CustomUser(username='{self.username}')"
 
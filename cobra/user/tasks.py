@@ -3,19 +3,22 @@ from typing import Optional
 
 from celery import shared_task
 
-from cobra.services.email.common import send_mail
+from cobra.services.email.common import send_mail, send_mails
 from cobra.services.email.models import TemplateEmail
 from cobra.user.models import CustomUser
 from cobra.user.utils.tasks import (
     get_activation_email_to_user,
     get_password_reset_email_to_user,
     get_user_or_none_by_pk,
+    get_users_by_pks,
 )
+from cobra.utils.tasks import instrumented_task
 
 logger = logging.getLogger("celery")
 
 
 @shared_task
+@instrumented_task
 def send_activation_email(user_pk):
     user: Optional[CustomUser] = get_user_or_none_by_pk(user_pk)
     if user is None:
@@ -29,6 +32,7 @@ def send_activation_email(user_pk):
 
 
 @shared_task
+@instrumented_task
 def send_password_reset_email(user_pk):
     user: Optional[CustomUser] = get_user_or_none_by_pk(user_pk)
     if user is None:
@@ -39,3 +43,14 @@ def send_password_reset_email(user_pk):
     logger.info("Sending the password reset email to the user with pk=%s", user_pk)
 
     send_mail(email)
+
+
+@shared_task
+@instrumented_task
+def send_activation_emails(user_pks):
+    """Send the activation emails of many users at once over a single connection."""
+    users = get_users_by_pks(user_pks)
+
+    logger.info("Sending %s activation emails", len(users))
+
+    send_mails(get_activation_email_to_user(user) for user in users)
@@ -0,0 +1,39 @@
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from cobra.user.factories import UserFactory
+from cobra.user.models import CustomUser
+from cobra.utils.test import EndpointBudget, EndpointBudgetMixin
+
+
+class UserEndpointBudgetTest(EndpointBudgetMixin, APITestCase):
+    client: APIClient
+    user: CustomUser
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        UserFactory.create_batch(100)
+
+    def setUp(self) -> None:
+        self.client.force_authenticate(self.user)
+
+    def test_user_list(self):
+        self.assert_within_budget(
+            EndpointBudget(1), "get", reverse("user:customuser-list")
+        )
+        self.assert_within_budget(
+            EndpointBudget(1),
+            "get",
+            reverse("user:customuser-list"),
+            data={"search": self.user.username[:3], "ordering": "username"},
+        )
+
+    def test_me(self):
+        self.assert_within_budget(EndpointBudget(0), "get", reverse("user:api-auth-me"))
+        self.assert_within_budget(
+            EndpointBudget(1),
+            "patch",
+            reverse("user:api-auth-me"),
+            data={"first_name": "Renamed"},
+        )
@@ -1,12 +1,17 @@
 from unittest import mock
 
 from django.conf import settings
+from django.core import mail
 from django.test import TestCase
 from djoser.conf import settings as djoser_settings
 
 from cobra.user.factories import UserFactory
 from cobra.user.models import CustomUser
-from cobra.user.tasks import send_activation_email, send_password_reset_email
+from cobra.user.tasks import (
+    send_activation_email,
+    send_activation_emails,
+    send_password_reset_email,
+)
 from cobra.user.utils.auth import get_uid_and_token_for_user
 
 
@@ -99,3 +104,17 @@ class CeleryTasksTest(TestCase):
                 "context": context,
             },
         )
+
+    @mock.patch("cobra.user.utils.tasks.logger")
+    def test_send_activation_emails(self, mock_logger: mock.MagicMock):
+        users = [self.user, *UserFactory.create_batch(2)]
+        non_existent_pk = max(user.pk for user in users) + 1
+        with self.assertNumQueries(1):
+            send_activation_emails([*(user.pk for user in users), non_existent_pk])
+        mock_logger.error.assert_called_once_with(
+            "Failed to get a user by pk=%s", non_existent_pk
+        )
+        self.assertEqual(
+            [message.to[0] for message in mail.outbox],
+            [user.email for user in users],
+        )
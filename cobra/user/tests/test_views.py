@@ -1,7 +1,6 @@
 from collections import ChainMap
 from datetime import timedelta
-from typing import Any
-from unittest import mock
+from typing import Any, Iterable, cast
 
 from django.conf import settings
 from django.contrib.auth.hashers import check_password
@@ -19,6 +18,7 @@ from rest_framework.response import Response
 from rest_framework.test import APIClient, APITestCase, URLPatternsTestCase
 from rest_framework.views import APIView
 
+from cobra.outbox.models import OutboxMessage
 from cobra.user.api.views import (
     AuthUserViewSet,
     JWTTokenObtainPairView,
@@ -27,6 +27,7 @@ from cobra.user.api.views import (
 )
 from cobra.user.factories import UserFactory
 from cobra.user.models import CustomUser
+from cobra.user.tasks import send_activation_email, send_password_reset_email
 from cobra.user.utils.auth import get_uid_and_token_for_user
 from cobra.user.utils.test import USER_REGISTER_DATA
 from cobra.utils.test import fake
@@ -57,15 +58,20 @@ class TestAuthUserViewSet(TestCase):
             {"post": "reset_password_confirm"}
         )
 
-    @mock.patch("cobra.user.api.views.auth.send_activation_email")
-    def test_user_registration(self, mock_send_activation_email: mock.MagicMock):
+    def get_outbox_kwargs(self, task) -> list[dict[str, Any]]:
+        kwargs = OutboxMessage.objects.filter(task=task.name).values_list(
+            "kwargs", flat=True
+        )
+        return list(cast(Iterable[dict[str, Any]], kwargs))
+
+    def test_user_registration(self):
         user_count = CustomUser.objects.count()
         request: HttpRequest = self.request_factory.post(
             self.register_url, data=self.default_user_register_data
         )
         response: Response = self.register_view(request)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        mock_send_activation_email.apply_async.assert_called_once()
+        self.assertEqual(len(self.get_outbox_kwargs(send_activation_email)), 1)
         self.assertEqual(CustomUser.objects.count(), user_count + 1)
         user: AbstractUser = CustomUser.objects.get(
             username=self.default_user_register_data.get("username")
@@ -80,15 +86,12 @@ class TestAuthUserViewSet(TestCase):
             DJOSER,
         )
     )
-    @mock.patch("cobra.user.api.views.auth.send_activation_email")
-    def test_register_with_disabled_user_activation_mail(
-        self, mock_send_activation_email: mock.MagicMock
-    ):
+    def test_register_with_disabled_user_activation_mail(self):
         request: HttpRequest = self.request_factory.post(
             self.register_url, data=self.default_user_register_data
         )
         self.register_view(request)
-        self.assertEqual(mock_send_activation_email.call_count, 0)
+        self.assertFalse(OutboxMessage.objects.exists())
         user: AbstractUser = CustomUser.objects.get(
             username=self.default_user_register_data.get("username")
         )
@@ -110,23 +113,20 @@ class TestAuthUserViewSet(TestCase):
     )
     def test_register_responses(self, user_data, response_code, error_field):
         user_data = ChainMap(user_data, self.default_user_register_data)
-        with mock.patch("cobra.user.api.views.auth.send_activation_email"):
-            request = self.request_factory.post(self.register_url, data=user_data)
-            response: Response = self.register_view(request)
-            self.assertEqual(response.status_code, response_code)
-            if error_field:
-                self.assertIn(error_field, response.data)
-            else:
-                self.assertTrue(
-                    CustomUser.objects.filter(
-                        username=user_data.get("username")
-                    ).exists()
-                )
-                for field in CustomUser.REQUIRED_FIELDS + [
-                    CustomUser.USERNAME_FIELD,
-                    djoser_settings.USER_ID_FIELD,
-                ]:
-                    self.assertIn(field, response.data)
+        request = self.request_factory.post(self.register_url, data=user_data)
+        response: Response = self.register_view(request)
+        self.assertEqual(response.status_code, response_code)
+        if error_field:
+            self.assertIn(error_field, response.data)
+        else:
+            self.assertTrue(
+                CustomUser.objects.filter(username=user_data.get("username")).exists()
+            )
+            for field in CustomUser.REQUIRED_FIELDS + [
+                CustomUser.USERNAME_FIELD,
+                djoser_settings.USER_ID_FIELD,
+            ]:
+                self.assertIn(field, response.data)
 
     def test_user_activation_view(self):
         user: CustomUser = UserFactory(is_active=False)
@@ -174,33 +174,27 @@ class TestAuthUserViewSet(TestCase):
                 "Received an unexpected error detail in the response.",
             )
 
-    @mock.patch("cobra.user.api.views.auth.send_activation_email")
-    def test_user_resend_activation_view(
-        self, mock_send_activation_email: mock.MagicMock
-    ):
+    def test_user_resend_activation_view(self):
         user: CustomUser = UserFactory(is_active=False)
         request: HttpRequest = self.request_factory.post(
             self.resend_activation_url, data={"email": user.email}
         )
         response: Response = self.resend_activation_view(request)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        mock_send_activation_email.apply_async.assert_called_once_with(
-            kwargs={"user_pk": user.pk}
+        self.assertEqual(
+            self.get_outbox_kwargs(send_activation_email), [{"user_pk": user.pk}]
         )
 
     @override_settings(DJOSER={"SEND_ACTIVATION_EMAIL": False})
     def test_user_resend_activation_view_send_activation_email_disabled(self):
-        with mock.patch(
-            "cobra.user.api.views.auth.send_activation_email"
-        ) as mock_send_activation_email:
-            user: CustomUser = UserFactory(is_active=False)
-            request: HttpRequest = self.request_factory.post(
-                self.resend_activation_url, data={"email": user.email}
-            )
-            response: Response = self.resend_activation_view(request)
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertIsNone(response.data)
-            mock_send_activation_email.apply_async.assert_not_called()
+        user: CustomUser = UserFactory(is_active=False)
+        request: HttpRequest = self.request_factory.post(
+            self.resend_activation_url, data={"email": user.email}
+        )
+        response: Response = self.resend_activation_view(request)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(response.data)
+        self.assertFalse(OutboxMessage.objects.exists())
 
     @override_settings(
         DJOSER=ChainMap(
@@ -212,19 +206,15 @@ class TestAuthUserViewSet(TestCase):
         )
     )
     def test_user_resend_activation_view_disable_email_not_found(self):
-        with mock.patch(
-            "cobra.user.api.views.auth.send_activation_email"
-        ) as mock_send_activation_email:
-            request: HttpRequest = self.request_factory.post(
-                self.resend_activation_url, data={"email": fake.email()}
-            )
-            response: Response = self.resend_activation_view(request)
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertIsNone(response.data)
-            mock_send_activation_email.apply_async.assert_not_called()
+        request: HttpRequest = self.request_factory.post(
+            self.resend_activation_url, data={"email": fake.email()}
+        )
+        response: Response = self.resend_activation_view(request)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(response.data)
+        self.assertFalse(OutboxMessage.objects.exists())
 
-    @mock.patch("cobra.user.api.views.auth.send_activation_email")
-    def test_user_resend_activation_view_responses(self, mock_send_activation_email):
+    def test_user_resend_activation_view_responses(self):
         # Test an active user wishing to resend the activation email.
         user: CustomUser = UserFactory(is_active=True)
         request: HttpRequest = self.request_factory.post(
@@ -232,7 +222,7 @@ class TestAuthUserViewSet(TestCase):
         )
         response: Response = self.resend_activation_view(request)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        mock_send_activation_email.apply_async.assert_not_called()
+        self.assertFalse(OutboxMessage.objects.exists())
         self.assertEqual(
             response.data[0].code,
             "email_not_found",
@@ -245,15 +235,14 @@ class TestAuthUserViewSet(TestCase):
         )
         response: Response = self.resend_activation_view(request)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        mock_send_activation_email.apply_async.assert_not_called()
+        self.assertFalse(OutboxMessage.objects.exists())
         self.assertEqual(
             response.data[0].code,
             "email_not_found",
             "Received an unexpected error detail in the response.",
         )
 
-    @mock.patch("cobra.user.api.views.auth.send_password_reset_email")
-    def test_reset_password_view(self, mock_send_password_reset_email: mock.MagicMock):
+    def test_reset_password_view(self):
         user: CustomUser = UserFactory()
         user.set_password(fake.password())
         request: HttpRequest = self.request_factory.post(
@@ -261,31 +250,25 @@ class TestAuthUserViewSet(TestCase):
         )
         response: Response = self.reset_password_view(request)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        mock_send_password_reset_email.apply_async.assert_called_once_with(
-            kwargs={"user_pk": user.pk}
+        self.assertEqual(
+            self.get_outbox_kwargs(send_password_reset_email), [{"user_pk": user.pk}]
         )
 
-    @mock.patch("cobra.user.api.views.auth.send_password_reset_email")
-    def test_reset_password_view_user_inactive(
-        self, mock_send_password_reset_email: mock.MagicMock
-    ):
+    def test_reset_password_view_user_inactive(self):
         user: CustomUser = UserFactory(is_active=False)
         request: HttpRequest = self.request_factory.post(
             self.reset_password_confirm_url, data={"email": user.email}
         )
         response: Response = self.reset_password_view(request)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        mock_send_password_reset_email.apply_async.assert_not_called()
+        self.assertFalse(OutboxMessage.objects.exists())
         self.assertEqual(
             response.data[0].code,
             "email_not_found",
             "Received an unexpected error detail in the response.",
         )
 
-    @mock.patch("cobra.user.api.views.auth.send_password_reset_email")
-    def test_reset_password_view_non_existent_email(
-        self, mock_send_password_reset_email: mock.MagicMock
-    ):
+    def test_reset_password_view_non_existent_email(self):
         request: HttpRequest = self.request_factory.post(
             self.reset_password_confirm_url, data={"email": fake.email()}
         )
@@ -296,7 +279,7 @@ class TestAuthUserViewSet(TestCase):
             "email_not_found",
             "Received an unexpected error detail in the response.",
         )
-        mock_send_password_reset_email.apply_async.assert_not_called()
+        self.assertFalse(OutboxMessage.objects.exists())
 
     @override_settings(
         DJOSER=ChainMap(
@@ -308,16 +291,13 @@ class TestAuthUserViewSet(TestCase):
         )
     )
     def test_reset_password_view_disable_email_not_found(self):
-        with mock.patch(
-            "cobra.user.api.views.auth.send_password_reset_email"
-        ) as mock_send_password_reset_email:
-            request: HttpRequest = self.request_factory.post(
-                self.reset_password_confirm_url, data={"email": fake.email()}
-            )
-            response: Response = self.reset_password_view(request)
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertIsNone(response.data)
-            mock_send_password_reset_email.apply_async.assert_not_called()
+        request: HttpRequest = self.request_factory.post(
+            self.reset_password_confirm_url, data={"email": fake.email()}
+        )
+        response: Response = self.reset_password_view(request)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(response.data)
+        self.assertFalse(OutboxMessage.objects.exists())
 
     @parameterized.expand(
         [
@@ -491,3 +471,37 @@ class TestJwtViews(APITestCase, URLPatternsTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         credentials: JWTPair = response.data
         self.assertIsNotNone(credentials.get("access"))
+
+
+class TestUserListViewSet(APITestCase):
+    client: APIClient
+
+    def setUp(self):
+        self.url: str = reverse("user:customuser-list")
+        self.user: CustomUser = UserFactory()
+        self.client.force_authenticate(self.user)
+
+    def test_users_are_paginated(self):
+        UserFactory.create_batch(4)
+        response: Response = self.client.get(self.url, data={"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        usernames = [user["username"] for user in response.data["results"]]
+        while next_url := response.data["next"]:
+            response = self.client.get(next_url)
+            usernames.extend(user["username"] for user in response.data["results"])
+        self.assertEqual(
+            sorted(usernames),
+            sorted(
+                CustomUser.objects.filter(is_active=True).values_list(
+                    "username", flat=True
+                )
+            ),
+        )
+
+    def test_users_ordering(self):
+        UserFactory.create_batch(3)
+        response: Response = self.client.get(self.url, data={"ordering": "username"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        usernames = [user["username"] for user in response.data["results"]]
+        self.assertEqual(usernames, sorted(usernames))
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Any, Iterable, Optional, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
@@ -21,6 +21,16 @@ def get_user_or_none_by_pk(user_pk) -> Optional[AbstractUser]:
         return None
 
 
+def get_users_by_pks(user_pks: Iterable[Any]) -> list[CustomUser]:
+    """Resolve the users with a single query, in the order of the pks."""
+    user_pks = list(user_pks)
+    users = cast(dict[Any, CustomUser], CustomUser.objects.in_bulk(user_pks))
+    for user_pk in user_pks:
+        if user_pk not in users:
+            logger.error("Failed to get a user by pk=%s", user_pk)
+    return [users[user_pk] for user_pk in user_pks if user_pk in users]
+
+
 def get_activation_email_to_user(user: CustomUser) -> TemplateEmail:
     context = {
         "user": user,
@@ -0,0 +1,37 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass
+class Timing:
+    runs: int
+    min: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_durations(cls, durations: list[float]) -> "Timing":
+        durations = sorted(durations)
+        return cls(
+            runs=len(durations),
+            min=durations[0],
+            median=statistics.median(durations),
+            p95=durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        )
+
+    def __str__(self):
+        return (
+            f"runs={self.runs} min={self.min * 1000:.2f}ms "
+            f"median={self.median * 1000:.2f}ms p95={self.p95 * 1000:.2f}ms"
+        )
+
+
+def measure(func: Callable[[], Any], runs: int) -> Timing:
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return Timing.from_durations(durations)
@@ -4,8 +4,9 @@ from typing import Any, Optional, Type, TypeVar, Union, cast
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
-from django.db import models
-from django.db.models import Manager, QuerySet
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Manager, QuerySet
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -23,6 +24,17 @@ def get_default_admin() -> AbstractUser:
     return admin
 
 
+def SET_NULL_AND_TOUCH(collector, field, sub_objs, using):
+    """
+    `SET_NULL`, which bumps the `modified` timestamps of the related objects as well,
+    so that the clients syncing the changes by the timestamps see the cleared relation.
+    """
+    collector.add_field_update(field, None, sub_objs)
+    collector.add_field_update(
+        sub_objs.model._meta.get_field("modified"), timezone.now(), sub_objs
+    )
+
+
 class TimeStampedModel(models.Model):
     created = models.DateTimeField(_("created at"), auto_now_add=True)
     modified = models.DateTimeField(_("modified at"), auto_now=True)
@@ -57,6 +69,33 @@ class TimeStampedAndCreatedByUser(TimeStampedModel):
         abstract = True
 
 
+class TracksLoadedValuesModel(models.Model):
+    """
+    Remembers the field values the instance was loaded with, so that the changes
+    can be detected on save without re-reading the row.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_loaded_value(self, attname: str) -> Any:
+        loaded_values: dict[str, Any] = getattr(self, "_loaded_values", {})
+        return loaded_values.get(attname, getattr(self, attname))
+
+    def remember_loaded_values(self):
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+
 class UUIDPrimaryKeyModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
@@ -87,3 +126,24 @@ def get_object_or_none(
         return instance
     except (queryset.model.DoesNotExist, queryset.model.MultipleObjectsReturned):
         return None
+
+
+def add_deltas(model: Type[models.Model], lookup: dict[str, Any], **deltas: Any):
+    """
+    Add the deltas to the counter columns of the row matching the lookup with
+    a single atomic UPDATE. The row is created if there is none and all the deltas
+    are positive. The zero deltas are skipped.
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    queryset = model._default_manager.filter(**lookup)
+    expressions = {name: F(name) + delta for name, delta in deltas.items()}
+    if queryset.update(**expressions) or any(delta < 0 for delta in deltas.values()):
+        return
+    try:
+        with transaction.atomic():
+            model._default_manager.create(**lookup, **deltas)
+    except IntegrityError:
+        # The row has been created concurrently.
+        queryset.update(**expressions)
@@ -0,0 +1,140 @@
+import json
+from typing import Any, Optional, Sequence
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, _reverse_ordering
+
+
+class ModifiedCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the (modified, id) pair, which is backed by the composite
+    indexes of the paginated models.
+
+    Unlike the DRF cursor, which encodes only the first ordering field and skips
+    the ties with an offset, the cursor encodes the values of all the ordering fields
+    and the page is selected with a row comparison, e.g.
+    `modified < %s OR (modified = %s AND id < %s)`. The id is appended to the ordering
+    when it is missing, so the key is unique and the cursors never carry an offset.
+    The ordering fields must not be nullable.
+    """
+
+    ordering: tuple[str, ...] = ("-modified", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    tie_breaker = "id"
+
+    def get_ordering(self, request, queryset, view) -> tuple[str, ...]:
+        ordering = super().get_ordering(request, queryset, view)
+        if not {self.tie_breaker, f"-{self.tie_breaker}"} & set(ordering):
+            descending = ordering[0].startswith("-") if ordering else True
+            ordering += (f"-{self.tie_breaker}" if descending else self.tie_breaker,)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None) -> Optional[list[Any]]:
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        position = self.cursor.position if self.cursor is not None else None
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(self.decode_position(str(position)), reverse)
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following = len(results) > len(self.page)
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = position is not None, has_following
+        else:
+            self.has_next, self.has_previous = has_following, position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_keyset_filter(self, values: Sequence[str], reverse: bool) -> Q:
+        """
+        Build the condition matching the rows following the key in the direction
+        of the page: the rows equal on the leading fields and past the key on the next one.
+
+        :param values: the values of the ordering fields of the key
+        :param reverse: whether the page is read backwards
+        :return: Q
+        """
+        field_names = [order.lstrip("-") for order in self.ordering]
+        condition = Q(pk__in=[])
+        for index, order in enumerate(self.ordering):
+            lookup = "lt" if order.startswith("-") != reverse else "gt"
+            condition |= Q(
+                **dict(zip(field_names[:index], values[:index])),
+                **{f"{field_names[index]}__{lookup}": values[index]},
+            )
+        return condition
+
+    def decode_position(self, position: str) -> list[str]:
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return [str(value) for value in values]
+
+    def _get_position_from_instance(self, instance, ordering) -> str:
+        values = []
+        for order in ordering:
+            field_name = order.lstrip("-")
+            if isinstance(instance, dict):
+                values.append(str(instance[field_name]))
+            else:
+                values.append(str(getattr(instance, field_name)))
+        return json.dumps(values)
+
+    def get_next_link(self) -> Optional[str]:
+        """
+        The next page follows the last row of the page. An empty page is only
+        returned before the first row, so its next page is the first one.
+        """
+        if not self.has_next:
+            return None
+        position = (
+            self._get_position_from_instance(self.page[-1], self.ordering)
+            if self.page
+            else None
+        )
+        # The stubs type the position as int, the DRF cursor stores it as str.
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=position)  # type: ignore
+        )
+
+    def get_previous_link(self) -> Optional[str]:
+        """
+        The previous page precedes the first row of the page. An empty page is only
+        returned after the last row, so its previous page is the last one.
+        """
+        if not self.has_previous:
+            return None
+        position = (
+            self._get_position_from_instance(self.page[0], self.ordering)
+            if self.page
+            else None
+        )
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=position)  # type: ignore
+        )
+
+
+class DateJoinedCursorPagination(ModifiedCursorPagination):
+    ordering = ("-date_joined", "-id")
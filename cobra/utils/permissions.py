@@ -0,0 +1,42 @@
+from typing import Any, Sequence, cast
+
+from rest_framework.permissions import AND, NOT, OR, BasePermission
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+
+def has_object_permissions_bulk(
+    permission: BasePermission, request: Request, view: APIView, objs: Sequence[Any]
+) -> list[bool]:
+    """
+    Evaluate the object permission for a sequence of objects at once.
+    The permissions composed with `|`, `&` and `~` are evaluated operand by operand,
+    the ones without the bulk API fall back to the per-object check.
+
+    :param permission: BasePermission
+    :param request: Request
+    :param view: APIView
+    :param objs: Sequence[Any]
+    :return: list[bool]
+    """
+    bulk_check = getattr(permission, "has_object_permissions_bulk", None)
+    if bulk_check is not None:
+        results: list[bool] = bulk_check(request, view, objs)
+        return results
+    # The operands of the composed permissions are missing from the stubs.
+    operands = cast(Any, permission)
+    if isinstance(permission, (AND, OR)):
+        combine = all if isinstance(permission, AND) else any
+        return [
+            combine(pair)
+            for pair in zip(
+                has_object_permissions_bulk(operands.op1, request, view, objs),
+                has_object_permissions_bulk(operands.op2, request, view, objs),
+            )
+        ]
+    if isinstance(permission, NOT):
+        return [
+            not result
+            for result in has_object_permissions_bulk(operands.op1, request, view, objs)
+        ]
+    return [permission.has_object_permission(request, view, obj) for obj in objs]
@@ -1,5 +1,10 @@
+from typing import Any, Type, cast
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
 
 
 class CustomValidationErrorsMixin:
@@ -9,3 +14,38 @@ class CustomValidationErrorsMixin:
         raise serializers.ValidationError(
             {key: self.default_error_messages.get(key, _("Invalid input data."))}
         )
+
+
+class RelatedIdField(serializers.Field):
+    """
+    A foreign key represented by its `<field>_id` attribute. The input is only
+    converted to the type of the related primary key, checking that the related
+    object exists is left to the serializer, so that it can be done in a batch.
+    """
+
+    default_error_messages = {
+        "incorrect_type": PrimaryKeyRelatedField.default_error_messages[
+            "incorrect_type"
+        ],
+        "does_not_exist": PrimaryKeyRelatedField.default_error_messages[
+            "does_not_exist"
+        ],
+    }
+
+    def __init__(self, model: Type[models.Model], **kwargs):
+        self.model = model
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data: Any) -> Any:
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return cast(models.Field, self.model._meta.pk).to_python(data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+    def to_representation(self, value: Any) -> Any:
+        return value
+
+    def get_does_not_exist_error(self, pk_value: Any) -> str:
+        return self.error_messages["does_not_exist"].format(pk_value=pk_value)
@@ -0,0 +1,56 @@
+import functools
+import logging
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.db import connections
+
+logger = logging.getLogger("celery")
+
+
+@dataclass
+class TaskMetrics:
+    name: str
+    queries: int = 0
+    duration: float = 0.0
+
+    def __str__(self):
+        return (
+            f"task={self.name} queries={self.queries} "
+            f"duration={self.duration * 1000:.2f}ms"
+        )
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def instrumented_task(func: Callable) -> Callable:
+    """
+    Log the number of the database queries and the duration of every run of the task.
+    Apply it below the `shared_task` decorator, so that the task keeps its name.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics = TaskMetrics(name=f"{func.__module__}.{func.__name__}")
+        counter = QueryCounter()
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(counter))
+                return func(*args, **kwargs)
+        finally:
+            metrics.queries = counter.count
+            metrics.duration = time.perf_counter() - start
+            logger.info("Task metrics: %s", metrics)
+
+    return wrapper
@@ -1,11 +1,19 @@
+import time
 from collections import OrderedDict
-from typing import Any, Dict, TypedDict, Union, cast
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, TypedDict, Union, cast
 from unittest import TestCase
 
 from django.conf import settings
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
 from factory import Factory
 from faker import Faker
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from cobra.utils.benchmarks import Timing
 
 
 class PropertyData(TypedDict):
@@ -78,6 +86,62 @@ class TestFactoryMixin:
             )
 
 
+@dataclass(frozen=True)
+class EndpointBudget:
+    queries: int
+    p95_ms: float = 200.0
+
+
+class EndpointBudgetMixin:
+    """
+    Asserts the number of SQL queries and the p95 latency of an API endpoint.
+    The safe methods are repeated `budget_runs` times, the query budget
+    applies to every run. The latency budget is only asserted when
+    the `ENDPOINT_BUDGET_CHECK_LATENCY` setting is enabled, and it is scaled with
+    the `ENDPOINT_BUDGET_LATENCY_SCALE` setting to account for slower machines.
+    """
+
+    budget_runs: int = 10
+
+    def assert_within_budget(
+        self,
+        budget: EndpointBudget,
+        method: str,
+        url: str,
+        data: Optional[Any] = None,
+        expected_status: int = status.HTTP_200_OK,
+    ) -> Response:
+        test_case = cast(TestCase, self)
+        client = cast(APIClient, getattr(self, "client"))
+        runs = self.budget_runs if method.lower() in ("get", "head", "options") else 1
+        durations: list[float] = []
+        for _ in range(runs):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response: Response = getattr(client, method.lower())(
+                    url, data=data, format="json"
+                )
+                durations.append(time.perf_counter() - start)
+            test_case.assertEqual(
+                response.status_code, expected_status, getattr(response, "data", None)
+            )
+            queries = [query["sql"] for query in context.captured_queries]
+            test_case.assertLessEqual(
+                len(queries),
+                budget.queries,
+                f"{method.upper()} {url} executed {len(queries)} queries, "
+                f"the budget is {budget.queries}:\n" + "\n".join(queries),
+            )
+        if settings.ENDPOINT_BUDGET_CHECK_LATENCY:
+            timing = Timing.from_durations(durations)
+            test_case.assertLessEqual(
+                timing.p95 * 1000,
+                budget.p95_ms * settings.ENDPOINT_BUDGET_LATENCY_SCALE,
+                f"{method.upper()} {url} exceeded the latency budget: {timing}",
+            )
+        return response
+
+
 languages = settings.LANGUAGES
 
 locales: Dict[str, Union[int, float]] = OrderedDict(
@@ -0,0 +1,295 @@
+import hashlib
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Optional, Sequence, cast
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.db.models import Count, Max, Model, QuerySet, prefetch_related_objects
+from django.http import Http404
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag, urlencode
+from rest_flex_fields import FIELDS_PARAM, OMIT_PARAM, is_expanded
+from rest_framework.generics import GenericAPIView
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework.permissions import BasePermission
+
+from cobra.utils.exceptions import PreconditionFailed
+from cobra.utils.permissions import has_object_permissions_bulk
+
+Validators = tuple[str, Optional[datetime]]
+
+
+class BulkObjectPermissionsMixin:
+    """
+    Re-checks the object permissions of the listed objects with a single evaluation
+    per page. The actions listing objects of another type than the view's own
+    (e.g. nested actions) declare their permissions in `bulk_permission_classes`.
+    The expanded related objects listed in `bulk_permission_related_fields` are
+    checked as well, the denied ones are hidden (represented as null) while their
+    rows are kept, so that expanding a field does not change the listed rows.
+
+    The objects are checked after the page has been cut, so a page may hold fewer
+    than `page_size` objects, or none at all, while the `next` link is still set.
+    The cursor follows the last row of the unfiltered page, so no row is skipped.
+    The visibility itself is filtered in the queryset by the filter backends,
+    the re-check only drops the rows the object permissions deny.
+    """
+
+    bulk_permission_classes: dict[str, list[Any]] = {}
+    bulk_permission_related_fields: list[str] = []
+
+    def get_bulk_permissions(self) -> list[BasePermission]:
+        view = cast(GenericAPIView, self)
+        permission_classes = self.bulk_permission_classes.get(
+            getattr(view, "action", "")
+        )
+        if permission_classes is None:
+            return cast(list[BasePermission], view.get_permissions())
+        return [permission() for permission in permission_classes]
+
+    def filter_objects_by_permissions(self, objs: Sequence[Any]) -> list[Any]:
+        view = cast(GenericAPIView, self)
+        objs = list(objs)
+        if not objs:
+            return objs
+        related_fields = [
+            field
+            for field in self.bulk_permission_related_fields
+            if is_expanded(view.request, field)
+        ]
+        if related_fields:
+            prefetch_related_objects(objs, *related_fields)
+        permitted = [True] * len(objs)
+        hidden = {field: [False] * len(objs) for field in related_fields}
+        for permission in self.get_bulk_permissions():
+            permitted = [
+                previous and current
+                for previous, current in zip(
+                    permitted,
+                    has_object_permissions_bulk(permission, view.request, view, objs),
+                )
+            ]
+            for field in related_fields:
+                related = [getattr(obj, field) for obj in objs]
+                related_permitted = has_object_permissions_bulk(
+                    permission,
+                    view.request,
+                    view,
+                    [obj for obj in related if obj is not None],
+                )
+                related_results = iter(related_permitted)
+                related_flags = [
+                    obj is None or next(related_results) for obj in related
+                ]
+                hidden[field] = [
+                    previous or not current
+                    for previous, current in zip(hidden[field], related_flags)
+                ]
+        for field, flags in hidden.items():
+            for obj, hide in zip(objs, flags):
+                if hide:
+                    obj._meta.get_field(field).set_cached_value(obj, None)
+        return [obj for obj, allowed in zip(objs, permitted) if allowed]
+
+    def paginate_queryset(self, queryset) -> Optional[list[Any]]:
+        page = super().paginate_queryset(queryset)  # type: ignore
+        if page is None:
+            return None
+        return self.filter_objects_by_permissions(page)
+
+
+class MemoizedObjectMixin:
+    """
+    Resolves the view's object and checks its permissions once per request.
+    The views calling `get_object()` from both `get_serializer_context()`
+    and the action itself reuse the first result.
+    """
+
+    _memoized_object: Any
+
+    def get_object(self) -> Any:
+        try:
+            return self._memoized_object
+        except AttributeError:
+            self._memoized_object = super().get_object()  # type: ignore
+            return self._memoized_object
+
+
+class ListOmittedFieldsMixin:
+    """
+    Leaves the heavy fields out of the list payloads, and out of the queries,
+    unless the client asks for a sparse fieldset with the `fields` query parameter.
+    The omitted fields are declared per action in `list_omitted_fields`.
+    """
+
+    list_omitted_fields: dict[str, list[str]] = {}
+
+    def get_omitted_fields(self) -> list[str]:
+        view = cast(GenericAPIView, self)
+        if view.request.method != "GET" or view.request.query_params.get(FIELDS_PARAM):
+            return []
+        return self.list_omitted_fields.get(getattr(view, "action", None) or "", [])
+
+    def defer_omitted_fields(self, queryset: QuerySet) -> QuerySet:
+        omitted = self.get_omitted_fields()
+        return queryset.defer(*omitted) if omitted else queryset
+
+    def get_serializer(self, *args, **kwargs):
+        view = cast(GenericAPIView, self)
+        omitted = self.get_omitted_fields()
+        if omitted and kwargs.get("many"):
+            # The `omit` argument replaces the query parameter, merge them instead.
+            requested = [
+                name
+                for value in view.request.query_params.getlist(OMIT_PARAM)
+                for name in value.split(",")
+                if name
+            ]
+            kwargs.setdefault(OMIT_PARAM, omitted + requested)
+        return super().get_serializer(*args, **kwargs)
+
+
+def make_etag(*parts: Any) -> str:
+    return quote_etag(hashlib.md5(":".join(map(str, parts)).encode()).hexdigest())
+
+
+class ConditionalRequestMixin:
+    """
+    Validates the conditional requests against the `modified` timestamps.
+    The validators follow the modification of the object itself, not of the
+    related objects included in its representation. The list validators are derived
+    from the latest modification and the number of the filtered rows,
+    so that the deleted rows change them as well, and from the query string.
+    The ETags carry the full precision of the timestamps, so they tell apart
+    the writes made within the second of the `Last-Modified` date.
+    """
+
+    def get_object_validators(self, obj: Model) -> Validators:
+        modified = getattr(obj, "modified", None)
+        return make_etag(obj._meta.label, obj.pk, modified), modified
+
+    def get_list_validators(self, queryset: QuerySet) -> Validators:
+        """
+        Aggregate the validators of the list with one extra query per request.
+        The cursor, the page size, the sparse fieldsets and the filters change
+        the representation, so the normalized query string is a part of the ETag.
+        """
+        view = cast(GenericAPIView, self)
+        query = urlencode(sorted(view.request.query_params.lists()), doseq=True)
+        aggregate = queryset.order_by().aggregate(
+            last_modified=Max("modified"), count=Count("pk")
+        )
+        return (
+            make_etag(
+                queryset.model._meta.label,
+                query,
+                aggregate["count"],
+                aggregate["last_modified"],
+            ),
+            aggregate["last_modified"],
+        )
+
+    def evaluate_preconditions(
+        self, validators: Validators
+    ) -> Optional[HttpResponseBase]:
+        """
+        Return the 304 response of a fresh cached representation. Raise
+        `PreconditionFailed` when `If-Match` or `If-Unmodified-Since` does not hold.
+        """
+        view = cast(GenericAPIView, self)
+        etag, last_modified = validators
+        response = get_conditional_response(
+            cast(WSGIRequest, view.request),
+            etag=etag,
+            last_modified=(
+                timegm(last_modified.utctimetuple())
+                if last_modified is not None
+                else None
+            ),
+        )
+        if response is None:
+            return None
+        if response.status_code == PreconditionFailed.status_code:
+            raise PreconditionFailed()
+        return self.set_validators(response, validators)
+
+    def set_validators(
+        self, response: HttpResponseBase, validators: Validators
+    ) -> HttpResponseBase:
+        etag, last_modified = validators
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(
+                timegm(last_modified.utctimetuple())
+            )
+        return response
+
+
+class ConditionalRetrieveModelMixin(ConditionalRequestMixin, RetrieveModelMixin):
+    """
+    Answers `If-None-Match` and `If-Modified-Since` with 304 responses.
+    The object is fetched once when the view memoizes it (`MemoizedObjectMixin`).
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        validators = self.get_object_validators(self.get_object())
+        not_modified = self.evaluate_preconditions(validators)
+        if not_modified is not None:
+            return not_modified
+        return self.set_validators(
+            super().retrieve(request, *args, **kwargs), validators
+        )
+
+
+class ConditionalListModelMixin(ConditionalRequestMixin, ListModelMixin):
+    """Answers `If-None-Match` and `If-Modified-Since` with 304 responses."""
+
+    def list(self, request, *args, **kwargs):
+        view = cast(GenericAPIView, self)
+        validators = self.get_list_validators(view.filter_queryset(view.get_queryset()))
+        not_modified = self.evaluate_preconditions(validators)
+        if not_modified is not None:
+            return not_modified
+        return self.set_validators(super().list(request, *args, **kwargs), validators)
+
+
+class ConditionalUpdateModelMixin(ConditionalRequestMixin, UpdateModelMixin):
+    """
+    Rejects the updates of the objects modified since the `If-Match` ETag
+    (or the `If-Unmodified-Since` time) with 412 responses, so that the concurrent
+    updates are not lost. The row is locked while the preconditions are evaluated
+    and the update is written, so the updates sent with the same ETag cannot both
+    pass. Expects the view to memoize the object (`MemoizedObjectMixin`),
+    so that the validators of the response reflect the update.
+    """
+
+    def lock_object(self, obj: Model) -> None:
+        """
+        Lock the row of the object until the end of the transaction,
+        reloading the object when it has been modified since it was fetched.
+
+        :param obj: the object to be updated
+        """
+        modified = (
+            type(obj)
+            ._default_manager.select_for_update()
+            .filter(pk=obj.pk)
+            .values_list("modified", flat=True)
+            .first()
+        )
+        if modified is None:
+            raise Http404
+        if modified != getattr(obj, "modified", None):
+            obj.refresh_from_db()
+
+    def update(self, request, *args, **kwargs):
+        with transaction.atomic():
+            obj = self.get_object()
+            self.lock_object(obj)
+            self.evaluate_preconditions(self.get_object_validators(obj))
+            response = super().update(request, *args, **kwargs)
+        return self.set_validators(
+            response, self.get_object_validators(self.get_object())
+        )